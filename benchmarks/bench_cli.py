@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Startup and command-latency benchmarks for the Ulkan CLI.
+
+Each benchmark runs a real `ulkan` command in a generated fixture project
+(see fixtures.py) and records:
+
+  * wall_ms   - median wall-clock time of the command
+  * import_ms - total self import time reported by `-X importtime`
+  * rss_kb    - peak resident set size of the child process
+
+Results are compared against a stored baseline and the run fails when any
+metric regresses beyond the threshold.
+
+Usage:
+    python benchmarks/bench_cli.py                    # run + compare to baseline
+    python benchmarks/bench_cli.py --save-baseline    # record a new baseline
+    python benchmarks/bench_cli.py --only sync --runs 10
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fixtures import FIXTURES
+from import_budget import parse_importtime, total_import_ms
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+# Benchmarks whose argv starts with LINT run the project's lint script
+# instead of the ulkan CLI
+LINT = ".agent/tools/scripts/lint_agent_setup.py"
+
+# name -> (argv, fixture, fresh): `fresh` commands mutate the project, so they
+# get a new copy of the fixture before every run (copying is not timed).
+BENCHMARKS = {
+    "--version": (["--version"], "empty", False),
+    "init -y": (["init", "-y", "."], "empty", True),
+    "sync": (["sync"], "initialized", False),
+    "sync --check": (["sync", "--check"], "initialized", False),
+    "list all": (["list", "all"], "empty", False),
+    "add workflow": (["add", "workflow", "git-flow"], "initialized", True),
+    "migrate --dry-run": (["migrate", "--dry-run"], "migratable", False),
+    "remove --self --dry-run": (["remove", "--self", "--dry-run"], "adapted", False),
+    "sync (large)": (["sync"], "large", True),
+    "sync --check (large)": (["sync", "--check"], "large", False),
+    "lint (large)": ([LINT], "large", False),
+    "migrate --dry-run (large)": (["migrate", "--dry-run"], "large-migratable", False),
+    "sync -r --check (monorepo)": (["sync", "-r", "--check"], "monorepo", False),
+}
+
+# Exit codes accepted besides 0 (the lint script reports the corpus's
+# intentionally incomplete frontmatter with exit code 1)
+EXPECTED_EXIT_CODES = {"lint (large)": {1}}
+
+METRICS = ["wall_ms", "import_ms", "rss_kb"]
+
+# Differences below these absolute amounts are treated as noise.
+NOISE_FLOOR = {"wall_ms": 20.0, "import_ms": 15.0, "rss_kb": 2048}
+
+
+def bench_env() -> dict:
+    """Environment for benchmarked commands (plain, non-interactive output)."""
+    env = dict(os.environ)
+    env["NO_COLOR"] = "1"
+    env["TERM"] = "dumb"
+    env["ULKAN_UPDATE_CHECK"] = "0"
+    return env
+
+
+def command(args: list[str], *python_flags: str) -> list[str]:
+    """Full argv for a benchmark: `ulkan <args>` or a project script."""
+    if args and args[0] == LINT:
+        return [sys.executable, *python_flags, *args]
+    return [sys.executable, *python_flags, "-m", "ulkan.main", *args]
+
+
+def run_once(
+    args: list[str], cwd: Path, env: dict, ok_codes: set[int] = frozenset()
+) -> tuple[float, int]:
+    """Runs `ulkan <args>` once.
+
+    Returns:
+        (wall_ms, peak_rss_kb) tuple.
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        command(args),
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    _, status, rusage = os.wait4(proc.pid, 0)
+    wall_ms = (time.perf_counter() - start) * 1000
+    proc.returncode = os.waitstatus_to_exitcode(status)
+
+    if proc.returncode != 0 and proc.returncode not in ok_codes:
+        raise RuntimeError(f"ulkan {' '.join(args)} exited with {proc.returncode}")
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    rss = rusage.ru_maxrss
+    if sys.platform == "darwin":
+        rss //= 1024
+    return wall_ms, rss
+
+
+def import_time_once(args: list[str], cwd: Path, env: dict) -> float:
+    """Runs `ulkan <args>` under -X importtime and returns total import ms."""
+    result = subprocess.run(
+        command(args, "-X", "importtime"),
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+    return total_import_ms(parse_importtime(result.stderr))
+
+
+def run_benchmark(name: str, workdir: Path, runs: int, env: dict) -> dict:
+    """Runs one benchmark `runs` times and returns its median metrics."""
+    args, fixture, fresh = BENCHMARKS[name]
+    template = FIXTURES[fixture](workdir / "template", env)
+
+    walls, imports, rss = [], [], []
+    # One untimed warm-up run populates bytecode and filesystem caches
+    for i in range(runs + 1):
+        cwd = template
+        if fresh:
+            cwd = workdir / f"run-{i}"
+            shutil.copytree(template, cwd, symlinks=True)
+
+        wall_ms, rss_kb = run_once(args, cwd, env, EXPECTED_EXIT_CODES.get(name, set()))
+
+        if fresh:
+            shutil.rmtree(cwd)
+            shutil.copytree(template, cwd, symlinks=True)
+        import_ms = import_time_once(args, cwd, env)
+        if fresh:
+            shutil.rmtree(cwd)
+
+        if i == 0:
+            continue
+        walls.append(wall_ms)
+        imports.append(import_ms)
+        rss.append(rss_kb)
+
+    return {
+        "wall_ms": round(statistics.median(walls), 2),
+        "import_ms": round(statistics.median(imports), 2),
+        "rss_kb": int(statistics.median(rss)),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Returns a list of human readable regressions."""
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric in METRICS:
+            old, new = base.get(metric), metrics[metric]
+            if not old:
+                continue
+            if new > old * (1 + threshold) and new - old > NOISE_FLOOR[metric]:
+                regressions.append(
+                    f"{name}: {metric} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def print_table(results: dict, baseline: dict) -> None:
+    print(
+        f"{'command':<26}{'wall ms':>10}{'import ms':>11}{'rss kb':>10}   vs baseline"
+    )
+    for name, m in results.items():
+        base = baseline.get(name)
+        delta = ""
+        if base and base.get("wall_ms"):
+            delta = f"{(m['wall_ms'] / base['wall_ms'] - 1) * 100:+.0f}% wall"
+        print(
+            f"{name:<26}{m['wall_ms']:>10.1f}{m['import_ms']:>11.1f}"
+            f"{m['rss_kb']:>10}   {delta}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per command.")
+    parser.add_argument(
+        "--only", action="append", choices=list(BENCHMARKS), help="Run a subset."
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store results as baseline."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed relative regression before failing (default 0.25 = 25%%).",
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to this file.")
+    opts = parser.parse_args()
+
+    env = bench_env()
+    names = opts.only or list(BENCHMARKS)
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="ulkan-bench-") as tmp:
+        for name in names:
+            workdir = Path(tmp) / name.replace(" ", "_").replace("-", "")
+            workdir.mkdir()
+            results[name] = run_benchmark(name, workdir, opts.runs, env)
+
+    stored = {}
+    if opts.baseline.exists():
+        stored = json.loads(opts.baseline.read_text())
+    baseline = stored.get("results", {})
+
+    print_table(results, baseline)
+
+    if opts.json:
+        opts.json.write_text(json.dumps(results, indent=2) + "\n")
+
+    if opts.save_baseline:
+        stored = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": {**baseline, **results},
+        }
+        opts.baseline.write_text(json.dumps(stored, indent=2) + "\n")
+        print(f"\nBaseline saved to {opts.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\nNo baseline at {opts.baseline}; run with --save-baseline first.")
+        return 0
+
+    regressions = compare(results, baseline, opts.threshold)
+    if regressions:
+        print()
+        for regression in regressions:
+            print(f"✖ {regression}")
+        return 1
+
+    print(f"\n✔ No regressions beyond {opts.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
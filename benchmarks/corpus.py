@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Synthetic `.agent/` corpus generator for scale testing.
+
+Generates realistic project trees with a configurable number of skills (with
+asset files), rules, workflows and tool scripts. Frontmatter comes in the
+variants real projects contain (folded and literal descriptions, quoted
+triggers, nested metadata, missing fields, no frontmatter at all) and file
+sizes follow a log-normal distribution with occasional multi-megabyte
+reference files. Optionally emits a matching AGENTS.md, legacy `.claude/` /
+`.gemini/` folders for `ulkan migrate`, and several packages for
+`ulkan sync --recursive`.
+
+Output is deterministic for a given seed.
+
+Usage:
+    python benchmarks/corpus.py /tmp/corpus --skills 500 --tools 300
+    python benchmarks/corpus.py /tmp/mono --projects 20 --skills 50
+    python benchmarks/corpus.py /tmp/legacy --migration --no-sync
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+from pathlib import Path
+
+from fixtures import AGENTS_MD, CLAUDE_MD, run_ulkan
+
+LINT_SCRIPT = (
+    Path(__file__).parent.parent
+    / "src/ulkan/blueprints/tools/scripts/lint_agent_setup.py"
+)
+
+# Default sizes of a "production scale" project
+DEFAULTS = {
+    "skills": 200,
+    "rules": 60,
+    "workflows": 60,
+    "tools": 150,
+    "assets_per_skill": 3,
+}
+
+# Body size distribution (bytes): log-normal around ~4 KiB, capped
+BODY_MU = 8.3
+BODY_SIGMA = 1.0
+BODY_MAX = 256 * 1024
+LARGE_ASSET_SIZE = 3 * 1024 * 1024
+LARGE_ASSET_RATIO = 0.02  # share of skills embedding multi-MB references
+
+WORDS = (
+    "agent skill workflow rule tool project context review deploy test build "
+    "release document spec api schema database cache queue service client "
+    "server config pipeline migration lint format check validate generate "
+    "update sync monitor trace metric alert incident security audit"
+).split()
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def _body(rng: random.Random, size: int) -> str:
+    """Markdown body of roughly `size` bytes (headings, lists, code blocks)."""
+    parts = []
+    total = 0
+    while total < size:
+        kind = rng.random()
+        if kind < 0.15:
+            chunk = f"## {_words(rng, 3).title()}\n\n"
+        elif kind < 0.3:
+            chunk = "".join(f"- {_words(rng, 8)}\n" for _ in range(4)) + "\n"
+        elif kind < 0.4:
+            # Code blocks with YAML-looking lines must never be parsed
+            chunk = (
+                f"```yaml\nname: not-{rng.randrange(999)}\ndescription: code\n```\n\n"
+            )
+        else:
+            chunk = _words(rng, 40).capitalize() + ".\n\n"
+        parts.append(chunk)
+        total += len(chunk)
+    return "".join(parts)
+
+
+def _body_size(rng: random.Random, scale: float) -> int:
+    return int(min(rng.lognormvariate(BODY_MU, BODY_SIGMA), BODY_MAX) * scale)
+
+
+def _frontmatter(rng: random.Random, name: str, fields: list[str]) -> str:
+    """Frontmatter in one of the variants found in real assets."""
+    variant = rng.random()
+    if variant < 0.05:
+        return ""  # No frontmatter at all
+
+    description = _words(rng, rng.randint(6, 40)).capitalize() + "."
+    trigger = _words(rng, rng.randint(1, 4)).capitalize()
+    lines = ["---"]
+    for field in fields:
+        if rng.random() < 0.08:
+            continue  # Missing field
+        if field == "name":
+            lines.append(f"name: {name}")
+        elif field == "description":
+            style = rng.random()
+            if style < 0.4:
+                lines.append("description: >")
+                lines += [f"  {chunk}" for chunk in _wrap(description)]
+            elif style < 0.5:
+                lines.append("description: |")
+                lines += [f"  {chunk}" for chunk in _wrap(description)]
+            elif style < 0.7:
+                lines.append(f'description: "{description}"')
+            else:
+                lines.append(f"description: {description}")
+        elif field == "trigger":
+            quote = rng.choice(['"', "'", ""])
+            lines.append(f"trigger: {quote}{trigger}{quote}")
+        elif field == "scope":
+            lines.append(f"scope: [{rng.choice(['root', 'docs', 'src'])}]")
+    if rng.random() < 0.3:
+        lines += [
+            "metadata:",
+            "  author: bench",
+            f'  version: "{rng.randint(1, 3)}.0"',
+            "  # nested comment",
+            f"  name: nested-{name}",
+        ]
+    lines.append("---")
+    return "\n".join(lines) + "\n"
+
+
+def _wrap(text: str, width: int = 60) -> list[str]:
+    lines, current = [], ""
+    for word in text.split():
+        if current and len(current) + len(word) > width:
+            lines.append(current)
+            current = word
+        else:
+            current = f"{current} {word}".strip()
+    return lines + [current] if current else lines
+
+
+def _python_tool(rng: random.Random, name: str, size: int) -> str:
+    header = ""
+    if rng.random() < 0.3:
+        header = "#!/usr/bin/env python3\n" + "".join(
+            f"# Copyright {2020 + i} Bench Corp. {_words(rng, 6)}\n"
+            for i in range(rng.randint(5, 40))
+        )
+    doc = ""
+    if rng.random() < 0.85:
+        doc = f'"""\n{_words(rng, rng.randint(4, 30)).capitalize()}.\n"""\n'
+    code = f'\nVALUE = """not the docstring of {name}"""\n'
+    filler = "".join(
+        f"\ndef step_{i}():\n    return {i}\n" for i in range(max(1, size // 40))
+    )
+    return header + doc + code + filler
+
+
+def _shell_tool(rng: random.Random, name: str, size: int) -> str:
+    lines = ["#!/usr/bin/env bash", "# shellcheck disable=SC2086"]
+    if rng.random() < 0.3:
+        lines += ["# Copyright 2024 Bench Corp.", "# SPDX-License-Identifier: MIT", "#"]
+    if rng.random() < 0.85:
+        lines += [f"# {chunk}" for chunk in _wrap(_words(rng, 20).capitalize())]
+    lines += ["set -euo pipefail"] + [f"echo {name} {i}" for i in range(size // 20)]
+    return "\n".join(lines) + "\n"
+
+
+def generate_agent_dir(
+    agent_dir: Path,
+    skills: int = DEFAULTS["skills"],
+    rules: int = DEFAULTS["rules"],
+    workflows: int = DEFAULTS["workflows"],
+    tools: int = DEFAULTS["tools"],
+    assets_per_skill: int = DEFAULTS["assets_per_skill"],
+    size_scale: float = 1.0,
+    large_assets: bool = True,
+    seed: int = 0,
+) -> dict:
+    """Writes a synthetic `.agent/` tree.
+
+    Returns:
+        Stats dict: {"files": int, "bytes": int}
+    """
+    rng = random.Random(seed)
+    stats = {"files": 0, "bytes": 0}
+
+    def write(path: Path, content: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = content.encode()
+        path.write_bytes(data)
+        stats["files"] += 1
+        stats["bytes"] += len(data)
+
+    for i in range(skills):
+        name = f"skill-{i:04d}"
+        skill_dir = agent_dir / "skills" / name
+        size = _body_size(rng, size_scale)
+        write(
+            skill_dir / "SKILL.md",
+            _frontmatter(rng, name, ["name", "description", "trigger"])
+            + _body(rng, size),
+        )
+        for j in range(assets_per_skill):
+            write(skill_dir / "assets" / f"template-{j}.md", _body(rng, size // 2))
+        if large_assets and rng.random() < LARGE_ASSET_RATIO:
+            write(
+                skill_dir / "references" / "reference.md",
+                _body(rng, int(LARGE_ASSET_SIZE * size_scale)),
+            )
+
+    for i in range(rules):
+        name = f"rule-{i:04d}"
+        write(
+            agent_dir / "rules" / f"{name}.md",
+            _frontmatter(rng, name, ["name", "trigger", "scope", "description"])
+            + _body(rng, _body_size(rng, size_scale) // 4),
+        )
+
+    for i in range(workflows):
+        name = f"workflow-{i:04d}"
+        write(
+            agent_dir / "workflows" / f"{name}.md",
+            _frontmatter(rng, name, ["description", "trigger"])
+            + _body(rng, _body_size(rng, size_scale) // 2),
+        )
+
+    scripts = agent_dir / "tools" / "scripts"
+    for i in range(tools):
+        size = _body_size(rng, size_scale) // 4
+        if rng.random() < 0.7:
+            write(scripts / f"tool_{i:04d}.py", _python_tool(rng, f"tool_{i}", size))
+        else:
+            write(scripts / f"tool-{i:04d}.sh", _shell_tool(rng, f"tool_{i}", size))
+    write(scripts / "README.md", "# Scripts\n\nNot a tool.\n")
+    if LINT_SCRIPT.exists():
+        scripts.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(LINT_SCRIPT, scripts / LINT_SCRIPT.name)
+
+    for folder in ["docs", "rules", "workflows", "skills", "tools"]:
+        (agent_dir / folder).mkdir(parents=True, exist_ok=True)
+    return stats
+
+
+def generate_legacy_configs(root: Path, seed: int = 0, commands: int = 25) -> None:
+    """Writes pre-existing `.claude/` and `.gemini/` folders plus CLAUDE.md
+    and GEMINI.md, as found in projects before `ulkan migrate`."""
+    rng = random.Random(seed + 1)
+    for folder in [".claude", ".gemini"]:
+        commands_dir = root / folder / "commands"
+        commands_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(commands):
+            (commands_dir / f"command-{i:03d}.md").write_text(
+                f"# Command {i}\n\n{_body(rng, rng.randint(200, 4000))}"
+            )
+        skill_dir = root / folder / "skills" / f"legacy-skill-{folder[1:]}"
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        (skill_dir / "SKILL.md").write_text(
+            _frontmatter(rng, skill_dir.name, ["name", "description", "trigger"])
+            + _body(rng, 2000)
+        )
+    (root / ".claude" / "settings.json").write_text(
+        json.dumps({"permissions": {"allow": ["Read", "Edit"]}}) + "\n"
+    )
+    (root / "CLAUDE.md").write_text(CLAUDE_MD + "\n" + _body(rng, 20_000))
+    (root / "GEMINI.md").write_text("# GEMINI.md\n\n" + _body(rng, 8_000))
+
+
+def generate_project(
+    root: Path,
+    migration: bool = False,
+    sync: bool = True,
+    env: dict | None = None,
+    **options,
+) -> dict:
+    """Generates one project: `.agent/`, AGENTS.md and optionally legacy
+    configs. With sync=True the AGENTS.md tables are filled by `ulkan sync`.
+
+    Keyword options are passed to generate_agent_dir.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    stats = generate_agent_dir(root / ".agent", **options)
+    (root / "AGENTS.md").write_text(AGENTS_MD)
+    if migration:
+        generate_legacy_configs(root, seed=options.get("seed", 0))
+    if sync:
+        run_ulkan(["sync"], root, env)
+    return stats
+
+
+def generate_corpus(
+    root: Path, projects: int = 1, env: dict | None = None, **options
+) -> dict:
+    """Generates a single project at root, or a monorepo with `projects`
+    packages under root/packages (each with a different seed).
+
+    Returns:
+        Aggregate stats: {"projects": int, "files": int, "bytes": int}
+    """
+    totals = {"projects": projects, "files": 0, "bytes": 0}
+    if projects == 1:
+        roots = [root]
+    else:
+        root.mkdir(parents=True, exist_ok=True)
+        roots = [root / "packages" / f"pkg-{i:03d}" for i in range(projects)]
+
+    seed = options.pop("seed", 0)
+    for i, project in enumerate(roots):
+        stats = generate_project(project, env=env, seed=seed + i, **options)
+        totals["files"] += stats["files"]
+        totals["bytes"] += stats["bytes"]
+    return totals
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("root", type=Path, help="Directory to generate into.")
+    for key, value in DEFAULTS.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, default=value)
+    parser.add_argument(
+        "--size-scale", type=float, default=1.0, help="Multiplier for file sizes."
+    )
+    parser.add_argument(
+        "--no-large-assets",
+        dest="large_assets",
+        action="store_false",
+        help="Skip multi-MB skill reference files.",
+    )
+    parser.add_argument("--projects", type=int, default=1, help="Monorepo packages.")
+    parser.add_argument(
+        "--migration", action="store_true", help="Add .claude/.gemini legacy configs."
+    )
+    parser.add_argument(
+        "--no-sync",
+        dest="sync",
+        action="store_false",
+        help="Leave AGENTS.md tables empty.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--force", action="store_true", help="Replace root.")
+    opts = parser.parse_args()
+
+    if opts.root.exists() and any(opts.root.iterdir()):
+        if not opts.force:
+            print(f"{opts.root} is not empty (use --force to replace it).")
+            return 1
+        shutil.rmtree(opts.root)
+
+    options = vars(opts)
+    root = options.pop("root")
+    options.pop("force")
+    totals = generate_corpus(root, **options)
+    print(
+        f"Generated {totals['projects']} project(s), {totals['files']} files, "
+        f"{totals['bytes'] / 1024 / 1024:.1f} MiB in {root}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Fixture projects for the Ulkan benchmark suite.
+
+Every fixture is a function `make_<name>(root)` that turns an empty directory
+into the project state a benchmarked command expects. Fixtures shell out to the
+real CLI where possible so they exercise the same code paths users hit.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+AGENTS_MD = """# AGENTS.md
+
+> Single entry point for AI agents working on this project.
+
+## 🧭 Project Context
+
+Benchmark fixture project.
+
+## 🧰 Registry
+
+### 🧠 Core Skills
+
+| Skill | Trigger | Description |
+| :--- | :--- | :--- |
+
+### 🛡️ Active Rules
+
+| Rule | Trigger | Description |
+| :--- | :--- | :--- |
+
+### 🔄 Standard Workflows
+
+| Workflow | Trigger | Description |
+| :--- | :--- | :--- |
+
+### 🛠️ Standard Tools
+
+| Tool | Type | Description |
+| :--- | :--- | :--- |
+
+## 📝 Notes
+
+Keep this file in sync with `ulkan sync`.
+"""
+
+CLAUDE_MD = """# CLAUDE.md
+
+Legacy Claude instructions that `ulkan migrate` should fold into AGENTS.md.
+"""
+
+
+def run_ulkan(args: list[str], cwd: Path, env: dict | None = None) -> None:
+    """Runs the ulkan CLI in `cwd`, raising if it fails."""
+    subprocess.run(
+        [sys.executable, "-m", "ulkan.main", *args],
+        cwd=cwd,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+
+def make_empty(root: Path, env: dict | None = None) -> Path:
+    """An empty directory (for `--version` and `init -y`)."""
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def make_initialized(root: Path, env: dict | None = None) -> Path:
+    """A freshly initialized and synced Ulkan project."""
+    make_empty(root)
+    (root / "AGENTS.md").write_text(AGENTS_MD)
+    run_ulkan(["init", "-y", "."], root, env)
+    run_ulkan(["sync"], root, env)
+    return root
+
+
+def make_migratable(root: Path, env: dict | None = None) -> Path:
+    """An initialized project with legacy `.claude/` and `CLAUDE.md` configs."""
+    make_initialized(root, env)
+    claude_dir = root / ".claude"
+    (claude_dir / "commands").mkdir(parents=True)
+    (claude_dir / "settings.json").write_text('{"permissions": {}}\n')
+    for i in range(10):
+        (claude_dir / "commands" / f"command-{i}.md").write_text(
+            f"# Command {i}\n\nDo thing number {i}.\n"
+        )
+    (root / "CLAUDE.md").write_text(CLAUDE_MD)
+    return root
+
+
+def make_adapted(root: Path, env: dict | None = None) -> Path:
+    """An initialized project adapted for Claude and Gemini (symlinks)."""
+    make_initialized(root, env)
+    run_ulkan(["adapt", "--claude", "--gemini"], root, env)
+    return root
+
+
+def make_large(root: Path, env: dict | None = None) -> Path:
+    """A synced production-scale project generated by corpus.py."""
+    from corpus import generate_corpus
+
+    generate_corpus(root, env=env)
+    return root
+
+
+def make_large_migratable(root: Path, env: dict | None = None) -> Path:
+    """A production-scale project with legacy `.claude/` and `.gemini/` configs."""
+    from corpus import generate_corpus
+
+    generate_corpus(root, env=env, migration=True)
+    return root
+
+
+def make_monorepo(root: Path, env: dict | None = None) -> Path:
+    """A monorepo of 20 synced packages (for `sync --recursive`)."""
+    from corpus import generate_corpus
+
+    generate_corpus(root, env=env, projects=20, skills=40, rules=10, tools=30)
+    return root
+
+
+FIXTURES = {
+    "empty": make_empty,
+    "initialized": make_initialized,
+    "migratable": make_migratable,
+    "adapted": make_adapted,
+    "large": make_large,
+    "large-migratable": make_large_migratable,
+    "monorepo": make_monorepo,
+}
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Import-time budget for Ulkan's hot commands.
+
+`ulkan` runs from pre-commit hooks and CI many times a day, so the commands
+used there must not drag in the whole dependency graph. For every hot command
+this script runs `python -X importtime -m ulkan.main ...` in a scratch project
+and fails if:
+
+  * a module on the forbidden list gets imported, or
+  * the total import time exceeds the command's budget.
+
+Usage:
+    python benchmarks/import_budget.py            # check all hot commands
+    python benchmarks/import_budget.py --verbose  # also print the slowest imports
+
+Budgets can be scaled for slow runners with ULKAN_IMPORT_BUDGET_SCALE=2.0.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Modules only needed by interactive / network / scaffolding commands.
+FORBIDDEN = [
+    "InquirerPy",
+    "prompt_toolkit",
+    "rich.progress",
+    "rich.prompt",
+    "httpx",
+    "ulkan.agents",
+    "ulkan.builder",
+    "ulkan.generator",
+    "ulkan.migrator",
+]
+
+# Hot command -> (argv, budget in milliseconds of total import time)
+HOT_COMMANDS = {
+    "--version": (["--version"], 200),
+    "sync --check": (["sync", "--check"], 200),
+    "list all": (["list", "all"], 200),
+}
+
+MINIMAL_AGENTS_MD = """# AGENTS.md
+
+### 🧠 Core Skills
+
+| Skill | Trigger | Description |
+| :--- | :--- | :--- |
+
+### 🛡️ Active Rules
+
+| Rule | Trigger | Description |
+| :--- | :--- | :--- |
+"""
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Parses `-X importtime` output.
+
+    Returns:
+        Dict of module -> (self_us, cumulative_us).
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules
+
+
+def total_import_ms(modules: dict[str, tuple[int, int]]) -> float:
+    """Sum of self import times, in milliseconds."""
+    return sum(self_us for self_us, _ in modules.values()) / 1000
+
+
+def run_importtime(args: list[str], cwd: Path) -> dict[str, tuple[int, int]]:
+    """Runs `ulkan <args>` under -X importtime and returns the parsed modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "ulkan.main", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    modules = parse_importtime(result.stderr)
+    if result.returncode != 0 or "ulkan.commands" not in modules:
+        raise RuntimeError(
+            f"ulkan {' '.join(args)} failed (exit {result.returncode}):\n"
+            f"{result.stdout}{result.stderr[-2000:]}"
+        )
+    return modules
+
+
+def make_project(root: Path) -> Path:
+    """Creates a minimal synced project for `sync --check`."""
+    (root / ".agent" / "skills").mkdir(parents=True)
+    (root / "AGENTS.md").write_text(MINIMAL_AGENTS_MD)
+    return root
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--verbose", action="store_true")
+    opts = parser.parse_args()
+
+    scale = float(os.environ.get("ULKAN_IMPORT_BUDGET_SCALE", "1.0"))
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = make_project(Path(tmp))
+
+        for label, (args, budget_ms) in HOT_COMMANDS.items():
+            # Warm up bytecode caches so we measure imports, not compilation
+            run_importtime(args, project)
+            modules = run_importtime(args, project)
+
+            total = total_import_ms(modules)
+            budget = budget_ms * scale
+            leaked = [m for m in FORBIDDEN if m in modules]
+
+            status = "ok"
+            if leaked:
+                status = "FAIL"
+                failures.append(f"{label}: imports {', '.join(leaked)}")
+            if total > budget:
+                status = "FAIL"
+                failures.append(f"{label}: {total:.1f}ms > budget {budget:.0f}ms")
+
+            print(f"{status:>4}  ulkan {label:<14} {total:7.1f}ms / {budget:.0f}ms")
+
+            if opts.verbose:
+                slowest = sorted(modules.items(), key=lambda kv: -kv[1][0])[:10]
+                for name, (self_us, _) in slowest:
+                    print(f"        {self_us / 1000:7.1f}ms  {name}")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"✖ {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
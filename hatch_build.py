@@ -0,0 +1,27 @@
+"""Hatch build hook: generates the blueprint manifest shipped inside the wheel."""
+
+import sys
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class BlueprintManifestHook(BuildHookInterface):
+    """Writes src/ulkan/blueprints/manifest.json and force-includes it."""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict) -> None:
+        # ulkan.manifest only uses the standard library, so importing it from
+        # the source tree works without Ulkan's runtime dependencies.
+        sys.path.insert(0, str(Path(self.root) / "src"))
+        try:
+            from ulkan.manifest import write_manifest
+
+            manifest_path = write_manifest()
+        finally:
+            sys.path.pop(0)
+
+        build_data["force_include"][
+            str(manifest_path)
+        ] = "ulkan/blueprints/manifest.json"
@@ -4,6 +4,7 @@ import shutil
 import subprocess
 from pathlib import Path
 
+from .document import changed_sections
 from .styles import console, print_error, print_step, print_success
 
 # Agent to CLI mapping
@@ -183,6 +184,9 @@ def run_build(
     print_step(f"Running {agent} CLI to analyze project...")
     cmd = AGENT_CLI_MAP[agent]["build_cmd"](prompt)
 
+    agents_md = target_path / "AGENTS.md"
+    before = agents_md.read_text() if agents_md.exists() else ""
+
     try:
         subprocess.run(
             cmd,
@@ -191,6 +195,10 @@ def run_build(
             text=True,
         )
         print_success("Build complete!")
+        after = agents_md.read_text() if agents_md.exists() else ""
+        updated = changed_sections(before, after)
+        if updated:
+            console.print(f"[info]Updated sections: {', '.join(updated)}[/info]")
         return True
     except subprocess.CalledProcessError as e:
         print_error(f"Build failed: {e}")
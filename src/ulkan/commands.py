@@ -1,22 +1,11 @@
 import time
+from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
+from typing import List
 
 import typer
-from InquirerPy import inquirer
-from InquirerPy.utils import get_style
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm
-
-from .agents import (
-    AGENT_REMOVE_MAP,
-    setup_claude,
-    setup_codex,
-    setup_copilot,
-    setup_gemini,
-    setup_opencode,
-)
-from .builder import is_cli_available, run_build
-from .generator import generate_project
+
 from .styles import (
     console,
     print_banner,
@@ -27,28 +16,82 @@ from .styles import (
 )
 from . import __version__
 
-# Ulkan color palette for InquirerPy (uses prompt_toolkit syntax)
-ULKAN_STYLE = get_style(
-    {
-        "questionmark": "#87d7ff bold",  # Sky Blue
-        "answermark": "#00ffaf",  # Spring Green
-        "answer": "#00ffaf",  # Spring Green
-        "input": "#eeeeee",  # Mist
-        "question": "#eeeeee",  # Mist
-        "answered_question": "#eeeeee",  # Mist
-        "instruction": "#5f5fff",  # Spiritual Blue
-        "pointer": "#87d7ff bold",  # Sky Blue (cursor)
-        "checkbox": "#00ffaf",  # Spring Green (selected marker)
-        "separator": "#5f5fff",  # Spiritual Blue
-        "validator": "#ff5f5f",  # Soft Red (errors)
-        "marker": "#00ffaf",  # Spring Green
-    },
-    style_override=False,
-)
+# NOTE: Keep module-level imports light. Every command imports its own
+# implementation module (and heavy deps such as InquirerPy, rich.progress or
+# httpx) inside the function body, so `ulkan --version`, `ulkan sync --check`
+# or `ulkan list` only pay for what they actually dispatch to.
+# See benchmarks/import_budget.py for the enforced budget.
+
+
+@contextmanager
+def _phase(timings: dict[str, float], name: str):
+    """Records the wall time of a block into timings[name] (milliseconds)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = (time.perf_counter() - start) * 1000
+
+
+def _print_timings(timings: dict[str, float], details: dict[str, str]) -> None:
+    """Prints a per-phase timing breakdown (for --timings)."""
+    console.print("[title]Timings:[/title]")
+    for name, elapsed in timings.items():
+        detail = f"  [dim]{details[name]}[/dim]" if name in details else ""
+        console.print(f"  {name:<16}{elapsed:>9.1f} ms{detail}", highlight=False)
+    console.print(f"  {'total':<16}{sum(timings.values()):>9.1f} ms", highlight=False)
+    console.print()
+
+
+@cache
+def _ulkan_style():
+    """Ulkan color palette for InquirerPy (uses prompt_toolkit syntax)."""
+    from InquirerPy.utils import get_style
+
+    return get_style(
+        {
+            "questionmark": "#87d7ff bold",  # Sky Blue
+            "answermark": "#00ffaf",  # Spring Green
+            "answer": "#00ffaf",  # Spring Green
+            "input": "#eeeeee",  # Mist
+            "question": "#eeeeee",  # Mist
+            "answered_question": "#eeeeee",  # Mist
+            "instruction": "#5f5fff",  # Spiritual Blue
+            "pointer": "#87d7ff bold",  # Sky Blue (cursor)
+            "checkbox": "#00ffaf",  # Spring Green (selected marker)
+            "separator": "#5f5fff",  # Spiritual Blue
+            "validator": "#ff5f5f",  # Soft Red (errors)
+            "marker": "#00ffaf",  # Spring Green
+        },
+        style_override=False,
+    )
+
+
+def _spinner():
+    """Returns a transient spinner progress bar bound to the Ulkan console."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    )
+
+
+def _confirm(question: str, default: bool, **kwargs) -> bool:
+    """Asks a yes/no question (lazy wrapper around rich.prompt.Confirm)."""
+    from rich.prompt import Confirm
+
+    return Confirm.ask(question, default=default, **kwargs)
 
 
 def _prompt_for_agents() -> list[str]:
     """Prompts user to select agents with checkboxes."""
+    from InquirerPy import inquirer
+
+    from .builder import is_cli_available
+
     agent_choices = [
         {
             "name": "Claude Code",
@@ -80,7 +123,7 @@ def _prompt_for_agents() -> list[str]:
         message="Select AI agents to adapt for:",
         choices=agent_choices,
         instruction="(↑↓ move, Space select, Enter confirm)",
-        style=ULKAN_STYLE,
+        style=_ulkan_style(),
     ).execute()
 
     # Show formatted selection summary
@@ -108,8 +151,6 @@ app = typer.Typer(
 
 def version_callback(value: bool):
     if value:
-        from . import __version__
-
         console.print(f"{__version__}", highlight=False)
         raise typer.Exit()
 
@@ -140,15 +181,39 @@ def init(
     gitignore: bool = typer.Option(
         False, "--gitignore", help="Add .agent and AGENTS.md to .gitignore"
     ),
+    show_timings: bool = typer.Option(
+        False, "--timings", help="Print a per-phase timing breakdown."
+    ),
+    link_mode: str = typer.Option(
+        None,
+        "--link-mode",
+        help="How files come from the shared asset store: auto, reflink, hardlink or copy. Saved in .agent/ulkan.toml.",
+    ),
 ) -> None:
     """
     Scaffolds a new agentic project structure.
     """
-    from . import __version__
-    from .updater import check_for_update
+    from .agents import (
+        setup_claude,
+        setup_codex,
+        setup_copilot,
+        setup_gemini,
+        setup_opencode,
+    )
+    from .builder import is_cli_available
+    from .generator import generate_project
+    from .updater import check_for_update_cached
+
+    from .store import LINK_MODES
 
-    # Check for updates (non-blocking, fails silently)
-    has_update, new_version = check_for_update(__version__)
+    if link_mode and link_mode not in LINK_MODES:
+        print_error(
+            f"Invalid link mode: {link_mode}. Valid options: {', '.join(LINK_MODES)}"
+        )
+        raise typer.Exit(code=1)
+
+    # Check for updates from the disk cache (refreshed in the background)
+    has_update, new_version = check_for_update_cached(__version__)
 
     print_banner(version=__version__, new_version=new_version if has_update else None)
 
@@ -161,7 +226,7 @@ def init(
 
     console.print(f"[title]Target Directory:[/title] [info]{target_path}[/info]")
 
-    if not force and not Confirm.ask(
+    if not force and not _confirm(
         "Do you want to proceed with initialization?", default=True, console=console
     ):
         console.print("[warning]Aborted.[/warning]")
@@ -175,21 +240,33 @@ def init(
         selected_agents = _prompt_for_agents()
         console.print()
 
+    if link_mode:
+        from .settings import set_project_setting
+
+        set_project_setting(target_path, "link_mode", link_mode)
+        if link_mode == "hardlink":
+            console.print(
+                "[warning]Hardlinked assets are shared with other projects and read-only; "
+                "edits must replace the file, not write to it in place.[/warning]"
+            )
+
     print_step("Initializing project...")
+    timings: dict[str, float] = {}
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
+    with _spinner() as progress:
+        task = progress.add_task(description="Planning files...", total=None)
 
-        task1 = progress.add_task(description="Creating directories...", total=None)
-        time.sleep(0.5)  # Fake delay for dramatic effect
+        def on_progress(done: int, total: int, written: int) -> None:
+            progress.update(
+                task,
+                completed=done,
+                total=total,
+                description=f"Creating files... {done}/{total} ({written / 1024:.1f} KB)",
+            )
 
         try:
-            generate_project(target_path)
-            progress.update(task1, completed=100)
+            with _phase(timings, "generate"):
+                result = generate_project(target_path, on_progress=on_progress)
         except Exception as e:
             print_error(f'Failed to generate project: {e}"')
             raise typer.Exit(code=1) from e
@@ -198,21 +275,23 @@ def init(
     if gitignore:
         from .generator import update_gitignore
 
-        update_gitignore(target_path)
+        with _phase(timings, "gitignore"):
+            update_gitignore(target_path)
 
     # Apply selected adapters
     if selected_agents:
         print_step("Adapting for selected agents...")
-        if "claude" in selected_agents:
-            setup_claude(target_path)
-        if "gemini" in selected_agents:
-            setup_gemini(target_path)
-        if "codex" in selected_agents:
-            setup_codex(target_path)
-        if "copilot" in selected_agents:
-            setup_copilot(target_path)
-        if "opencode" in selected_agents:
-            setup_opencode(target_path)
+        with _phase(timings, "adapt"):
+            if "claude" in selected_agents:
+                setup_claude(target_path)
+            if "gemini" in selected_agents:
+                setup_gemini(target_path)
+            if "codex" in selected_agents:
+                setup_codex(target_path)
+            if "copilot" in selected_agents:
+                setup_copilot(target_path)
+            if "opencode" in selected_agents:
+                setup_opencode(target_path)
 
     print_success("Project initialized successfully! 🚀")
     console.print()
@@ -220,13 +299,15 @@ def init(
     # Initial Sync
     from .syncer import sync_documentation
 
-    sync_documentation(target_path)
+    with _phase(timings, "sync"):
+        sync_documentation(target_path)
     console.print()
 
     # Check for existing agent configs that could be migrated
     from .migrator import detect_sources
 
-    detected = detect_sources(target_path)
+    with _phase(timings, "migrate-detect"):
+        detected = detect_sources(target_path)
     has_existing_configs = detected["folders"] or detected["files"]
 
     console.print("[title]Next Steps:[/title]")
@@ -286,6 +367,15 @@ def init(
         )
     console.print()
 
+    if show_timings:
+        _print_timings(
+            timings,
+            {
+                "generate": f"{len(result['created'])} created, "
+                f"{len(result['skipped'])} skipped, {result['bytes'] / 1024:.1f} KB"
+            },
+        )
+
 
 @app.command()
 def adapt(
@@ -299,6 +389,13 @@ def adapt(
     """
     Adapts the project for specific AI agents (Claude, Gemini, etc.).
     """
+    from .agents import (
+        setup_claude,
+        setup_codex,
+        setup_copilot,
+        setup_gemini,
+        setup_opencode,
+    )
 
     print_header(version=__version__)
     root = Path.cwd()
@@ -384,6 +481,7 @@ def build(
     Detects which agents are adapted (via symlinks) and uses their CLI
     to analyze the project and update AGENTS.md.
     """
+    from .builder import run_build
 
     print_header(version=__version__)
     target_path = path.resolve()
@@ -411,7 +509,7 @@ def build(
         )
         console.print()
 
-        if not Confirm.ask("Proceed with build?", default=True):
+        if not _confirm("Proceed with build?", default=True):
             console.print("[info]Build cancelled.[/info]")
             return
 
@@ -447,7 +545,7 @@ def remove(
     """
     import shutil
 
-    from .agents import AGENT_FILE_MAP
+    from .agents import AGENT_FILE_MAP, AGENT_REMOVE_MAP
     from .builder import get_adapted_agents
 
     print_header(version=__version__)
@@ -460,7 +558,7 @@ def remove(
             "This will [info]convert all symlinks to real files[/info] and remove [warning].agent/[/warning]"
         )
 
-        if not dry_run and not Confirm.ask("Are you sure?", default=False):
+        if not dry_run and not _confirm("Are you sure?", default=False):
             console.print("[info]Aborted.[/info]")
             return
 
@@ -571,7 +669,8 @@ def autoremove(
     """
     Removes symlinks for agents whose CLI is not installed.
     """
-    from .builder import get_adapted_agents
+    from .agents import AGENT_REMOVE_MAP
+    from .builder import get_adapted_agents, is_cli_available
 
     print_header(version=__version__)
     root = Path.cwd()
@@ -666,7 +765,7 @@ def migrate(
             console.print(f"  • {file}")
         console.print()
 
-        if not Confirm.ask("Proceed with migration?", default=True):
+        if not _confirm("Proceed with migration?", default=True):
             console.print("[info]Migration cancelled.[/info]")
             return
 
@@ -758,11 +857,27 @@ def search(
     sort: str = typer.Option(
         None, "--sort", "-s", help="Sort by 'installs' or 'relevance'."
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Bypass the local search cache."
+    ),
+    local: bool = typer.Option(
+        False,
+        "--local",
+        "-l",
+        help="Search offline: blueprints, previously fetched and installed assets.",
+    ),
+    remote: bool = typer.Option(False, "--remote", help="Only query the Skyll API."),
 ) -> None:
     """
-    Searches for assets in the blueprints (Skyll API).
+    Searches for assets in the blueprints, your project and the Skyll API.
+
+    Local results come from an offline index of the bundled blueprints,
+    previously fetched registry skills and the project's .agent/ assets.
+    API results are cached locally (see `search_cache_ttl`); use --refresh
+    to query the API again.
     """
     from .manager import search_assets
+    from .skyll import SkyllError
     from rich.table import Table
 
     print_header(version=__version__)
@@ -771,16 +886,21 @@ def search(
     if sort and sort not in ["installs", "relevance"]:
         print_error("Invalid sort option. Use 'installs' or 'relevance'.")
         raise typer.Exit(1)
+    if local and remote:
+        print_error("--local and --remote cannot be used together.")
+        raise typer.Exit(1)
+    scope = "local" if local else "remote" if remote else "all"
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        task = progress.add_task(description=f"Searching for '{query}'...", total=None)
-        results = search_assets(query, sort_by=sort)
-        progress.update(task, completed=100)
+    try:
+        with _spinner() as progress:
+            task = progress.add_task(
+                description=f"Searching for '{query}'...", total=None
+            )
+            results = search_assets(query, sort_by=sort, refresh=refresh, scope=scope)
+            progress.update(task, completed=100)
+    except SkyllError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
 
     console.print(f"[title]Search Results for '{query}':[/title]")
     console.print()
@@ -790,6 +910,8 @@ def search(
     else:
         table = Table(box=None, header_style="bold #5f5fff")
         table.add_column("Name", style="bold #87d7ff")
+        table.add_column("Type", style="dim")
+        table.add_column("Source", style="dim")
         table.add_column("Installs", justify="right", style="#00ffaf")
         table.add_column("Score", justify="right", style="dim")
         table.add_column("Description")
@@ -797,8 +919,10 @@ def search(
         for res in results:
             table.add_row(
                 res["name"],
+                res["type"],
+                res["source"],
                 str(res["install_count"]),
-                f"{res['score']:.1f}",
+                f"{res['score']:.2f}" if scope == "all" else f"{res['score']:.1f}",
                 res["description"],
             )
 
@@ -811,19 +935,41 @@ def search(
     console.print()
 
 
+def _print_asset_results(results: List[dict]) -> None:
+    """Prints one line per asset of an add_assets() / lock.restore() result."""
+    for result in results:
+        source = f" [dim]({result['source']})[/dim]" if result["source"] else ""
+        if result["ok"]:
+            console.print(
+                f"  [success]✔[/success] {result['name']}{source} [dim]{result['detail']}[/dim]"
+            )
+        else:
+            console.print(
+                f"  [error]✘[/error] {result['name']}{source}: {result['detail']}"
+            )
+
+
 @app.command()
 def add(
     type: str = typer.Argument(
         ..., help="Type of asset to add (skill, workflow, rule, tool)."
     ),
-    name: str = typer.Argument(
-        ..., help="Name of the asset (e.g. feat, scripts/myscript.py)."
+    names: List[str] = typer.Argument(
+        None,
+        help="Name(s) of the asset (e.g. feat, scripts/myscript.py).",
+        show_default=False,
+    ),
+    file: Path = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="Read names from a file (one per line, # starts a comment).",
     ),
 ) -> None:
     """
-    Adds an asset from the registry to your project.
+    Adds one or more assets from the registry to your project.
     """
-    from .manager import add_asset
+    from .manager import add_asset, add_assets
 
     print_header(version=__version__)
     root = Path.cwd()
@@ -843,6 +989,46 @@ def add(
         print_error(f"Invalid type: {type}. Valid options: {', '.join(valid_types)}")
         raise typer.Exit(code=1)
 
+    names = [*(names or [])]
+    if file:
+        try:
+            lines = file.read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            print_error(f"Could not read {file}: {e}")
+            raise typer.Exit(code=1)
+        names += [
+            line.split("#", 1)[0].strip()
+            for line in lines
+            if line.split("#", 1)[0].strip()
+        ]
+    names = [*dict.fromkeys(names)]
+    if not names:
+        print_error("No asset name given.")
+        raise typer.Exit(code=1)
+
+    if len(names) > 1:
+        with _spinner() as progress:
+            task = progress.add_task(
+                description=f"Adding {len(names)} {asset_type}s...", total=None
+            )
+            results = add_assets(asset_type, names, root)
+            progress.update(task, completed=100)
+        _print_asset_results(results)
+        failed = [r["name"] for r in results if not r["ok"]]
+        console.print()
+        if failed:
+            print_error(
+                f"Added {len(results) - len(failed)}/{len(results)} {asset_type}s. "
+                f"Failed: {', '.join(failed)}"
+            )
+            raise typer.Exit(code=1)
+        print_success(f"Added {len(results)} {asset_type}s successfully! 🚀")
+        console.print()
+        console.print("  Run [prompt]ulkan sync[/prompt] to update documentation.")
+        console.print()
+        return
+
+    name = names[0]
     success = add_asset(asset_type, name, root)
 
     if success:
@@ -868,27 +1054,114 @@ def add(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def install(
+    frozen: bool = typer.Option(
+        False,
+        "--frozen",
+        help="Restore exactly the locked content; fail instead of re-resolving assets.",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Overwrite files that differ from the lock (local edits are lost).",
+    ),
+) -> None:
+    """
+    Restores the assets recorded in .agent/ulkan.lock.
+
+    Missing files are restored and verified against their locked SHA-256.
+    They are taken from the local asset store, the blueprints or cached API
+    responses when possible, and missing registry skills are fetched in
+    parallel. Files you modified are kept and reported unless --force is
+    given; with --frozen they make the command fail.
+    """
+    from .lock import LOCK_FILE, lock_path, restore
+
+    print_header(version=__version__)
+    root = Path.cwd()
+
+    if not lock_path(root).exists():
+        print_error(
+            f"{LOCK_FILE} not found. Add assets with [prompt]ulkan add[/prompt] first."
+        )
+        raise typer.Exit(code=1)
+
+    with _spinner() as progress:
+        task = progress.add_task(description="Restoring locked assets...", total=None)
+        results = restore(root, frozen=frozen, force=force)
+        progress.update(task, completed=100)
+
+    _print_asset_results(results)
+    failed = [r["name"] for r in results if not r["ok"]]
+    drifted = sum(len(r.get("drifted", [])) for r in results)
+    console.print()
+    if drifted:
+        console.print(
+            f"[warning]{drifted} file(s) differ from {LOCK_FILE} and were kept. "
+            "Run [prompt]ulkan install --force[/prompt] to restore the locked "
+            "content.[/warning]"
+        )
+    if failed:
+        print_error(
+            f"Restored {len(results) - len(failed)}/{len(results)} assets. "
+            f"Failed: {', '.join(failed)}"
+        )
+        raise typer.Exit(code=1)
+    print_success(f"All {len(results)} locked assets are installed.")
+    console.print()
+
+
 @app.command()
 def sync(
     check: bool = typer.Option(
         False, "--check", help="Return exit code 1 if documentation is out of sync."
-    )
+    ),
+    watch: bool = typer.Option(
+        False, "--watch", "-w", help="Keep AGENTS.md in sync as .agent/ changes."
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help="Sync every AGENTS.md + .agent/ project below the current directory.",
+    ),
 ) -> None:
     """
     Syncs AGENTS.md with current skills, rules, workflows, and tools.
 
     Updates AGENTS.md tables based on the content of .agent/ directory.
     Use --check for CI/CD pipelines to verify documentation is up to date.
+    Use --watch to keep syncing while skills, rules and workflows change.
+    Use --recursive in monorepos to sync every project at once.
     """
-    from .syncer import sync_documentation
+    from .syncer import sync_documentation, sync_recursive, watch_documentation
+
+    if check and watch:
+        print_error("--check and --watch cannot be used together.")
+        raise typer.Exit(code=1)
+    if recursive and watch:
+        print_error("--recursive and --watch cannot be used together.")
+        raise typer.Exit(code=1)
 
     print_header(version=__version__)
     root = Path.cwd()
-    success = sync_documentation(root, check=check)
+    if recursive:
+        success = sync_recursive(root, check=check)
+    else:
+        success = sync_documentation(root, check=check)
 
     if not success:
         raise typer.Exit(code=1)
 
+    if watch:
+        try:
+            watch_documentation(root)
+        except KeyboardInterrupt:
+            console.print()
+            console.print("[info]Stopped watching.[/info]")
+        return
+
     if success and not check:
         console.print()
         console.print(
@@ -920,7 +1193,7 @@ def upgrade() -> None:
     console.print(f"[info]New version available: v{latest}[/info]")
     console.print()
 
-    if not Confirm.ask(f"Upgrade from v{__version__} to v{latest}?", default=True):
+    if not _confirm(f"Upgrade from v{__version__} to v{latest}?", default=True):
         console.print("[info]Upgrade cancelled.[/info]")
         return
 
@@ -956,7 +1229,7 @@ def uninstall(
     if (
         not yes
         and not dry_run
-        and not Confirm.ask("Are you sure you want to uninstall Ulkan?", default=False)
+        and not _confirm("Are you sure you want to uninstall Ulkan?", default=False)
     ):
         console.print("[info]Aborted.[/info]")
         raise typer.Exit()
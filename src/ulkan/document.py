@@ -0,0 +1,166 @@
+"""
+Structured model of a markdown document such as AGENTS.md.
+
+The text is parsed once into headings (sections) and the tables they
+contain, each carrying character offsets into the original text. Edits are
+expressed as splices (start, end, replacement) and applied in a single pass,
+so updating several tables never rescans or rebuilds the document per table.
+
+Headings and tables inside fenced code blocks are ignored.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+HEADING = re.compile(r"(#{1,6})[ \t]+(.*?)[ \t#]*$")
+SEPARATOR_ROW = re.compile(r"\|?(\s*:?-+:?\s*\|)+\s*:?-*:?\s*")
+FENCES = ("```", "~~~")
+
+
+@dataclass
+class Table:
+    """A pipe table. Offsets point into Document.text."""
+
+    start: int  # start of the header row
+    body_start: int  # start of the first data row (just after the separator)
+    end: int  # end of the last data row, including its newline
+    rows: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Section:
+    """A heading and the text up to the next heading (of any level)."""
+
+    level: int
+    title: str
+    start: int  # start of the heading line
+    body_start: int  # just after the heading line
+    end: int  # start of the next heading, or end of the document
+    tables: list[Table] = field(default_factory=list)
+
+
+@dataclass
+class Document:
+    text: str
+    sections: list[Section]
+
+    def find(self, title: str, level: int | None = None) -> Section | None:
+        """Returns the first section whose title starts with `title`."""
+        for section in self.sections:
+            if level is not None and section.level != level:
+                continue
+            if section.title == title or section.title.startswith(title + " "):
+                return section
+        return None
+
+    def section_text(self, section: Section) -> str:
+        return self.text[section.start : section.end]
+
+
+def parse_document(text: str) -> Document:
+    """Parses markdown text into sections and tables in one pass."""
+    sections: list[Section] = []
+    current: Section | None = None
+    fence = None
+    table: Table | None = None
+    previous: tuple[int, str] | None = None  # (offset, line) of the last line
+
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        start, offset = offset, offset + len(line)
+        stripped = line.strip()
+
+        if fence:
+            if stripped.startswith(fence):
+                fence = None
+            previous = None
+            continue
+        if stripped.startswith(FENCES):
+            fence = stripped[:3]
+            table = previous = None
+            continue
+
+        if table is not None:
+            if stripped.startswith("|"):
+                table.rows.append(line.rstrip("\r\n"))
+                table.end = offset
+                continue
+            table = None
+
+        heading = HEADING.match(line.rstrip("\r\n")) if line[:1] == "#" else None
+        if heading:
+            if current:
+                current.end = start
+            current = Section(
+                level=len(heading.group(1)),
+                title=heading.group(2),
+                start=start,
+                body_start=offset,
+                end=len(text),
+            )
+            sections.append(current)
+            previous = None
+            continue
+
+        if (
+            current
+            and previous
+            and previous[1].lstrip().startswith("|")
+            and "-" in stripped
+            and SEPARATOR_ROW.fullmatch(stripped)
+        ):
+            table = Table(start=previous[0], body_start=offset, end=offset)
+            current.tables.append(table)
+            previous = None
+            continue
+
+        previous = (start, line)
+
+    return Document(text=text, sections=sections)
+
+
+def apply_splices(text: str, splices: list[tuple[int, int, str]]) -> str:
+    """Applies non-overlapping (start, end, replacement) edits in one pass."""
+    parts = []
+    position = 0
+    for start, end, replacement in sorted(splices, key=lambda s: (s[0], s[1])):
+        if start < position:
+            raise ValueError("Overlapping splices")
+        parts.append(text[position:start])
+        parts.append(replacement)
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def replace_table_rows(doc: Document, tables: dict[str, list[str]]) -> str:
+    """Replaces the rows of the first table under each given heading.
+
+    Args:
+        doc: Parsed document
+        tables: Heading title -> new rows. Headings that are missing, have no
+            table, or map to no rows are left untouched.
+
+    Returns:
+        The updated text (doc.text itself if nothing changed).
+    """
+    splices = []
+    for title, rows in tables.items():
+        section = doc.find(title)
+        if not rows or section is None or not section.tables:
+            continue
+        table = section.tables[0]
+        if table.rows == rows:
+            continue
+        splices.append((table.body_start, table.end, "".join(r + "\n" for r in rows)))
+    return apply_splices(doc.text, splices) if splices else doc.text
+
+
+def changed_sections(before: str, after: str) -> list[str]:
+    """Returns the titles of sections that were added or whose text changed."""
+    old = parse_document(before)
+    old_text = {s.title: old.section_text(s) for s in old.sections}
+    new = parse_document(after)
+    return [
+        s.title for s in new.sections if old_text.get(s.title) != new.section_text(s)
+    ]
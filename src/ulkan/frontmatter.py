@@ -0,0 +1,151 @@
+"""Parser for the YAML frontmatter used by skills, rules and workflows.
+
+Only the YAML subset found in Ulkan assets is supported:
+    * `key: value` scalars (plain, "double" or 'single' quoted)
+    * folded (`>`) and literal (`|`) block scalars
+    * one level of nested mappings (e.g. `metadata:`)
+    * flow sequences (`scope: [root, docs]`)
+
+Everything is returned as strings (or lists/dicts of strings), which is what
+the callers need and keeps the result JSON serializable.
+"""
+
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+DELIMITER = "---"
+BLOCK_INDICATORS = (">", "|")
+
+# Frontmatter larger than this is treated as missing
+MAX_FRONTMATTER_BYTES = 64 * 1024
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    return value
+
+
+def _scalar(value: str) -> str | list[str]:
+    """Converts an inline YAML value into a string or list of strings."""
+    if value[:1] not in ('"', "'") and " #" in value:
+        value = value.split(" #", 1)[0].rstrip()
+    if value.startswith("[") and value.endswith("]"):
+        return [
+            _unquote(item.strip()) for item in value[1:-1].split(",") if item.strip()
+        ]
+    return _unquote(value)
+
+
+def _join_block(style: str, lines: list[str]) -> str:
+    """Joins the lines of a block scalar (folded `>` or literal `|`)."""
+    indents = [len(l) - len(l.lstrip(" ")) for l in lines if l.strip()]
+    if not indents:
+        return ""
+    indent = min(indents)
+    lines = [l[indent:] for l in lines]
+    if style == "|":
+        return "\n".join(lines).strip("\n")
+
+    # Folded: single newlines become spaces, blank lines become newlines
+    paragraphs, current = [], []
+    for line in lines:
+        if line.strip():
+            current.append(line.strip())
+        elif current:
+            paragraphs.append(" ".join(current))
+            current = []
+    if current:
+        paragraphs.append(" ".join(current))
+    return "\n".join(paragraphs)
+
+
+def parse_frontmatter_lines(lines: Iterable[str]) -> dict | None:
+    """Parses frontmatter from an iterable of lines.
+
+    Consumes lines only up to the closing `---`, so it can be fed a file
+    object without reading the rest of the document.
+
+    Returns:
+        Dict of frontmatter fields, or None if there is no (terminated)
+        frontmatter block at the top of the input.
+    """
+    iterator = iter(lines)
+    first = next(iterator, None)
+    if first is None or first.lstrip("\ufeff").strip() != DELIMITER:
+        return None
+
+    data: dict = {}
+    mapping: dict | None = None  # nested mapping being filled (e.g. metadata)
+    block = None  # (target, key, style, key_indent, lines)
+
+    for raw in iterator:
+        line = raw.rstrip("\r\n")
+        indent = len(line) - len(line.lstrip(" "))
+
+        if block is not None:
+            target, key, style, key_indent, block_lines = block
+            if not line.strip() or indent > key_indent:
+                block_lines.append(line)
+                continue
+            target[key] = _join_block(style, block_lines)
+            block = None
+
+        if line.strip() == DELIMITER and indent == 0:
+            return data
+
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        key, sep, value = stripped.partition(":")
+        if not sep or not key:
+            continue
+        key, value = key.strip(), value.strip()
+
+        if indent == 0:
+            mapping = None
+            target = data
+        elif mapping is not None:
+            target = mapping
+        else:
+            continue  # Continuation of a plain multi-line scalar: ignored
+
+        if value[:1] in BLOCK_INDICATORS and value.rstrip("+-") in BLOCK_INDICATORS:
+            block = (target, key, value[0], indent, [])
+        elif not value and indent == 0:
+            mapping = data[key] = {}
+        else:
+            target[key] = _scalar(value)
+
+    return None
+
+
+def _bounded_lines(f: IO[str], max_bytes: int) -> Iterator[str]:
+    """Yields lines from f until max_bytes characters have been read."""
+    remaining = max_bytes
+    while remaining > 0:
+        line = f.readline(remaining)
+        if not line:
+            return
+        remaining -= len(line)
+        yield line
+
+
+def read_frontmatter(
+    filepath: Path, max_bytes: int = MAX_FRONTMATTER_BYTES
+) -> dict | None:
+    """Reads and parses the frontmatter of a file.
+
+    Streams the file line by line and stops at the closing `---`, so I/O and
+    memory are bounded by the frontmatter size (and at most max_bytes), not
+    by the size of the document body.
+
+    Returns:
+        Dict of frontmatter fields, or None if the file has none (or it is
+        not terminated within max_bytes).
+    """
+    with filepath.open(encoding="utf-8", errors="replace") as f:
+        return parse_frontmatter_lines(_bounded_lines(f, max_bytes))
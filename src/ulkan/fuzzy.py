@@ -0,0 +1,285 @@
+"""
+Fuzzy asset name resolution for `ulkan add`.
+
+Names are the bundled blueprint assets and the registry skill titles of
+cached Skyll responses, taken from the local search index (index.py). A
+trigram index over them is precomputed and stored next to the search index
+(`names.json`), rebuilt only when the search index changes. A lookup
+collects candidates through the trigram postings of the query and ranks the
+best of them with `similarity`, so it stays fast with tens of thousands of
+cached names.
+
+`similarity` is also used to refuse API hits that do not resemble the name
+the user asked for.
+"""
+
+import heapq
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
+NAMES_FILE = "names.json"
+NAMES_VERSION = 2
+
+DEFAULT_THRESHOLD = 0.6  # setting `name_match_threshold`
+WORD_MATCH = 0.8  # edit similarity for two words to count as the same
+PRESELECT = 64  # names sharing the most trigrams with the query
+CANDIDATES = 16  # of which the best by trigram overlap get the full similarity
+POSTINGS_BUDGET = 2000  # name ids read per lookup (rarest trigrams first)
+
+SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(name: str) -> str:
+    """Lowercases a name and joins its words with single dashes."""
+    return SEPARATORS.sub("-", name.lower()).strip("-")
+
+
+def trigrams(name: str) -> set[str]:
+    """Character trigrams of a normalized name, padded at both ends."""
+    padded = f"${name}$"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance, with the bit-parallel algorithm of Myers/Hyyrö.
+
+    Each column of the dynamic programming matrix is held in the bits of
+    two integers (vertical +1/-1 deltas), so the cost is a few integer
+    operations per character of `b` instead of len(a) * len(b) steps.
+    """
+    if not a:
+        return len(b)
+    peq: dict[str, int] = {}
+    for i, char in enumerate(a):
+        peq[char] = peq.get(char, 0) | 1 << i
+    mask = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    plus, minus = mask, 0
+    distance = len(a)
+    for char in b:
+        eq = peq.get(char, 0)
+        xv = eq | minus
+        xh = (((eq & plus) + plus) ^ plus) | eq
+        h_plus = minus | ~(xh | plus)
+        h_minus = plus & xh
+        if h_plus & last:
+            distance += 1
+        elif h_minus & last:
+            distance -= 1
+        h_plus = (h_plus << 1) | 1
+        h_minus <<= 1
+        plus = (h_minus | ~(xv | h_plus)) & mask
+        minus = h_plus & xv & mask
+    return distance
+
+
+def edit_similarity(a: str, b: str) -> float:
+    """1 - Levenshtein distance / length of the longer string."""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return 1 - edit_distance(a, b) / max(len(a), len(b))
+
+
+def _length_bound(a: str, b: str) -> float:
+    """Upper bound of edit_similarity(a, b) from the lengths alone."""
+    return min(len(a), len(b)) / max(len(a), len(b))
+
+
+def similarity(query: str, name: str, floor: float = 0.0) -> float:
+    """How well `name` matches what the user typed, from 0 to 1.
+
+    The best of:
+        - edit similarity of the whole names,
+        - trigram overlap (Dice coefficient),
+        - word match: the share of the query's words that (nearly) appear
+          in the name, as 'react' in 'react-best-practices' (at most 0.9).
+
+    Scores below `floor` may be underestimated: the edit distance is only
+    computed when it could lift the score above both the other measures
+    and the floor.
+    """
+    a, b = normalize(query), normalize(name)
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    best = 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+    query_words = a.split("-")
+    name_words = set(b.split("-"))
+    matched = 0
+    for word in query_words:
+        if word in name_words or any(
+            _length_bound(word, other) >= WORD_MATCH
+            and edit_similarity(word, other) >= WORD_MATCH
+            for other in name_words
+        ):
+            matched += 1
+    best = max(best, 0.9 * matched / len(query_words))
+
+    # Each edit changes at most 3 trigrams: a cheap bound on the distance
+    # skips the edit distance when it cannot win
+    floor = max(best, floor)
+    distance = max(len(grams_a - grams_b), len(grams_b - grams_a)) / 3
+    if 1 - distance / max(len(a), len(b)) > floor:
+        best = max(best, edit_similarity(a, b))
+    return best
+
+
+class NameIndex:
+    """Trigram index over (name, type, source) entries, postings per type."""
+
+    def __init__(self, names: list[list[str]], grams: dict[str, dict[str, str]]):
+        self.names = names  # [name, type, source, normalized name]
+        self.grams = grams  # type -> trigram -> comma-separated name ids
+
+    @classmethod
+    def build(cls, entries) -> "NameIndex":
+        names = []
+        seen = set()
+        postings: dict[str, dict[str, list[int]]] = {}
+        for name, asset_type, source in entries:
+            normalized = normalize(name)
+            if not normalized or (normalized, asset_type) in seen:
+                continue
+            seen.add((normalized, asset_type))
+            by_gram = postings.setdefault(asset_type, {})
+            for gram in trigrams(normalized):
+                by_gram.setdefault(gram, []).append(len(names))
+            names.append([name, asset_type, source, normalized])
+        grams = {
+            asset_type: {g: ",".join(map(str, ids)) for g, ids in by_gram.items()}
+            for asset_type, by_gram in postings.items()
+        }
+        return cls(names, grams)
+
+    def lookup(
+        self,
+        query: str,
+        asset_type: str,
+        limit: int = 3,
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> list[tuple[float, str, str]]:
+        """Ranks the indexed names of a type against a query.
+
+        Postings are read rarest first, up to POSTINGS_BUDGET name ids, so
+        trigrams shared by thousands of names do not slow a lookup down;
+        the best CANDIDATES by trigram overlap (among the PRESELECT names
+        sharing the most trigrams) are then scored with `similarity`.
+
+        Returns:
+            Up to `limit` (similarity, name, source) tuples, best first.
+        """
+        normalized = normalize(query)
+        grams = trigrams(normalized)
+        by_gram = self.grams.get(asset_type, {})
+        postings = sorted((by_gram[g] for g in grams if g in by_gram), key=len)
+
+        shared: Counter[str] = Counter()
+        budget = POSTINGS_BUDGET
+        for posting in postings:
+            ids = posting.split(",")
+            if shared and len(ids) > budget:
+                break
+            budget -= len(ids)
+            shared.update(ids)
+
+        # Names sharing the most trigrams, re-ranked by the Dice coefficient
+        # of the trigram sets (a name of n chars has n trigrams)
+        names = self.names
+        size = len(grams)
+        candidates = heapq.nlargest(
+            CANDIDATES,
+            shared.most_common(PRESELECT),
+            key=lambda item: item[1] / (size + len(names[int(item[0])][3])),
+        )
+        # Candidates only need an exact score if they can enter the top
+        # `limit`, so the limit-th best score so far is the floor
+        scored = []
+        top: list[float] = []
+        for i, _ in candidates:
+            name, _, source, _ = names[int(i)]
+            floor = top[0] if len(top) == limit else threshold
+            score = similarity(normalized, name, floor)
+            if score >= floor:
+                scored.append((score, name, source))
+                heapq.heappush(top, score)
+                if len(top) > limit:
+                    heapq.heappop(top)
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return scored[:limit]
+
+
+def names_path() -> Path:
+    from .index import global_index_path
+
+    return global_index_path() / NAMES_FILE
+
+
+def load_name_index() -> NameIndex:
+    """Returns the name index, rebuilding it if the search index changed."""
+    from .index import open_global_index
+
+    search_index = open_global_index()
+    path = names_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if (
+            data.get("version") == NAMES_VERSION
+            and data.get("generation") == search_index.generation
+        ):
+            return NameIndex(data["names"], data["grams"])
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    index = NameIndex.build(
+        (doc[0], doc[1], doc[2]) for doc in search_index.live_docs()
+    )
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(
+            json.dumps(
+                {
+                    "version": NAMES_VERSION,
+                    "generation": search_index.generation,
+                    "names": index.names,
+                    "grams": index.grams,
+                },
+                separators=(",", ":"),
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+    return index
+
+
+def threshold() -> float:
+    from .settings import get_float
+
+    return get_float("name_match_threshold", DEFAULT_THRESHOLD)
+
+
+def suggest(query: str, asset_type: str, limit: int = 3) -> list[str]:
+    """'Did you mean' candidates for an asset name that was not found."""
+    try:
+        matches = load_name_index().lookup(
+            query, asset_type, limit=limit, threshold=min(threshold(), 0.5)
+        )
+    except Exception:
+        return []
+    return [name for _, name, _ in matches if normalize(name) != normalize(query)]
+
+
+def did_you_mean(query: str, asset_type: str) -> str:
+    """A ' Did you mean: a, b?' suffix for error messages ('' if none)."""
+    names = suggest(query, asset_type)
+    return f" Did you mean: {', '.join(names)}?" if names else ""
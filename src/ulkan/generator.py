@@ -1,4 +1,5 @@
 import shutil
+from collections.abc import Callable
 from pathlib import Path
 from importlib import resources
 
@@ -9,54 +10,6 @@ from .styles import console
 BLUEPRINTS_PKG = "ulkan.blueprints"
 
 
-def create_directory(path: Path) -> None:
-    """Creates a directory if it doesn't exist."""
-    if not path.exists():
-        path.mkdir(parents=True, exist_ok=True)
-
-
-def copy_resource_file(
-    source_path: Path, dest_path: Path, base_path: Path | None = None
-) -> bool:
-    """Copies a file from source path to destination path.
-
-    Args:
-        source_path: Absolute path to source file.
-        dest_path: Absolute path to destination file.
-        base_path: Optional base path for relative display in logs.
-
-    Returns:
-        True if file was created, False if it already existed.
-    """
-    if dest_path.exists():
-        # Show relative path for better context
-        display_path = (
-            dest_path.relative_to(base_path)
-            if base_path
-            else f"{dest_path.parent.name}/{dest_path.name}"
-        )
-        console.print(f"[warning]  ⊘ Skipped: {display_path}[/warning]")
-        return False
-
-    # Ensure parent dir exists
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-    try:
-        shutil.copy2(source_path, dest_path)
-    except FileNotFoundError:
-        console.print(f"[error]  ✖ Error: Source file not found: {source_path}[/error]")
-        return False
-
-    # Show success message for created files
-    display_path = (
-        dest_path.relative_to(base_path)
-        if base_path
-        else f"{dest_path.parent.name}/{dest_path.name}"
-    )
-    console.print(f"[title]  ✔ Created: {display_path}[/title]")
-    return True
-
-
 def get_package_path(package_name: str) -> Path:
     """Get the absolute filesystem path of a package."""
     # Simple relative path resolution for now
@@ -103,25 +56,231 @@ def update_gitignore(base_path: Path) -> None:
         )
 
 
-def generate_project(base_path: Path) -> None:
-    """Generates the agentic project structure.
+def plan_blueprint(rel_path: str, dest_path: Path) -> list[tuple[Path, Path]]:
+    """Plans the copy of a blueprint file (path relative to blueprints/).
 
-    Args:
-        base_path: The root directory where the project will be initialized.
+    Returns:
+        A one-item plan, or an empty plan if the manifest doesn't list it.
     """
+    from .manifest import get_entry
+
+    if get_entry(rel_path) is None:
+        return []
+    return [(get_package_path(BLUEPRINTS_PKG) / rel_path, dest_path)]
+
+
+def plan_blueprint_asset(
+    asset_type: str, name: str, dest_dir: Path
+) -> list[tuple[Path, Path]]:
+    """Plans the copy of every file of a multi-file asset (skill, tool folder).
+
+    Returns:
+        List of (source, destination) pairs, empty if the asset is unknown.
+    """
+    from .manifest import asset_files
 
     blueprints_root = get_package_path(BLUEPRINTS_PKG)
+    asset_prefix = f"{asset_type}/{name}/"
+    return [
+        (blueprints_root / entry["path"], dest_dir / entry["path"][len(asset_prefix) :])
+        for entry in asset_files(asset_type, name)
+    ]
 
-    if not blueprints_root.exists():
-        console.print(
-            f"[error]Blueprints directory not found at {blueprints_root}[/error]"
+
+def _copy_new_file(source_path: Path, dest_path: Path) -> int | None:
+    """Copies a file only if the destination doesn't exist yet.
+
+    Opening the destination with O_EXCL folds the existence check into the
+    create call, saving a metadata round trip per file.
+
+    Returns:
+        Number of bytes copied, or None if the destination already existed.
+    """
+    try:
+        with open(source_path, "rb") as src, open(dest_path, "xb") as dest:
+            shutil.copyfileobj(src, dest)
+    except FileExistsError:
+        return None
+    shutil.copystat(source_path, dest_path)
+    return dest_path.stat().st_size
+
+
+def _blueprint_digest(source_path: Path) -> str | None:
+    """SHA-256 of a blueprint file as recorded in the manifest.
+
+    Only trusted when the file still has the recorded size; the manifest
+    itself is rebuilt when blueprints change in a source checkout (see
+    manifest.load_manifest). None means the file must be hashed.
+    """
+    from .manifest import get_entry
+
+    try:
+        rel = source_path.relative_to(get_package_path(BLUEPRINTS_PKG))
+    except ValueError:
+        return None
+    entry = get_entry(rel.as_posix())
+    if not entry:
+        return None
+    try:
+        if source_path.stat().st_size != entry["size"]:
+            return None
+    except OSError:
+        return None
+    return entry["sha256"]
+
+
+# Files Ulkan itself rewrites in place (sync, build, migrate): never hardlinked
+MUTABLE_FILES = {"AGENTS.md"}
+
+
+def _link_new_file(source_path: Path, dest_path: Path, link_mode: str) -> tuple:
+    """Materializes a file through the shared asset store (see store.py),
+    falling back to a direct copy if the store cannot be written.
+
+    Returns:
+        (size, linked): size is None if the destination already existed;
+        linked is True if no data was written (hardlink or reflink).
+    """
+    from . import store
+
+    if link_mode == "hardlink" and dest_path.name in MUTABLE_FILES:
+        link_mode = "copy"
+    try:
+        digest = store.add_file(source_path, _blueprint_digest(source_path))
+    except FileNotFoundError:
+        raise
+    except OSError:
+        return _copy_new_file(source_path, dest_path), False
+    how = store.materialize(digest, dest_path, link_mode)
+    if how is None:
+        return None, False
+    return store.object_path(digest).stat().st_size, how != "copy"
+
+
+def materialize(
+    plan: list[tuple[Path, Path]],
+    workers: int | None = None,
+    on_progress: Callable[[int, int, int], None] | None = None,
+    link_mode: str | None = None,
+) -> dict:
+    """Copies a planned set of files, never overwriting existing ones.
+
+    The whole plan is known upfront, so every destination directory is
+    created in a single pass and the files are then copied through a thread
+    pool. This keeps per-file metadata round trips (costly on network
+    filesystems) off the critical path.
+
+    Args:
+        plan: List of (source, destination) absolute path pairs.
+        workers: Copy threads (default: setting `materialize_workers`, 8).
+        on_progress: Optional callback(files_done, files_total, bytes_written)
+            invoked after each file.
+        link_mode: Materialize through the shared asset store with this mode
+            (see store.link_mode); None copies the sources directly.
+
+    Returns:
+        Dict with 'created' and 'skipped' (lists of destination paths),
+        'errors' (list of messages), 'bytes' (total size of the created
+        files) and 'linked' (files hardlinked or reflinked from the store,
+        i.e. created without writing data).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .settings import get_int
+
+    result = {"created": [], "skipped": [], "errors": [], "bytes": 0, "linked": 0}
+    if not plan:
+        return result
+
+    # 1. Every destination directory, parents first, exactly once
+    for directory in sorted({dest.parent for _, dest in plan}):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    # 2. Copy files concurrently (results are collected in plan order)
+    def copy(item: tuple[Path, Path]) -> tuple[Path, int | None, bool, str | None]:
+        source_path, dest_path = item
+        try:
+            if link_mode:
+                return (
+                    dest_path,
+                    *_link_new_file(source_path, dest_path, link_mode),
+                    None,
+                )
+            return dest_path, _copy_new_file(source_path, dest_path), False, None
+        except FileNotFoundError:
+            return dest_path, None, False, f"Source file not found: {source_path}"
+        except OSError as e:
+            return dest_path, None, False, f"Failed to create {dest_path}: {e}"
+
+    workers = workers or get_int("materialize_workers", 8)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(plan)))) as pool:
+        for dest_path, size, linked, error in pool.map(copy, plan):
+            if error:
+                result["errors"].append(error)
+            elif size is None:
+                result["skipped"].append(dest_path)
+            else:
+                result["created"].append(dest_path)
+                result["bytes"] += size
+                result["linked"] += linked
+            if on_progress:
+                done = len(result["created"]) + len(result["skipped"])
+                on_progress(done + len(result["errors"]), len(plan), result["bytes"])
+
+    return result
+
+
+def print_materialize_summary(result: dict, base_path: Path | None = None) -> None:
+    """Prints one aggregated summary of a materialize() result."""
+
+    def display(path: Path) -> str:
+        if base_path:
+            return str(path.relative_to(base_path))
+        return f"{path.parent.name}/{path.name}"
+
+    lines = []
+    if result["created"]:
+        linked = result.get("linked", 0)
+        lines.append(
+            f"[title]  ✔ Created {len(result['created'])} file(s) "
+            f"({result['bytes'] / 1024:.1f} KB"
+            + (f", {linked} linked from the asset store" if linked else "")
+            + ")[/title]"
+        )
+    if result["skipped"]:
+        lines.append(
+            f"[warning]  ⊘ Skipped {len(result['skipped'])} existing file(s):[/warning]"
         )
-        return
+        lines.extend(
+            f"[warning]      {display(p)}[/warning]" for p in result["skipped"]
+        )
+    lines.extend(f"[error]  ✖ Error: {error}[/error]" for error in result["errors"])
+
+    if lines:
+        console.print("\n".join(lines))
+
+
+def plan_project(base_path: Path) -> tuple[list[tuple[Path, Path]], list[str]]:
+    """Plans the files of a new agentic project structure.
+
+    Blueprint files are resolved through the precomputed manifest (see
+    manifest.py) instead of walking the blueprints directory.
+
+    Returns:
+        (plan, missing) tuple: the (source, destination) pairs to copy and
+        the blueprints that could not be found.
+    """
+    plan: list[tuple[Path, Path]] = []
+    missing: list[str] = []
+
+    def add(rel_path: str, dest_path: Path) -> None:
+        entries = plan_blueprint(rel_path, dest_path)
+        if not entries:
+            missing.append(f"Blueprint not found: {rel_path}")
+        plan.extend(entries)
 
     # 1. Root Manifest (AGENTS.md)
-    copy_resource_file(
-        blueprints_root / "AGENTS.md", base_path / "AGENTS.md", base_path
-    )
+    add("AGENTS.md", base_path / "AGENTS.md")
 
     # 2. Core Directories & Scaffolding (READMEs and Manual)
     # We mirror the structure of blueprints/ into .agent/
@@ -143,7 +302,7 @@ def generate_project(base_path: Path) -> None:
     }
 
     for src_rel, dest_rel in scaffolding_files.items():
-        copy_resource_file(blueprints_root / src_rel, agent_dir / dest_rel, base_path)
+        add(src_rel, agent_dir / dest_rel)
 
     # 3. Registry Components (Skills)
     # Mapping: Skill Name -> Source Folder (relative to blueprints/skills)
@@ -159,19 +318,11 @@ def generate_project(base_path: Path) -> None:
     ]
 
     for skill in skills_to_install:
-        src_skill_dir = blueprints_root / "skills" / skill
-        dest_skill_dir = agent_dir / "skills" / skill
-
-        # Recursively copy the skill folder
-        if src_skill_dir.exists():
-            # Using copytree functionality manually to use our safe copying/logging
-            for src_file in src_skill_dir.rglob("*"):
-                if src_file.is_file():
-                    rel_path = src_file.relative_to(src_skill_dir)
-                    dest_file = dest_skill_dir / rel_path
-                    copy_resource_file(src_file, dest_file, base_path)
-        else:
-            console.print(f"[error]Skill {skill} not found in blueprints.[/error]")
+        # Every file of the skill folder listed in the manifest
+        entries = plan_blueprint_asset("skills", skill, agent_dir / "skills" / skill)
+        if not entries:
+            missing.append(f"Skill {skill} not found in blueprints.")
+        plan.extend(entries)
 
     # 4. Registry Components (Workflows)
     workflows_to_install = {
@@ -185,18 +336,47 @@ def generate_project(base_path: Path) -> None:
     }
 
     for src_file, dest_file in workflows_to_install.items():
-        copy_resource_file(
-            blueprints_root / "workflows" / src_file,
-            agent_dir / "workflows" / dest_file,
-            base_path,
-        )
+        add(f"workflows/{src_file}", agent_dir / "workflows" / dest_file)
 
     # 5. Registry Components (Tools/Scripts)
     scripts_to_install = ["sync_agents_docs.py", "lint_agent_setup.py"]
 
     for script in scripts_to_install:
-        copy_resource_file(
-            blueprints_root / "tools" / "scripts" / script,
-            agent_dir / "tools" / "scripts" / script,
-            base_path,
+        add(f"tools/scripts/{script}", agent_dir / "tools" / "scripts" / script)
+
+    return plan, missing
+
+
+def generate_project(
+    base_path: Path,
+    on_progress: Callable[[int, int, int], None] | None = None,
+) -> dict:
+    """Generates the agentic project structure.
+
+    The whole tree is planned first (plan_project) and then materialized in
+    one batch, with a single aggregated summary printed at the end.
+
+    Args:
+        base_path: The root directory where the project will be initialized.
+        on_progress: Optional materialize() progress callback.
+
+    Returns:
+        The materialize() result dict.
+    """
+    from .manifest import load_manifest
+
+    if not load_manifest()["files"]:
+        blueprints_root = get_package_path(BLUEPRINTS_PKG)
+        console.print(
+            f"[error]Blueprints directory not found at {blueprints_root}[/error]"
         )
+        return {"created": [], "skipped": [], "errors": [], "bytes": 0, "linked": 0}
+
+    from .store import link_mode
+
+    plan, missing = plan_project(base_path)
+    result = materialize(plan, on_progress=on_progress, link_mode=link_mode(base_path))
+    result["errors"] = missing + result["errors"]
+
+    print_materialize_summary(result, base_path)
+    return result
@@ -0,0 +1,541 @@
+"""
+Local full-text search index for `ulkan search`.
+
+Three kinds of sources are indexed:
+    blueprints  the assets bundled with Ulkan (via the blueprint manifest)
+    skyll       registry skills from previously cached Skyll API responses
+    project     the skills, rules, workflows and tools of the current .agent/
+
+Each source file contributes one or more documents whose terms (name,
+description and body weighted separately) go into an inverted index. On
+disk an index is a directory holding `meta.json` (source fingerprints and
+document metadata) and the postings, sharded by term hash, so a query only
+reads the shards of its own terms. Updates are incremental: only sources
+whose fingerprint changed are re-read and re-tokenized. Queries are ranked
+with Okapi BM25.
+
+The blueprint and registry index lives in `<cache dir>/index/search/`; the
+project index lives next to the sync cache in `.agent/.cache/search/`.
+"""
+
+import json
+import math
+import os
+import re
+import zlib
+from pathlib import Path
+
+INDEX_VERSION = 1
+INDEX_DIR = "search"
+META_FILE = "meta.json"
+SHARDS = 32
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Field weights: a term in the name counts as often as NAME_WEIGHT body terms
+NAME_WEIGHT = 3
+DESCRIPTION_WEIGHT = 2
+MAX_BODY_CHARS = 16 * 1024  # only the start of long documents is indexed
+
+TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from how if in into is it its of on or so "
+    "that the this to use used uses using when with you your".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercases and splits text into terms (stopwords dropped, plurals folded)."""
+    terms = []
+    for term in TOKEN.findall(text.lower()):
+        if len(term) < 2 or term in STOPWORDS:
+            continue
+        if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+            term = term[:-1]
+        terms.append(term)
+    return terms
+
+
+def make_document(
+    name: str,
+    asset_type: str,
+    source: str,
+    description: str = "",
+    body: str = "",
+    installs: int = 0,
+) -> dict:
+    """Builds an index document (metadata plus weighted term frequencies)."""
+    tf: dict[str, int] = {}
+    for text, weight in (
+        (name, NAME_WEIGHT),
+        (description, DESCRIPTION_WEIGHT),
+        (body[:MAX_BODY_CHARS], 1),
+    ):
+        for term in tokenize(text):
+            tf[term] = tf.get(term, 0) + weight
+    return {
+        "name": name,
+        "type": asset_type,
+        "source": source,
+        "description": description,
+        "installs": installs,
+        "len": sum(tf.values()),
+        "tf": tf,
+    }
+
+
+def _read_text(path: Path) -> str:
+    try:
+        with path.open(encoding="utf-8", errors="replace") as f:
+            return f.read(MAX_BODY_CHARS)
+    except OSError:
+        return ""
+
+
+# --- Sources ---------------------------------------------------------------
+# Each source function returns {key: (fingerprint, loader)}; the loader is
+# only called when the fingerprint differs from the indexed one.
+
+
+def blueprint_sources() -> dict:
+    """The primary file of every bundled asset, fingerprinted by its SHA-256."""
+    from .manifest import BLUEPRINTS_DIR, load_manifest
+    from .syncer import parse_tool
+
+    def loader(entry: dict):
+        def load() -> list[dict]:
+            path = BLUEPRINTS_DIR / entry["path"]
+            body = _read_text(path)
+            if entry["type"] == "tools":
+                description = parse_tool(path)[2]
+            else:
+                description = (entry["frontmatter"] or {}).get("description")
+                if not isinstance(description, str) or not description.strip():
+                    description = _first_paragraph(body)
+            return [
+                make_document(
+                    entry["asset"],
+                    entry["type"].rstrip("s"),
+                    "blueprints",
+                    " ".join(description.split()),
+                    body,
+                )
+            ]
+
+        return load
+
+    sources = {}
+    for entry in load_manifest()["files"]:
+        if not entry["asset"]:
+            continue
+        path = entry["path"]
+        if entry["type"] == "skills" and not path.endswith("/SKILL.md"):
+            continue
+        if entry["type"] == "tools" and path.endswith("README.md"):
+            continue
+        sources[f"blueprints:{path}"] = (entry["sha256"], loader(entry))
+    return sources
+
+
+def registry_sources() -> dict:
+    """Cached Skyll search responses, fingerprinted by (inode, size).
+
+    Cache entries are replaced atomically on write, so a new inode means new
+    content; reading an entry only touches its mtime.
+    """
+    from .manager import SEARCH_CACHE_NAMESPACE, _skills_from_payload
+    from .response_cache import namespace_dir
+
+    def loader(path: str):
+        def load() -> list[dict]:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)["data"]
+                records = _skills_from_payload(data)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                return []
+            return [registry_document(r) for r in records if isinstance(r, dict)]
+
+        return load
+
+    sources = {}
+    try:
+        with os.scandir(namespace_dir(SEARCH_CACHE_NAMESPACE)) as it:
+            for entry in it:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                sources[f"skyll:{entry.name}"] = (
+                    [st.st_ino, st.st_size],
+                    loader(entry.path),
+                )
+    except OSError:
+        pass
+    return sources
+
+
+def registry_document(record: dict) -> dict:
+    """Index document for a raw Skyll skill record (see manager.fetch_skills)."""
+    content = record.get("content") or ""
+    metadata = record.get("metadata")
+    description = record.get("description") or ""
+    if not description and isinstance(metadata, dict):
+        description = metadata.get("description") or ""
+    if not description:
+        description = _first_paragraph(content)
+    return make_document(
+        str(record.get("title") or "Unknown"),
+        "skill",
+        "skyll",
+        " ".join(str(description).split()),
+        content,
+        installs=record.get("install_count") or 0,
+    )
+
+
+def project_sources(root: Path) -> dict:
+    """Assets of a project's .agent/, fingerprinted by (mtime_ns, size)."""
+    from .syncer import CATEGORIES, find_assets
+
+    def loader(category: str, path: Path):
+        def load() -> list[dict]:
+            name, _, description = CATEGORIES[category][0](path)
+            return [
+                make_document(
+                    name,
+                    category.rstrip("s"),
+                    "project",
+                    description or "",
+                    _read_text(path),
+                )
+            ]
+
+        return load
+
+    sources = {}
+    for category, path in find_assets(root):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        key = f"project:{path.relative_to(root).as_posix()}"
+        sources[key] = ([st.st_mtime_ns, st.st_size], loader(category, path))
+    return sources
+
+
+def _first_paragraph(text: str) -> str:
+    """First prose paragraph of a markdown text (frontmatter and headings skipped)."""
+    if text.startswith("---"):
+        end = text.find("\n---", 3)
+        text = text[end + 4 :] if end != -1 else ""
+    for paragraph in text.split("\n\n"):
+        lines = [line for line in paragraph.splitlines() if not line.startswith("#")]
+        paragraph = " ".join(" ".join(lines).split())
+        if paragraph and not paragraph.startswith(("```", "|", "<")):
+            return paragraph[:200]
+    return ""
+
+
+# --- Index -----------------------------------------------------------------
+
+
+def _shard(term: str) -> int:
+    return zlib.crc32(term.encode()) % SHARDS
+
+
+def _write_json(path: Path, data) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(
+            json.dumps(data, separators=(",", ":"), ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _read_json(path: Path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+class SearchIndex:
+    """An on-disk inverted index over a set of sources.
+
+    Documents are numbered in order of insertion; the ids of removed
+    documents are left empty (None) until more than half of them are, at
+    which point the index is rebuilt compactly.
+    """
+
+    def __init__(self, path: Path, make_dir=None):
+        """
+        Args:
+            path: Index directory.
+            make_dir: Optional callable creating the parent directory
+                (e.g. syncer.make_cache_dir for .agent/.cache/).
+        """
+        self.path = path
+        self.make_dir = make_dir
+        self.sources: dict[str, dict] = {}  # key -> {"fp": ..., "docs": [ids]}
+        self.docs: list[list | None] = []  # [name, type, source, desc, installs, len]
+        self.postings: dict[int, dict[str, dict]] = {}  # shard -> term -> {id: tf}
+        self.generation = ""  # random token, renewed on every save with changes
+        self.dirty = False
+
+        meta = _read_json(path / META_FILE)
+        if (
+            isinstance(meta, dict)
+            and meta.get("version") == INDEX_VERSION
+            and meta.get("shards") == SHARDS
+        ):
+            self.sources = meta["sources"]
+            self.docs = meta["docs"]
+            self.generation = meta.get("generation", "")
+
+    def _postings(self, shard: int) -> dict[str, dict]:
+        """Loads a postings shard ({term: {doc id: tf}}) on first use."""
+        if shard not in self.postings:
+            data = _read_json(self.path / f"terms-{shard:02d}.json")
+            self.postings[shard] = data if isinstance(data, dict) else {}
+        return self.postings[shard]
+
+    def update(self, sources: dict) -> int:
+        """Re-indexes changed sources and drops removed ones.
+
+        Only the metadata is read when nothing changed; the postings are
+        loaded once something has to be removed or added.
+
+        Args:
+            sources: {key: (fingerprint, loader)} as returned by the
+                *_sources functions.
+
+        Returns:
+            Number of sources (re)indexed or removed.
+        """
+        stale = [
+            key
+            for key, entry in self.sources.items()
+            if key not in sources or sources[key][0] != entry["fp"]
+        ]
+        new = [
+            key
+            for key, (fingerprint, _) in sources.items()
+            if key not in self.sources or self.sources[key]["fp"] != fingerprint
+        ]
+        if not stale and not new:
+            return 0
+
+        for shard in range(SHARDS):
+            self._postings(shard)
+
+        removed = set()
+        for key in stale:
+            for doc_id in self.sources.pop(key)["docs"]:
+                self.docs[doc_id] = None
+                removed.add(str(doc_id))
+        if removed:
+            for shard in self.postings.values():
+                for term in list(shard):
+                    postings = shard[term]
+                    for doc_id in removed.intersection(postings):
+                        del postings[doc_id]
+                    if not postings:
+                        del shard[term]
+
+        for key in new:
+            fingerprint, load = sources[key]
+            try:
+                documents = load()
+            except Exception:
+                documents = []
+            ids = []
+            for doc in documents:
+                doc_id = len(self.docs)
+                self.docs.append(
+                    [
+                        doc["name"],
+                        doc["type"],
+                        doc["source"],
+                        doc["description"],
+                        doc["installs"],
+                        doc["len"],
+                    ]
+                )
+                for term, tf in doc["tf"].items():
+                    self.postings[_shard(term)].setdefault(term, {})[str(doc_id)] = tf
+                ids.append(doc_id)
+            self.sources[key] = {"fp": fingerprint, "docs": ids}
+
+        if self.docs.count(None) * 2 > len(self.docs):
+            self._compact()
+        self.dirty = True
+        return len(stale) + len(new)
+
+    def _compact(self) -> None:
+        """Renumbers the live documents to drop the ids of removed ones."""
+        mapping = {}
+        docs = []
+        for doc_id, doc in enumerate(self.docs):
+            if doc is not None:
+                mapping[doc_id] = len(docs)
+                docs.append(doc)
+        self.docs = docs
+        for entry in self.sources.values():
+            entry["docs"] = [mapping[doc_id] for doc_id in entry["docs"]]
+        for shard in self.postings.values():
+            for term, postings in shard.items():
+                shard[term] = {
+                    str(mapping[int(doc_id)]): tf for doc_id, tf in postings.items()
+                }
+
+    def save(self) -> None:
+        """Writes the index if it changed. Failures are ignored.
+
+        Shards are written before the metadata, so a concurrent reader sees
+        at worst postings of documents it does not know yet (skipped).
+        """
+        if not self.dirty:
+            return
+        try:
+            if self.make_dir:
+                self.make_dir(self.path.parent)
+            self.path.mkdir(parents=True, exist_ok=True)
+            for shard, terms in self.postings.items():
+                _write_json(self.path / f"terms-{shard:02d}.json", terms)
+            generation = os.urandom(8).hex()
+            _write_json(
+                self.path / META_FILE,
+                {
+                    "version": INDEX_VERSION,
+                    "generation": generation,
+                    "shards": SHARDS,
+                    "sources": self.sources,
+                    "docs": self.docs,
+                },
+            )
+            self.generation = generation
+            self.dirty = False
+        except OSError:
+            pass
+
+    def matches(self, term: str) -> dict[str, int]:
+        """Doc id -> term frequency for every document containing `term`."""
+        return self._postings(_shard(term)).get(term, {})
+
+    def live_docs(self) -> list[list]:
+        return [doc for doc in self.docs if doc is not None]
+
+
+def open_global_index() -> SearchIndex:
+    """The blueprint and registry index, brought up to date."""
+    index = SearchIndex(global_index_path())
+    index.update({**blueprint_sources(), **registry_sources()})
+    index.save()
+    return index
+
+
+def global_index_path() -> Path:
+    from .settings import get_cache_dir
+
+    return get_cache_dir() / "index" / INDEX_DIR
+
+
+def project_index_path(root: Path) -> Path:
+    from .syncer import BASE_DIR, CACHE_DIR
+
+    return root / BASE_DIR / CACHE_DIR / INDEX_DIR
+
+
+def rank(indexes: list[SearchIndex], query: str, limit: int = 50) -> list[tuple]:
+    """Ranks the documents of one or more indexes against a query with BM25.
+
+    Corpus statistics (document count, average length, document frequency)
+    are computed over all indexes together, so their scores are comparable.
+
+    Returns:
+        Up to `limit` (score, doc) pairs, best first, where doc is
+        [name, type, source, description, installs, length]. Documents
+        matching no query term are left out.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms:
+        return []
+
+    live = [index.live_docs() for index in indexes]
+    n = sum(len(docs) for docs in live)
+    if not n:
+        return []
+    avgdl = sum(doc[5] for docs in live for doc in docs) / n or 1.0
+
+    matches = {
+        term: [(index, index.matches(term)) for index in indexes] for term in terms
+    }
+    scores: dict[tuple[int, str], float] = {}
+    for term, per_index in matches.items():
+        df = sum(len(postings) for _, postings in per_index)
+        if not df:
+            continue
+        idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        for position, (index, postings) in enumerate(per_index):
+            for doc_id, tf in postings.items():
+                doc = index.docs[int(doc_id)] if int(doc_id) < len(index.docs) else None
+                if doc is None:
+                    continue
+                norm = K1 * (1 - B + B * doc[5] / avgdl)
+                key = (position, doc_id)
+                scores[key] = scores.get(key, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+    best = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [
+        (score, indexes[position].docs[int(doc_id)])
+        for (position, doc_id), score in best
+    ]
+
+
+def search_local(query: str, root: Path | None = None, limit: int = 50) -> list[dict]:
+    """Searches bundled blueprints, cached registry skills and (if `root` has
+    a .agent/ directory) the project's own assets, updating the indexes first.
+
+    Returns:
+        List of dicts with keys: name, type, description, install_count,
+        score, source ("blueprints", "skyll" or "project").
+    """
+    indexes = [open_global_index()]
+
+    if root is not None and (root / ".agent").is_dir():
+        from .syncer import make_cache_dir
+
+        project_index = SearchIndex(project_index_path(root), make_cache_dir)
+        project_index.update(project_sources(root))
+        project_index.save()
+        indexes.append(project_index)
+
+    results = []
+    seen = set()
+    # The same registry skill is usually cached by several queries
+    for score, (name, asset_type, source, description, installs, _) in rank(
+        indexes, query, limit=limit * 4
+    ):
+        identity = (source, asset_type, name.lower())
+        if identity in seen:
+            continue
+        seen.add(identity)
+        results.append(
+            {
+                "name": name,
+                "type": asset_type,
+                "description": description or "No description",
+                "install_count": installs,
+                "score": score,
+                "source": source,
+            }
+        )
+        if len(results) >= limit:
+            break
+    return results
@@ -0,0 +1,305 @@
+"""
+Lockfile of the assets added with `ulkan add` (`.agent/ulkan.lock`).
+
+Each entry records where an asset came from and the SHA-256 of every file it
+installed, so `ulkan install --frozen` can restore exactly those files:
+
+    {
+      "version": 1,
+      "assets": {
+        "skill:react": {
+          "type": "skill",
+          "name": "react",
+          "source": "skyll",                 # or "blueprints"
+          "title": "react-best-practices",   # resolved Skyll record
+          "query": "react",
+          "fetched_at": "2026-01-01T12:00:00Z",
+          "files": {".agent/skills/react/SKILL.md": "<sha256>"}
+        }
+      }
+    }
+
+Restoring looks for each file's content locally first (the shared asset
+store, the bundled blueprints, cached Skyll responses) and only then fetches
+the missing registry skills concurrently. Every file is verified against its
+locked hash before it is written. Files that exist but differ from the lock
+(e.g. a workflow edited by the user) are reported as drift and only
+overwritten on request (`ulkan install --force`).
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+LOCK_FILE = ".agent/ulkan.lock"
+LOCK_VERSION = 1
+
+# Results requested when re-resolving a skill, so the locked record is found
+# even if it is no longer the top hit for its query
+RESOLVE_LIMIT = 10
+
+
+def lock_path(root: Path) -> Path:
+    return root / LOCK_FILE
+
+
+def load_lock(root: Path) -> dict:
+    """Returns the project's lock ({"version", "assets"}), empty if missing."""
+    try:
+        data = json.loads(lock_path(root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+    if not isinstance(data, dict) or not isinstance(data.get("assets"), dict):
+        return {"version": LOCK_VERSION, "assets": {}}
+    return data
+
+
+def save_lock(root: Path, lock: dict) -> None:
+    """Writes the lock with sorted keys, so diffs stay small and stable."""
+    lock_path(root).write_text(
+        json.dumps(lock, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: Path) -> str | None:
+    try:
+        return sha256_bytes(path.read_bytes())
+    except OSError:
+        return None
+
+
+def asset_key(asset_type: str, name: str) -> str:
+    return f"{asset_type}:{name}"
+
+
+def make_entry(
+    root: Path, asset_type: str, name: str, source: str, files: list[Path], **extra
+) -> dict:
+    """Builds a lock entry, hashing the installed files on disk.
+
+    Args:
+        root: Project root.
+        asset_type: 'skill', 'workflow', 'rule' or 'tool'.
+        name: Name the asset was added as.
+        source: "skyll" or "blueprints".
+        files: Installed files (absolute paths).
+        **extra: Source details (e.g. title and query of a Skyll record).
+    """
+    hashes = {}
+    for path in files:
+        digest = sha256_file(path)
+        if digest:
+            hashes[path.relative_to(root).as_posix()] = digest
+    return {
+        "type": asset_type,
+        "name": name,
+        "source": source,
+        "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "files": hashes,
+        **extra,
+    }
+
+
+def record(root: Path, entries: list[dict]) -> None:
+    """Adds or replaces entries in the lock (one read and one write)."""
+    if not entries:
+        return
+    lock = load_lock(root)
+    for entry in entries:
+        lock["assets"][asset_key(entry["type"], entry["name"])] = entry
+    lock["version"] = LOCK_VERSION
+    save_lock(root, lock)
+
+
+# --- Restore ---------------------------------------------------------------
+
+
+def _blueprint_contents() -> dict[str, str]:
+    """SHA-256 -> blueprint path (relative to blueprints/) from the manifest."""
+    from .manifest import load_manifest
+
+    return {entry["sha256"]: entry["path"] for entry in load_manifest()["files"]}
+
+
+def _local_content(digest: str, blueprints: dict[str, str]) -> bytes | None:
+    """Content with the given hash from the asset store or the blueprints."""
+    from .manifest import BLUEPRINTS_DIR
+    from .store import object_path
+
+    candidates = [object_path(digest)]
+    if digest in blueprints:
+        candidates.append(BLUEPRINTS_DIR / blueprints[digest])
+    for path in candidates:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            continue
+        if sha256_bytes(data) == digest:
+            return data
+    return None
+
+
+def _render_locked(entry: dict, records: list[dict]) -> bytes | None:
+    """Renders the locked SKILL.md from the record titled like the lock."""
+    from .manager import render_skill_record
+
+    for skill in records:
+        if isinstance(skill, dict) and skill.get("title") == entry.get("title"):
+            return render_skill_record(skill, entry["name"])
+    return None
+
+
+def _cached_records(query: str) -> list[dict]:
+    """Skill records of cached responses for a query, whatever their age."""
+    from .manager import SEARCH_CACHE_NAMESPACE, _search_key, _skills_from_payload
+    from .response_cache import load
+
+    records = []
+    for limit in (1, RESOLVE_LIMIT):
+        entry = load(SEARCH_CACHE_NAMESPACE, _search_key(query, limit))
+        if entry is not None:
+            records += _skills_from_payload(entry["data"])
+    return records
+
+
+def restore(root: Path, frozen: bool = True, force: bool = False) -> list[dict]:
+    """Restores the locked assets of a project.
+
+    Files already present with the locked hash are left alone. Missing files
+    are restored from local content (see _local_content, cached Skyll
+    responses) or, for registry skills, from a concurrent re-fetch; every
+    file is verified against its locked hash. Files that differ from the
+    lock are kept and reported, unless `force` is set.
+
+    Args:
+        root: Project root.
+        frozen: Fail assets whose locked content cannot be found or whose
+            files differ from the lock. Otherwise missing assets are added
+            again by name (ulkan add) and re-locked.
+        force: Overwrite files that differ from the lock.
+
+    Returns:
+        One dict per locked asset: {"name", "type", "ok", "source", "detail",
+        "drifted"}, where "drifted" lists the files kept with local changes.
+    """
+    from .store import write_file
+
+    assets = load_lock(root)["assets"]
+    blueprints = _blueprint_contents()
+    results = {}
+    unresolved = {}  # key -> {rel path: digest} still missing
+    fetch_errors = {}  # key -> SkyllError of its re-fetch
+    drifted = {}  # key -> files that differ from the lock, kept as they are
+    replaced = {}  # key -> files that differed from the lock, overwritten
+
+    for key, entry in assets.items():
+        missing = {}
+        restored = 0
+        for rel, digest in entry.get("files", {}).items():
+            path = root / rel
+            current = sha256_file(path)
+            if current == digest:
+                continue
+            if current is not None:
+                if not force:
+                    drifted.setdefault(key, []).append(rel)
+                    continue
+                replaced.setdefault(key, []).append(rel)
+            data = _local_content(digest, blueprints)
+            if data is None and entry.get("source") == "skyll":
+                data = _render_locked(entry, _cached_records(entry.get("query", "")))
+                if data is not None and sha256_bytes(data) != digest:
+                    data = None
+            if data is None:
+                missing[rel] = digest
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_file(root, path, data)
+            restored += 1
+        if missing:
+            unresolved[key] = missing
+        results[key] = restored
+
+    # Registry skills not available locally: fetch them concurrently
+    queries = {
+        assets[key].get("query", ""): key
+        for key in unresolved
+        if assets[key].get("source") == "skyll"
+    }
+    if queries:
+        from .manager import fetch_skills_many
+
+        fetched = fetch_skills_many(list(queries), limit=RESOLVE_LIMIT)
+        for query, records in fetched.items():
+            key = queries[query]
+            if isinstance(records, Exception):
+                fetch_errors[key] = records
+                continue
+            data = _render_locked(assets[key], records)
+            if data is None:
+                continue
+            for rel, digest in list(unresolved[key].items()):
+                if sha256_bytes(data) != digest:
+                    continue
+                path = root / rel
+                path.parent.mkdir(parents=True, exist_ok=True)
+                write_file(root, path, data)
+                results[key] += 1
+                del unresolved[key][rel]
+            if not unresolved[key]:
+                del unresolved[key]
+
+    report = []
+    for key, entry in assets.items():
+        item = {
+            "name": entry["name"],
+            "type": entry["type"],
+            "source": entry["source"],
+            "drifted": drifted.get(key, []),
+        }
+        if key not in unresolved:
+            restored = results[key]
+            item["ok"] = not (frozen and key in drifted)
+            item["detail"] = (
+                f"{restored} file(s) restored" if restored else "up to date"
+            )
+            if key in replaced:
+                item[
+                    "detail"
+                ] += f", replaced local changes: {', '.join(replaced[key])}"
+            if key in drifted:
+                item["detail"] = (
+                    f"modified locally, kept: {', '.join(drifted[key])}"
+                    + (f" ({item['detail']})" if restored else "")
+                )
+        else:
+            reason = fetch_errors.get(key, "changed upstream or offline")
+            item["ok"] = False
+            item["detail"] = f"locked content not found ({reason}): " + ", ".join(
+                unresolved[key]
+            )
+        report.append(item)
+
+    if not frozen and unresolved:
+        from .manager import add_assets
+
+        by_type: dict[str, list[str]] = {}
+        for key in unresolved:
+            by_type.setdefault(assets[key]["type"], []).append(assets[key]["name"])
+        readded = {}
+        for asset_type, names in by_type.items():
+            for result in add_assets(asset_type, names, root):
+                readded[(asset_type, result["name"])] = result
+        for item in report:
+            result = readded.get((item["type"], item["name"]))
+            if result:
+                item.update(result)
+                if result["ok"]:
+                    item["detail"] = f"re-resolved: {result['detail']}"
+
+    return report
@@ -1,119 +1,326 @@
-import shutil
 from pathlib import Path
 from typing import List
 
-from .generator import get_package_path, copy_resource_file
+from .settings import get_float, get_int
 from .styles import console
 
-BLUEPRINTS_PKG = "ulkan.blueprints"
-
 
 def list_assets(asset_type: str) -> List[str]:
     """Lists available assets of a given type from the blueprints.
 
+    Reads the precomputed blueprint manifest instead of walking the
+    blueprints directory.
+
     Args:
         asset_type: One of 'skills', 'workflows', 'rules', 'tools'.
 
     Returns:
         List of asset names.
     """
-    blueprints_root = get_package_path(BLUEPRINTS_PKG)
-    asset_dir = blueprints_root / asset_type
+    from .manifest import list_asset_names
+
+    return list_asset_names(asset_type)
+
+
+# Search response cache (see response_cache.py). Fresh entries are served
+# directly; stale ones are served while a background request revalidates them.
+SEARCH_CACHE_NAMESPACE = "search"
+DEFAULT_SEARCH_CACHE_TTL = 60 * 60  # seconds an entry is fresh
+DEFAULT_SEARCH_CACHE_STALE = 7 * 24 * 60 * 60  # seconds it may be served stale
+DEFAULT_SEARCH_CACHE_MAX_BYTES = 20 * 1024 * 1024
+DEFAULT_ADD_CONCURRENCY = 8  # parallel downloads of `ulkan add` with many names
+REVALIDATE_JOIN = 0.25  # seconds a background revalidation may delay exit
+
+
+def _store_search(key: str, query: str, limit: int, data: dict) -> None:
+    from .response_cache import store
+
+    store(
+        SEARCH_CACHE_NAMESPACE,
+        key,
+        data,
+        max_bytes=get_int("search_cache_max_bytes", DEFAULT_SEARCH_CACHE_MAX_BYTES),
+        q=query,
+        limit=limit,
+    )
 
-    if not asset_dir.exists():
-        return []
 
-    assets = []
+def _revalidate_search(key: str, query: str, limit: int) -> None:
+    """Refreshes a stale cache entry (runs in a background thread)."""
+    from .skyll import search
 
-    if asset_type == "tools":
-        # Tools have categories: tools/scripts/name.py, tools/mcp/name
-        for category in asset_dir.iterdir():
-            if category.is_dir():
-                for item in category.iterdir():
-                    if item.is_file() or item.is_dir():  # script or mcp folder
-                        assets.append(f"{category.name}/{item.name}")
-    else:
-        # Skills are dirs, Workflows/Rules are .md files
-        for item in asset_dir.iterdir():
-            if asset_type == "skills" and item.is_dir():
-                assets.append(item.name)
-            elif (
-                asset_type in ["workflows", "rules"]
-                and item.suffix == ".md"
-                and item.name != "README.md"
-            ):
-                assets.append(item.stem)  # 'feat.md' -> 'feat'
+    try:
+        _store_search(key, query, limit, search(query, limit, deadline=3.0))
+    except Exception:
+        pass
+
+
+def _start_revalidation(key: str, query: str, limit: int) -> None:
+    """Revalidates a stale entry in a daemon thread.
+
+    At exit the thread gets REVALIDATE_JOIN more seconds to finish; a slow
+    or offline refresh is abandoned and the entry, still stale, is
+    revalidated again on a later search.
+    """
+    import atexit
+    import threading
+
+    from .net import get_client
 
-    return sorted(assets)
+    # Create the shared client first: atexit runs handlers in reverse order,
+    # so it is then closed only after the join below
+    get_client()
+    thread = threading.Thread(
+        target=_revalidate_search,
+        args=(key, query, limit),
+        name="ulkan-search-revalidate",
+        daemon=True,
+    )
+    thread.start()
+    atexit.register(thread.join, REVALIDATE_JOIN)
 
 
-import httpx
-from rich.console import Console
+def _search_key(query: str, limit: int) -> str:
+    from .response_cache import make_key
 
-SKYLL_API_URL = "https://api.skyll.app/search"
+    return make_key(q=query.lower(), limit=limit)
 
 
-def search_assets(query: str, limit: int = 50, sort_by: str = None) -> List[dict]:
-    """Searches for assets using the Skyll API.
+def cached_search(query: str, limit: int, refresh: bool = False) -> dict:
+    """Returns the Skyll search payload, served from the on-disk cache.
+
+    Entries are keyed by the normalized query (case and whitespace) and limit.
+    Within `search_cache_ttl` seconds they are returned without a request.
+    For `search_cache_stale` more seconds they are still returned, while a
+    background thread revalidates them (without delaying exit by more than
+    REVALIDATE_JOIN seconds). The cache is capped at
+    `search_cache_max_bytes`, evicting the least recently used entries.
+
+    Args:
+        query: Search term.
+        limit: Number of results requested.
+        refresh: Skip the cache and always query the API (the result is
+            still cached).
+
+    Raises:
+        SkyllError (see skyll.py) if the request fails and nothing is cached.
+    """
+    from .response_cache import age, load
+    from .skyll import SkyllError, search
+
+    query = " ".join(query.split())
+    key = _search_key(query, limit)
+    entry = None if refresh else load(SEARCH_CACHE_NAMESPACE, key)
+
+    if entry is not None:
+        ttl = get_float("search_cache_ttl", DEFAULT_SEARCH_CACHE_TTL)
+        stale = get_float("search_cache_stale", DEFAULT_SEARCH_CACHE_STALE)
+        if age(entry) <= ttl:
+            return entry["data"]
+        if age(entry) <= ttl + stale:
+            _start_revalidation(key, query, limit)
+            return entry["data"]
+
+    try:
+        data = search(query, limit)
+    except SkyllError as e:
+        if entry is None:
+            raise
+        console.print(f"[warning]{e}; showing cached results.[/warning]")
+        return entry["data"]
+
+    _store_search(key, query, limit, data)
+    return data
+
+
+def fetch_skills(query: str, limit: int = 50, refresh: bool = False) -> List[dict]:
+    """Returns the raw skill records of a Skyll search.
+
+    Records are returned as the API sends them (title, content, metadata,
+    install_count, relevance_score, ...), so callers that need the full
+    content do not have to query again. Served through cached_search.
+
+    Raises:
+        SkyllError (see skyll.py) if the request fails and nothing is cached.
+    """
+    return _skills_from_payload(cached_search(query, limit, refresh=refresh))
+
+
+def _skills_from_payload(data: dict) -> List[dict]:
+    # Skills are either top-level or inside a payload:
+    # { "query": ..., "count": ..., "skills": [...] }
+    skills = data.get("skills", [])
+    if not skills and "payload" in data:
+        skills = data["payload"].get("skills", [])
+    return skills
+
+
+def fetch_skills_many(
+    queries: List[str], limit: int = 1, concurrency: int | None = None
+) -> dict[str, List[dict] | Exception]:
+    """Runs several Skyll searches concurrently.
+
+    Fresh entries of the search cache are used without a request; the other
+    queries are sent through one async client, at most `concurrency` at a
+    time (setting `add_concurrency`, default 8), with the retries, hedging
+    and circuit breaker of skyll.py. A failed request falls back to a stale
+    cache entry when there is one.
+
+    Returns:
+        Query -> raw skill records, or the SkyllError raised for that query.
+    """
+    import asyncio
+
+    from .response_cache import age, load
+
+    ttl = get_float("search_cache_ttl", DEFAULT_SEARCH_CACHE_TTL)
+    stale = get_float("search_cache_stale", DEFAULT_SEARCH_CACHE_STALE)
+    results: dict[str, List[dict] | Exception] = {}
+    pending = {}  # query -> (key, cached entry or None)
+    for query in queries:
+        normalized = " ".join(query.split())
+        key = _search_key(normalized, limit)
+        entry = load(SEARCH_CACHE_NAMESPACE, key)
+        if entry is not None and age(entry) <= ttl:
+            results[query] = _skills_from_payload(entry["data"])
+        else:
+            if entry is not None and age(entry) > ttl + stale:
+                entry = None
+            pending[query] = (normalized, key, entry)
+
+    if not pending:
+        return results
+
+    from .skyll import SkyllError, search_async
+
+    async def fetch_one(client, semaphore, query: str) -> None:
+        normalized, key, entry = pending[query]
+        async with semaphore:
+            try:
+                data = await search_async(client, normalized, limit)
+            except SkyllError as e:
+                results[query] = (
+                    e if entry is None else _skills_from_payload(entry["data"])
+                )
+                return
+        _store_search(key, normalized, limit, data)
+        results[query] = _skills_from_payload(data)
+
+    async def fetch_all() -> None:
+        from .net import async_client
+
+        semaphore = asyncio.Semaphore(
+            max(1, concurrency or get_int("add_concurrency", DEFAULT_ADD_CONCURRENCY))
+        )
+        async with async_client() as client:
+            await asyncio.gather(
+                *(fetch_one(client, semaphore, query) for query in pending)
+            )
+
+    asyncio.run(fetch_all())
+    return results
+
+
+def search_assets(
+    query: str,
+    limit: int = 50,
+    sort_by: str = None,
+    refresh: bool = False,
+    scope: str = "all",
+) -> List[dict]:
+    """Searches for assets locally and/or using the Skyll API.
 
     Args:
         query: Search term.
         limit: Number of results to return (default 50).
         sort_by: Optional sorting criteria ('installs' or 'relevance').
                  Note: API sorts by relevance by default. 'installs' is done client-side.
+        refresh: Bypass the search cache (see cached_search).
+        scope: "local" (offline index of blueprints, cached registry skills
+            and the current project, see index.py), "remote" (Skyll API) or
+            "all" (both merged; scores are scaled to 0-1 per source so they
+            can be compared). If the API fails, "all" warns and returns the
+            local results only.
 
     Returns:
-        List of dicts with keys: name, description, install_count, score, source.
+        List of dicts with keys: name, type, description, install_count,
+        score, source.
+
+    Raises:
+        SkyllError (see skyll.py) if the API fails with scope "remote".
     """
-    try:
-        response = httpx.get(
-            SKYLL_API_URL, params={"q": query, "limit": limit}, timeout=10.0
+    if scope == "remote":
+        return _search_remote(query, limit, sort_by, refresh)
+
+    from .index import search_local
+
+    results = search_local(query, Path.cwd(), limit)
+    if scope == "all":
+        from .skyll import SkyllError
+
+        try:
+            remote = _search_remote(query, limit, None, refresh)
+        except SkyllError as e:
+            console.print(f"[warning]{e}; showing local results only.[/warning]")
+            remote = []
+        # Fresh API results replace cached copies of the same skills
+        fetched = {r["name"].lower() for r in remote}
+        results = [
+            r
+            for r in results
+            if r["source"] != "skyll" or r["name"].lower() not in fetched
+        ]
+        for group in (results, remote):
+            best = max((r["score"] for r in group), default=0) or 1
+            for r in group:
+                r["score"] = r["score"] / best
+        results = sorted(results + remote, key=lambda r: r["score"], reverse=True)
+        results = results[:limit]
+
+    if sort_by == "installs":
+        results.sort(key=lambda x: x["install_count"], reverse=True)
+    return results
+
+
+def _search_remote(
+    query: str, limit: int = 50, sort_by: str = None, refresh: bool = False
+) -> List[dict]:
+    """Searches for skills using the Skyll API (see search_assets)."""
+    skills = fetch_skills(query, limit, refresh=refresh)
+
+    results = []
+    for item in skills:
+        # Extract description from content (first line or truncated)
+        content = item.get("content", "")
+        description = (
+            content.split("\n")[0][:100] + "..." if content else "No description"
         )
-        response.raise_for_status()
-        data = response.json()
-
-        # Determine where the skills list is (top-level or inside payload)
-        # Based on user info: { "query": ..., "count": ..., "skills": [...] }
-        skills = data.get("skills", [])
-        if not skills and "payload" in data:
-            skills = data["payload"].get("skills", [])
-
-        results = []
-        for item in skills:
-            # Extract description from content (first line or truncated)
-            content = item.get("content", "")
-            description = (
-                content.split("\n")[0][:100] + "..." if content else "No description"
-            )
 
-            # If metadata exists, check if it has description
-            if "metadata" in item and isinstance(item["metadata"], dict):
-                meta = item["metadata"]
-                if "description" in meta:
-                    description = meta["description"]
-
-            results.append(
-                {
-                    "name": item.get("title", "Unknown"),
-                    "description": description,
-                    "install_count": item.get("install_count", 0),
-                    "score": item.get("relevance_score", 0),
-                    "source": "skyll",  # Marker to know source
-                }
-            )
-
-        # Client-side sorting if requested
-        if sort_by == "installs":
-            results.sort(key=lambda x: x["install_count"], reverse=True)
-        # Relevance is default from API, but we can enforce it if needed
-        elif sort_by == "relevance":
-            results.sort(key=lambda x: x["score"], reverse=True)
+        # If metadata exists, check if it has description
+        if "metadata" in item and isinstance(item["metadata"], dict):
+            meta = item["metadata"]
+            if "description" in meta:
+                description = meta["description"]
+
+        results.append(
+            {
+                "name": item.get("title", "Unknown"),
+                "type": "skill",
+                "description": description,
+                "install_count": item.get("install_count", 0),
+                "score": item.get("relevance_score", 0),
+                "source": "skyll",  # Marker to know source
+            }
+        )
 
-        return results
+    # Client-side sorting if requested
+    if sort_by == "installs":
+        results.sort(key=lambda x: x["install_count"], reverse=True)
+    # Relevance is default from API, but we can enforce it if needed
+    elif sort_by == "relevance":
+        results.sort(key=lambda x: x["score"], reverse=True)
 
-    except Exception as e:
-        console.print(f"[error]Failed to search Skyll API: {e}[/error]")
-        return []
+    return results
 
 
 def install_skill_from_api(name: str, base_path: Path) -> bool:
@@ -126,95 +333,110 @@ def install_skill_from_api(name: str, base_path: Path) -> bool:
     Returns:
         True if successful.
     """
+    from .skyll import SkyllError
+
     console.print(f"[info]Searching Skyll API for skill '{name}'...[/info]")
 
-    # Search for the skill
-    results = search_assets(name, limit=1)
+    try:
+        # One request returns the full record, content included
+        skills = fetch_skills(name, limit=1)
+    except SkyllError as e:
+        console.print(f"[warning]{e}[/warning]")
+        return False
 
-    if not results:
+    if not skills:
+        console.print(f"[info]No skill named '{name}' in the Skyll API.[/info]")
         return False
 
-    skill_data = results[0]
+    target_skill = skills[0]
 
-    # Verify if it's a reasonable match?
-    # For now, we trust the top result if the user is asking for it.
-    # But we might want to warn if the name is very different.
-    api_title = skill_data["name"]
-    console.print(f"[info]Found: {api_title}[/info]")
+    # Refuse a top hit that does not resemble the requested name
+    from .fuzzy import similarity, threshold
 
-    # We need the full content. The search result MIGHT have it in 'content',
-    # but let's be sure. The search_assets implementation extracts 'content'.
-    # However, 'search_assets' returns a simplified dict.
-    # 'search_assets' currently truncates description.
-    # We need to fetch the FULL content.
-    # The 'search' endpoint returns full content in 'content' field as per user check.
-    # BUT my 'search_assets' function returns a constructed dict with truncated description.
-    # I should modify 'search_assets' OR make a direct call here to get the raw data.
-    # Making a direct call here is safer to get the full content without altering search_assets signature too much.
+    title = target_skill.get("title", name)
+    score = similarity(name, title)
+    if score < threshold():
+        console.print(
+            f"[warning]Best Skyll match '{title}' does not match '{name}' "
+            f"(similarity {score:.2f}), not installing it.[/warning]"
+        )
+        return False
+    console.print(f"[info]Found: {title}[/info]")
 
     try:
-        response = httpx.get(
-            SKYLL_API_URL, params={"q": name, "limit": 1}, timeout=10.0
+        if not target_skill.get("content"):
+            console.print("[error]Skill content is empty![/error]")
+            return False
+
+        skill_file, overwritten = write_skill_record(target_skill, name, base_path)
+        _lock_skills(base_path, {name: (target_skill, skill_file)})
+        if overwritten:
+            console.print(
+                f"[warning]Skill '{skill_file.parent.name}' already existed and was overwritten.[/warning]"
+            )
+        console.print(
+            f"[success]Installed skill '{skill_file.parent.name}' from Skyll API![/success]"
         )
-        response.raise_for_status()
-        data = response.json()
-        skills = data.get("skills", [])
-        if not skills and "payload" in data:
-            skills = data["payload"].get("skills", [])
+        return True
 
-        if not skills:
-            return False
+    except Exception as e:
+        console.print(f"[error]Failed to install from API: {e}[/error]")
+        return False
 
-        target_skill = skills[0]
-        content = target_skill.get("content", "")
 
-        if not content:
-            console.print("[error]Skill content is empty![/error]")
-            return False
+def skill_dir_name(name: str) -> str:
+    """Folder name of a skill installed from the API under the name `name`."""
+    return name.replace(" ", "-").replace("/", "-").lower()
 
-        # Install logic
-        agent_dir = base_path / ".agent"
-        skills_dir = agent_dir / "skills"
 
-        # Use the requested name for the folder to match user expectation/args
-        # sanitize name just in case?
-        safe_name = name.replace(" ", "-").replace("/", "-").lower()
-        target_dir = skills_dir / safe_name
+def write_skill_record(record: dict, name: str, base_path: Path) -> tuple[Path, bool]:
+    """Writes a Skyll skill record as .agent/skills/<name>/SKILL.md.
 
-        if target_dir.exists():
-            console.print(
-                f"[warning]Skill '{safe_name}' already exists. Overwriting...[/warning]"
-            )
-        else:
-            target_dir.mkdir(parents=True, exist_ok=True)
-
-        # Prepare valid YAML frontmatter
-        # We try to fill as much as we can from API data
-        title = target_skill.get("title", name)
-        # Description: clean up newlines for YAML block scalar if needed, or just use string
-        # user requested: description: > ...
-        raw_desc = target_skill.get("description", "")
-        if not raw_desc and "metadata" in target_skill:
-            raw_desc = target_skill["metadata"].get("description", "")
-        if not raw_desc:
-            # Try to take first paragraph of content
-            raw_desc = content.split("\n\n")[0].strip()
-
-        # Clean description for YAML (basic)
-        description = raw_desc.replace('"', '\\"')
-
-        # Author
-        author = "Unknown"
-        if "metadata" in target_skill:
-            author = target_skill["metadata"].get("author", "Unknown")
-
-        # License
-        license_ = "Apache-2.0"  # Default as requested, or fetch if available
-        if "metadata" in target_skill:
-            license_ = target_skill["metadata"].get("license", "Apache-2.0")
-
-        # Construct Frontmatter
-        frontmatter = f"""---
+    Args:
+        record: Raw skill record (see fetch_skills), with non-empty content.
+        name: Requested skill name (used for the folder).
+        base_path: Project root.
+
+    Returns:
+        (path of SKILL.md, whether an existing skill was overwritten)
+    """
+    from .store import write_file
+
+    # Use the requested name for the folder to match user expectation/args
+    target_dir = base_path / ".agent" / "skills" / skill_dir_name(name)
+    overwritten = target_dir.exists()
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    skill_file = target_dir / "SKILL.md"
+    write_file(base_path, skill_file, render_skill_record(record, name))
+    return skill_file, overwritten
+
+
+def render_skill_record(record: dict, name: str) -> bytes:
+    """Renders the SKILL.md of a Skyll skill record: generated frontmatter
+    followed by the record's content. Deterministic for a given record."""
+    content = record.get("content", "")
+    safe_name = skill_dir_name(name)
+
+    # Prepare valid YAML frontmatter
+    # We try to fill as much as we can from API data
+    title = record.get("title", name)
+    raw_desc = record.get("description", "")
+    if not raw_desc and "metadata" in record:
+        raw_desc = record["metadata"].get("description", "")
+    if not raw_desc:
+        # Try to take first paragraph of content
+        raw_desc = content.split("\n\n")[0].strip()
+
+    # Clean description for YAML (basic)
+    description = raw_desc.replace('"', '\\"')
+
+    metadata = record.get("metadata") or {}
+    author = metadata.get("author", "Unknown")
+    license_ = metadata.get("license", "Apache-2.0")
+
+    # Construct Frontmatter
+    frontmatter = f"""---
 name: {safe_name}
 description: >
   {description}
@@ -231,21 +453,67 @@ allowed-tools: *
 
 """
 
-        # Write SKILL.md with frontmatter prepended
-        skill_file = target_dir / "SKILL.md"
-        final_content = frontmatter + content
-        skill_file.write_text(final_content, encoding="utf-8")
+    # SKILL.md is the frontmatter with the content appended
+    return (frontmatter + content).encode("utf-8")
 
-        # NO metadata.json creation (as per user request "envés del metadata") is implicitly done by removing that block.
 
-        console.print(
-            f"[success]Installed skill '{safe_name}' from Skyll API![/success]"
+# Map singular command arg to plural folder name
+ASSET_TYPE_FOLDERS = {
+    "skill": "skills",
+    "workflow": "workflows",
+    "rule": "rules",
+    "tool": "tools",
+}
+
+
+def plan_local_asset(
+    asset_type: str, name: str, base_path: Path
+) -> tuple[list[tuple[Path, Path]], bool, str | None]:
+    """Plans the copy of a blueprint asset into the project.
+
+    Returns:
+        (plan, strict, error): `strict` means the asset only counts as added
+        if a file was created (single-file assets); `error` is set (and the
+        plan empty) if the asset cannot be added.
+    """
+    from .fuzzy import did_you_mean
+    from .generator import plan_blueprint, plan_blueprint_asset
+
+    folder_name = ASSET_TYPE_FOLDERS[asset_type]
+    dest_root = base_path / ".agent" / folder_name
+    not_found = f"{asset_type.capitalize()} '{name}' not found in blueprints."
+
+    # Blueprints are resolved through the precomputed manifest
+    if asset_type == "skill":
+        plan = plan_blueprint_asset("skills", name, dest_root / name)
+        if not plan:
+            return [], False, not_found + did_you_mean(name, asset_type)
+        return plan, False, None
+
+    if asset_type in ["workflow", "rule"]:
+        # These are simple markdown files
+        filename = f"{name}.md"
+        plan = plan_blueprint(f"{folder_name}/{filename}", dest_root / filename)
+        if not plan:
+            return [], True, not_found + did_you_mean(name, asset_type)
+        return plan, True, None
+
+    # Tools: name is expected to be 'category/filename'
+    if len(name.split("/")) < 2:
+        return (
+            [],
+            True,
+            "Tool name must be in format 'category/name' (e.g. scripts/myscript.py)",
         )
-        return True
 
-    except Exception as e:
-        console.print(f"[error]Failed to install from API: {e}[/error]")
-        return False
+    # Single file tool (script) or directory-based tool (like MCP servers)
+    plan = plan_blueprint(f"{folder_name}/{name}", dest_root / name)
+    if plan:
+        return plan, True, None
+    plan = plan_blueprint_asset("tools", name, dest_root / name)
+    if not plan:
+        return [], True, not_found + did_you_mean(name, asset_type)
+    return plan, False, None
 
 
 def add_asset(asset_type: str, name: str, base_path: Path) -> bool:
@@ -259,88 +527,198 @@ def add_asset(asset_type: str, name: str, base_path: Path) -> bool:
     Returns:
         True if successful.
     """
-    blueprints_root = get_package_path(BLUEPRINTS_PKG)
-    agent_dir = base_path / ".agent"
-
-    # Map singular command arg to plural folder name
-    type_map = {
-        "skill": "skills",
-        "workflow": "workflows",
-        "rule": "rules",
-        "tool": "tools",
-    }
-
-    if asset_type not in type_map:
+    if asset_type not in ASSET_TYPE_FOLDERS:
         console.print(f"[error]Unknown asset type: {asset_type}[/error]")
         return False
 
-    folder_name = type_map[asset_type]
-    src_root = blueprints_root / folder_name
-    dest_root = agent_dir / folder_name
-
     # PRIORITY: Check API for skills first (or if local fails? User said "Always search in Skyll")
     # Implication: Try API first. If found, good. If not, try local.
     if asset_type == "skill":
         if install_skill_from_api(name, base_path):
             return True
         # If API failed or yielded no results, fall through to local check
-        console.print(
-            "[info]Skill not found in API or API failed. Checking local registry...[/info]"
-        )
-
-    if asset_type == "skill":
-        src_path = src_root / name
-        dest_path = dest_root / name
-
-        if not src_path.exists():
-            console.print(f"[error]Skill '{name}' not found in blueprints.[/error]")
-            return False
+        console.print("[info]Checking local registry...[/info]")
 
-        # recursive copy
-        for src_file in src_path.rglob("*"):
-            if src_file.is_file():
-                rel_path = src_file.relative_to(src_path)
-                copy_resource_file(src_file, dest_path / rel_path, base_path)
-        return True
-
-    elif asset_type in ["workflow", "rule"]:
-        # These are simple markdown files
-        filename = f"{name}.md"
-        src_path = src_root / filename
-        dest_path = dest_root / filename
+    plan, strict, error = plan_local_asset(asset_type, name, base_path)
+    if error:
+        console.print(f"[error]{error}[/error]")
+        return False
 
-        if not src_path.exists():
-            console.print(
-                f"[error]{asset_type.capitalize()} '{name}' not found in blueprints.[/error]"
+    from .generator import materialize, print_materialize_summary
+    from .store import link_mode
+
+    result = materialize(plan, link_mode=link_mode(base_path))
+    print_materialize_summary(result, base_path)
+    success = bool(result["created"]) if strict else True
+    if success:
+        _lock_blueprints(base_path, asset_type, {name: plan})
+    return success
+
+
+def _lock_skills(base_path: Path, installed: dict[str, tuple[dict, Path]]) -> None:
+    """Records skills installed from the API (name -> (record, SKILL.md))."""
+    from .lock import make_entry, record
+
+    record(
+        base_path,
+        [
+            make_entry(
+                base_path,
+                "skill",
+                name,
+                "skyll",
+                [path],
+                title=skill.get("title", name),
+                query=name,
             )
-            return False
+            for name, (skill, path) in installed.items()
+        ],
+    )
+
+
+def _lock_blueprints(base_path: Path, asset_type: str, plans: dict) -> None:
+    """Records blueprint assets (name -> materialized plan) in the lockfile."""
+    from . import __version__
+    from .lock import make_entry, record
+
+    record(
+        base_path,
+        [
+            make_entry(
+                base_path,
+                asset_type,
+                name,
+                "blueprints",
+                [dest for _, dest in plan],
+                ulkan_version=__version__,
+            )
+            for name, plan in plans.items()
+        ],
+    )
 
-        return copy_resource_file(src_path, dest_path, base_path)
 
-    elif asset_type == "tool":
-        # Name is expected to be 'category/filename'
-        parts = name.split("/")
-        if len(parts) < 2:
-            console.print(
-                f"[error]Tool name must be in format 'category/name' (e.g. scripts/myscript.py)[/error]"
-            )
-            return False
+def add_assets(asset_type: str, names: List[str], base_path: Path) -> List[dict]:
+    """Adds several assets at once; one failure never aborts the others.
 
-        src_path = src_root / name
-        dest_path = dest_root / name
+    Skills are looked up in the Skyll API concurrently (see fetch_skills_many)
+    and written in parallel; names the API does not know fall back to the
+    blueprints. Blueprint assets are copied in a single materialize pass.
 
-        if not src_path.exists():
-            console.print(f"[error]Tool '{name}' not found in blueprints.[/error]")
-            return False
+    Args:
+        asset_type: One of 'skill', 'workflow', 'rule', 'tool'. (Singular)
+        names: Asset names (duplicates are ignored).
+        base_path: Project root.
 
-        if src_path.is_dir():
-            # Recursive copy for directory-based tools (like MCP servers)
-            for src_file in src_path.rglob("*"):
-                if src_file.is_file():
-                    rel_path = src_file.relative_to(src_path)
-                    copy_resource_file(src_file, dest_path / rel_path, base_path)
-            return True
-        else:
-            return copy_resource_file(src_path, dest_path, base_path)
+    Returns:
+        One dict per name, in order: {"name", "ok", "source", "detail"} where
+        source is "api" or "blueprints" (None if the asset was not found).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    names = list(dict.fromkeys(names))
+    if asset_type not in ASSET_TYPE_FOLDERS:
+        return [
+            {
+                "name": n,
+                "ok": False,
+                "source": None,
+                "detail": f"Unknown asset type: {asset_type}",
+            }
+            for n in names
+        ]
+
+    results = {}
+    unresolved = {}  # name -> why the API did not provide it
+    local = list(names)
+
+    if asset_type == "skill":
+        from .fuzzy import similarity, threshold
+
+        fetched = fetch_skills_many(names, limit=1)
+        records = {}
+        for n, found in fetched.items():
+            if isinstance(found, Exception):
+                unresolved[n] = f"{found}."
+            elif not found or not found[0].get("content"):
+                continue
+            # Refuse top hits that do not resemble the requested name
+            elif similarity(n, found[0].get("title", "")) < threshold():
+                title = found[0].get("title", "")
+                unresolved[n] = f"Best Skyll match '{title}' does not match."
+            else:
+                records[n] = found[0]
+
+        written = {}
+
+        def write(name: str) -> dict:
+            try:
+                path, overwritten = write_skill_record(records[name], name, base_path)
+            except OSError as e:
+                return {"name": name, "ok": False, "source": "api", "detail": str(e)}
+            written[name] = (records[name], path)
+            detail = str(path.relative_to(base_path))
+            if overwritten:
+                detail += " (overwritten)"
+            return {"name": name, "ok": True, "source": "api", "detail": detail}
+
+        workers = max(
+            1, min(len(records), get_int("add_concurrency", DEFAULT_ADD_CONCURRENCY))
+        )
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(write, records):
+                results[result["name"]] = result
+        _lock_skills(base_path, written)
+        local = [n for n in names if n not in records]
+
+    # Plan every blueprint asset, then copy them all in one pass
+    plans = {}
+    combined = []
+    for name in local:
+        plan, strict, error = plan_local_asset(asset_type, name, base_path)
+        if error:
+            if name in unresolved:
+                error = f"{unresolved[name]} {error}"
+            results[name] = {
+                "name": name,
+                "ok": False,
+                "source": None,
+                "detail": error,
+            }
+            continue
+        plans[name] = (plan, strict)
+        combined += plan
+
+    if combined:
+        from .generator import materialize
+        from .store import link_mode
+
+        outcome = materialize(combined, link_mode=link_mode(base_path))
+        created = set(outcome["created"])
+        skipped = set(outcome["skipped"])
+        errors = outcome["errors"]
+        for name, (plan, strict) in plans.items():
+            dests = [dest for _, dest in plan]
+            n_created = sum(dest in created for dest in dests)
+            n_skipped = sum(dest in skipped for dest in dests)
+            ok = bool(n_created) if strict else n_created + n_skipped == len(dests)
+            if ok:
+                detail = f"{n_created} file(s) created"
+                if n_skipped:
+                    detail += f", {n_skipped} already present"
+            elif strict and n_skipped:
+                detail = "already exists"
+            else:
+                detail = "; ".join(errors) or "copy failed"
+            results[name] = {
+                "name": name,
+                "ok": ok,
+                "source": "blueprints",
+                "detail": detail,
+            }
+        _lock_blueprints(
+            base_path,
+            asset_type,
+            {name: plans[name][0] for name in plans if results[name]["ok"]},
+        )
 
-    return False
+    return [results[name] for name in names]
@@ -0,0 +1,176 @@
+"""Precomputed manifest of the bundled blueprints.
+
+The manifest lists every blueprint file with its asset type, asset name,
+relative path, size, SHA-256 and parsed frontmatter. It is generated at build
+time by the hatch build hook (`hatch_build.py`) and shipped inside the wheel
+as `ulkan/blueprints/manifest.json`, so listing or resolving blueprints is a
+single small file read instead of a directory walk.
+
+In a source checkout (including editable installs, where the build hook
+writes the manifest into src/), blueprints may change after the manifest was
+generated. The manifest therefore records a fingerprint of the blueprint
+files' paths, sizes and mtimes; from a checkout it is compared on load (a
+stat per file, no reads) and the manifest is rebuilt in memory if it is
+stale. Installed wheels trust the shipped manifest.
+
+Regenerate it manually with:
+    python -m ulkan.manifest
+
+This module only depends on the standard library so the build hook can
+import it without Ulkan's runtime dependencies installed.
+"""
+
+import hashlib
+import json
+from functools import cache
+from pathlib import Path
+
+from .frontmatter import read_frontmatter
+
+BLUEPRINTS_DIR = Path(__file__).parent / "blueprints"
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+ASSET_TYPES = ["skills", "workflows", "rules", "tools"]
+
+# Files under blueprints/ that are packaging artifacts, not blueprints
+EXCLUDED_NAMES = {"__init__.py", MANIFEST_FILE}
+EXCLUDED_DIRS = {"__pycache__"}
+
+
+def _asset_name(parts: tuple[str, ...]) -> str | None:
+    """Maps a blueprint path (split into parts) to its asset name.
+
+    skills/<name>/...             -> <name>
+    workflows/<name>.md           -> <name>   (README.md excluded)
+    rules/<name>.md               -> <name>   (README.md excluded)
+    tools/<category>/<item>[/...] -> <category>/<item>
+    """
+    asset_type = parts[0]
+    if asset_type == "skills" and len(parts) >= 3:
+        return parts[1]
+    if asset_type in ["workflows", "rules"] and len(parts) == 2:
+        name = parts[1]
+        if name.endswith(".md") and name != "README.md":
+            return name[: -len(".md")]
+    if asset_type == "tools" and len(parts) >= 3:
+        return f"{parts[1]}/{parts[2]}"
+    return None
+
+
+def _blueprint_files(blueprints_root: Path) -> list[tuple[Path, Path]]:
+    """(path, relative path) of every blueprint file, sorted."""
+    files = []
+    for path in sorted(blueprints_root.rglob("*")):
+        rel = path.relative_to(blueprints_root)
+        if (
+            path.is_file()
+            and path.name not in EXCLUDED_NAMES
+            and path.suffix != ".pyc"
+            and not EXCLUDED_DIRS.intersection(rel.parts)
+        ):
+            files.append((path, rel))
+    return files
+
+
+def fingerprint(blueprints_root: Path = BLUEPRINTS_DIR) -> str:
+    """Digest of the blueprint files' paths, sizes and mtimes (no reads)."""
+    digest = hashlib.sha256()
+    for path, rel in _blueprint_files(blueprints_root):
+        st = path.stat()
+        digest.update(f"{rel.as_posix()}\0{st.st_size}\0{st.st_mtime_ns}\0".encode())
+    return digest.hexdigest()
+
+
+def build_manifest(blueprints_root: Path = BLUEPRINTS_DIR) -> dict:
+    """Walks the blueprints directory and builds the manifest dict."""
+    files = []
+    for path, rel in _blueprint_files(blueprints_root):
+        data = path.read_bytes()
+        entry = {
+            "path": rel.as_posix(),
+            "type": rel.parts[0] if len(rel.parts) > 1 else "root",
+            "asset": _asset_name(rel.parts),
+            "size": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "frontmatter": None,
+        }
+        if path.suffix == ".md":
+            entry["frontmatter"] = read_frontmatter(path)
+        files.append(entry)
+
+    return {
+        "version": MANIFEST_VERSION,
+        "fingerprint": fingerprint(blueprints_root),
+        "files": files,
+    }
+
+
+def write_manifest(blueprints_root: Path = BLUEPRINTS_DIR) -> Path:
+    """Builds the manifest and writes it next to the blueprints."""
+    target = blueprints_root / MANIFEST_FILE
+    manifest = build_manifest(blueprints_root)
+    target.write_text(
+        json.dumps(manifest, indent=1, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    return target
+
+
+def is_source_checkout() -> bool:
+    """True when running from the source tree (src/ulkan), not a wheel."""
+    return (BLUEPRINTS_DIR.parents[2] / "pyproject.toml").is_file()
+
+
+@cache
+def load_manifest() -> dict:
+    """Loads the shipped manifest.
+
+    Builds it in memory instead when it is missing, has another format
+    version or, in a source checkout, no longer matches the blueprint files
+    (see fingerprint).
+    """
+    try:
+        manifest = json.loads(
+            (BLUEPRINTS_DIR / MANIFEST_FILE).read_text(encoding="utf-8")
+        )
+        if manifest.get("version") == MANIFEST_VERSION and (
+            not is_source_checkout() or manifest.get("fingerprint") == fingerprint()
+        ):
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return build_manifest()
+
+
+@cache
+def _entries_by_path() -> dict[str, dict]:
+    return {entry["path"]: entry for entry in load_manifest()["files"]}
+
+
+def get_entry(rel_path: str) -> dict | None:
+    """Returns the manifest entry for a blueprint path (e.g. 'workflows/feat.md')."""
+    return _entries_by_path().get(rel_path)
+
+
+def list_asset_names(asset_type: str) -> list[str]:
+    """Returns the sorted asset names of a type ('skills', 'workflows', ...)."""
+    return sorted(
+        {
+            entry["asset"]
+            for entry in load_manifest()["files"]
+            if entry["type"] == asset_type and entry["asset"]
+        }
+    )
+
+
+def asset_files(asset_type: str, name: str) -> list[dict]:
+    """Returns the manifest entries of every file belonging to an asset."""
+    return [
+        entry
+        for entry in load_manifest()["files"]
+        if entry["type"] == asset_type and entry["asset"] == name
+    ]
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_manifest()}")
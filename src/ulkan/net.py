@@ -0,0 +1,124 @@
+"""Shared HTTP client for all of Ulkan's network calls.
+
+A single process-wide `httpx.Client` keeps connections alive between
+requests, so a command that talks to PyPI or the Skyll API several times
+pays for the TCP+TLS handshake once.
+
+Settings (see settings.py):
+    http_timeout          Read/write/pool timeout in seconds (default 10)
+    http_connect_timeout  Connect timeout in seconds (default 5)
+    http2                 Use HTTP/2 when the `h2` package is installed (default true)
+    http_proxy            Proxy URL; otherwise HTTPS_PROXY / ALL_PROXY are
+                          honored, with NO_PROXY hosts connecting directly
+
+Requests are not retried here: skyll.py retries and hedges Skyll searches
+itself, and transport retries underneath would multiply its attempts.
+"""
+
+import atexit
+import threading
+
+from . import __version__
+from .settings import get_bool, get_float, get_setting
+
+USER_AGENT = f"ulkan/{__version__}"
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_CONNECT_TIMEOUT = 5.0
+MAX_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 30.0
+
+_lock = threading.Lock()
+_client = None
+
+
+def http2_enabled() -> bool:
+    """HTTP/2 is used when enabled and the optional `h2` package is present."""
+    import importlib.util
+
+    return get_bool("http2", True) and importlib.util.find_spec("h2") is not None
+
+
+def get_proxy() -> str | None:
+    """Proxy URL from the `http_proxy` setting or the standard environment."""
+    import urllib.request
+
+    proxies = urllib.request.getproxies()
+    return get_setting("http_proxy") or proxies.get("https") or proxies.get("all")
+
+
+def _no_proxy_hosts() -> list[str]:
+    import urllib.request
+
+    no_proxy = urllib.request.getproxies().get("no", "")
+    return [h.strip().lstrip(".") for h in no_proxy.split(",") if h.strip()]
+
+
+def _options(async_: bool = False) -> dict:
+    """Keyword arguments for httpx.Client / httpx.AsyncClient."""
+    import httpx
+
+    transport_cls = httpx.AsyncHTTPTransport if async_ else httpx.HTTPTransport
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+    def transport(proxy: str | None):
+        return transport_cls(
+            http2=http2_enabled(),
+            limits=limits,
+            proxy=proxy,
+        )
+
+    # A custom transport disables httpx's own environment proxy handling,
+    # so proxies (and NO_PROXY exceptions) are mounted explicitly.
+    proxy = get_proxy()
+    mounts = {}
+    if proxy:
+        direct = transport(None)
+        for host in _no_proxy_hosts():
+            if host == "*":
+                proxy = None
+                break
+            mounts[f"all://{host}"] = direct
+            mounts[f"all://*.{host}"] = direct
+
+    return {
+        "timeout": httpx.Timeout(
+            get_float("http_timeout", DEFAULT_TIMEOUT),
+            connect=get_float("http_connect_timeout", DEFAULT_CONNECT_TIMEOUT),
+        ),
+        "headers": {"User-Agent": USER_AGENT},
+        "follow_redirects": True,
+        "transport": transport(proxy),
+        "mounts": mounts or None,
+    }
+
+
+def get_client():
+    """Returns the process-wide pooled httpx.Client (created on first use).
+
+    Thread safe: the client may be shared by background threads (e.g. the
+    update check) and the main thread.
+    """
+    global _client
+    with _lock:
+        if _client is None or _client.is_closed:
+            import httpx
+
+            _client = httpx.Client(**_options())
+            atexit.register(_client.close)
+        return _client
+
+
+def async_client():
+    """Returns a new httpx.AsyncClient configured like get_client().
+
+    Async clients are bound to an event loop, so each caller creates (and
+    closes) its own: `async with async_client() as client: ...`.
+    """
+    import httpx
+
+    return httpx.AsyncClient(**_options(async_=True))
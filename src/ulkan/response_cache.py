@@ -0,0 +1,94 @@
+"""On-disk cache for API responses.
+
+Entries live in `<cache dir>/<namespace>/<key>.json` as
+`{"fetched_at": float, "request": {...}, "data": ...}`. A file's mtime records
+when it was last used, so eviction can drop the least recently used entries
+once the namespace grows past its size cap.
+
+All operations fail silently: a broken cache only costs a network request.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from .settings import get_cache_dir
+
+
+def namespace_dir(namespace: str) -> Path:
+    return get_cache_dir() / namespace
+
+
+def make_key(**request) -> str:
+    """Stable key for a request (e.g. make_key(q="react", limit=50))."""
+    payload = json.dumps(request, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def load(namespace: str, key: str) -> dict | None:
+    """Returns the cached entry and marks it as recently used."""
+    path = namespace_dir(namespace) / f"{key}.json"
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or not isinstance(
+        entry.get("fetched_at"), (int, float)
+    ):
+        return None
+    return entry
+
+
+def age(entry: dict) -> float:
+    """Seconds since the entry was fetched."""
+    return time.time() - entry["fetched_at"]
+
+
+def store(namespace: str, key: str, data, max_bytes: int | None = None, **request):
+    """Atomically writes an entry, then evicts down to max_bytes if given."""
+    directory = namespace_dir(namespace)
+    target = directory / f"{key}.json"
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    entry = {"fetched_at": time.time(), "request": request, "data": data}
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return
+    if max_bytes is not None:
+        evict(namespace, max_bytes)
+
+
+def evict(namespace: str, max_bytes: int) -> int:
+    """Deletes least recently used entries until the namespace fits max_bytes.
+
+    Returns:
+        Number of entries removed.
+    """
+    entries = []
+    try:
+        with os.scandir(namespace_dir(namespace)) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return 0
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
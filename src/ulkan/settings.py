@@ -0,0 +1,145 @@
+"""User settings and cache locations for Ulkan.
+
+Settings are looked up in this order:
+    1. Environment variable ``ULKAN_<KEY>`` (e.g. ``ULKAN_UPDATE_CHECK=0``)
+    2. For project settings (get_project_setting), the project config file
+       ``.agent/ulkan.toml`` (e.g. ``link_mode = "hardlink"``)
+    3. User config file ``<config dir>/config.toml`` (e.g. ``update_check = false``)
+    4. The default passed by the caller
+"""
+
+import os
+import sys
+from functools import cache
+from pathlib import Path
+
+ENV_PREFIX = "ULKAN_"
+CONFIG_FILE = "config.toml"
+PROJECT_CONFIG_FILE = ".agent/ulkan.toml"
+
+TRUE_VALUES = {"1", "true", "yes", "on"}
+FALSE_VALUES = {"0", "false", "no", "off"}
+
+
+def _user_dir(env_var: str, xdg_var: str, fallback: Path) -> Path:
+    """Resolves a per-user directory honoring overrides and XDG variables."""
+    if os.environ.get(env_var):
+        return Path(os.environ[env_var]).expanduser()
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "ulkan"
+    if os.environ.get(xdg_var):
+        return Path(os.environ[xdg_var]).expanduser() / "ulkan"
+    return fallback / "ulkan"
+
+
+def get_config_dir() -> Path:
+    """Directory holding the user config file (override: ULKAN_CONFIG_DIR)."""
+    return _user_dir("ULKAN_CONFIG_DIR", "XDG_CONFIG_HOME", Path.home() / ".config")
+
+
+def get_cache_dir() -> Path:
+    """Directory for Ulkan's disk caches (override: ULKAN_CACHE_DIR)."""
+    fallback = Path.home() / ".cache"
+    if sys.platform == "darwin":
+        fallback = Path.home() / "Library" / "Caches"
+    return _user_dir("ULKAN_CACHE_DIR", "XDG_CACHE_HOME", fallback)
+
+
+@cache
+def load_config() -> dict:
+    """Loads the user config file. Returns an empty dict if missing or invalid."""
+    import tomllib
+
+    try:
+        with (get_config_dir() / CONFIG_FILE).open("rb") as f:
+            return tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+
+
+def get_setting(key: str, default=None):
+    """Returns a setting from the environment or the user config file."""
+    env_value = os.environ.get(ENV_PREFIX + key.upper())
+    if env_value is not None:
+        return env_value
+    return load_config().get(key, default)
+
+
+@cache
+def load_project_config(root: Path) -> dict:
+    """Loads a project's .agent/ulkan.toml (empty dict if missing or invalid)."""
+    import tomllib
+
+    try:
+        with (root / PROJECT_CONFIG_FILE).open("rb") as f:
+            return tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+
+
+def get_project_setting(root: Path, key: str, default=None):
+    """Returns a setting from the environment, the project or the user config."""
+    env_value = os.environ.get(ENV_PREFIX + key.upper())
+    if env_value is not None:
+        return env_value
+    project = load_project_config(root)
+    if key in project:
+        return project[key]
+    return load_config().get(key, default)
+
+
+def set_project_setting(root: Path, key: str, value: str) -> None:
+    """Writes a string setting to the project's .agent/ulkan.toml.
+
+    An existing top-level `key = ...` line is replaced; other lines are kept.
+    """
+    import json
+
+    path = root / PROJECT_CONFIG_FILE
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        lines = ["# Ulkan project settings"]
+    # JSON string escaping is valid TOML basic string syntax
+    line = f"{key} = {json.dumps(value)}"
+    for i, existing in enumerate(lines):
+        if existing.startswith("["):
+            lines.insert(i, line)
+            break
+        if existing.split("=", 1)[0].strip() == key:
+            lines[i] = line
+            break
+    else:
+        lines.append(line)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    load_project_config.cache_clear()
+
+
+def get_bool(key: str, default: bool) -> bool:
+    """Returns a boolean setting (accepts 1/0, true/false, yes/no, on/off)."""
+    value = get_setting(key, default)
+    if isinstance(value, bool):
+        return value
+    value = str(value).strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    return default
+
+
+def get_float(key: str, default: float) -> float:
+    """Returns a numeric setting, falling back to default if invalid."""
+    try:
+        return float(get_setting(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def get_int(key: str, default: int) -> int:
+    """Returns an integer setting, falling back to default if invalid."""
+    try:
+        return int(get_setting(key, default))
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,341 @@
+"""
+Resilient access to the Skyll search API.
+
+Every search goes through `search()`, or `search_async()` for the concurrent
+downloads of `ulkan add`:
+
+    retries   Connection errors, timeouts, HTTP 429 and 5xx responses are
+              retried up to `skyll_retries` times, each after a random delay
+              of up to BACKOFF_BASE * 2**attempt seconds ("full jitter").
+    hedging   If no response has arrived after `skyll_hedge_after` seconds,
+              an identical request is sent and the first answer wins, so a
+              single slow response does not cost a whole timeout (0
+              disables hedging).
+    deadline  Each attempt times out after `skyll_timeout` seconds, and all
+              attempts and delays together stay within `skyll_deadline`.
+    breaker   After `skyll_breaker_threshold` consecutive failed searches the
+              circuit opens: searches fail at once with SkyllCircuitOpenError
+              for `skyll_breaker_cooldown` seconds. The next search after
+              that is sent again; a failure reopens the circuit, a success
+              closes it. The state is kept in the cache dir, so it holds
+              across ulkan invocations.
+
+Failures raise a SkyllError subclass, so callers can tell an unreachable or
+misbehaving API apart from a search without results.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+
+from .settings import get_cache_dir, get_float, get_int
+
+SKYLL_API_URL = "https://api.skyll.app/search"
+
+DEFAULT_RETRIES = 2
+DEFAULT_TIMEOUT = 5.0  # seconds per attempt
+DEFAULT_DEADLINE = 10.0  # seconds for all attempts of a search
+DEFAULT_HEDGE_AFTER = 1.5
+DEFAULT_BREAKER_THRESHOLD = 5
+DEFAULT_BREAKER_COOLDOWN = 60.0
+BACKOFF_BASE = 0.25
+BACKOFF_MAX = 2.0
+
+BREAKER_FILE = "skyll-breaker.json"
+
+_breaker_lock = threading.Lock()
+
+
+class SkyllError(Exception):
+    """A Skyll search failed (as opposed to finding nothing)."""
+
+
+class SkyllUnavailableError(SkyllError):
+    """The API could not be reached or kept failing (network, timeout, 5xx)."""
+
+
+class SkyllCircuitOpenError(SkyllUnavailableError):
+    """Recent searches failed, so no request is sent until the cooldown ends."""
+
+    def __init__(self, failures: int, retry_in: float):
+        super().__init__(
+            f"Skyll API circuit open after {failures} failed search(es), "
+            f"retrying in {retry_in:.0f}s"
+        )
+        self.failures = failures
+        self.retry_in = retry_in
+
+
+class SkyllResponseError(SkyllError):
+    """The API rejected the request (HTTP 4xx) or sent an invalid payload."""
+
+
+# --- Circuit breaker -------------------------------------------------------
+
+
+def breaker_path() -> Path:
+    return get_cache_dir() / BREAKER_FILE
+
+
+def breaker_state() -> dict:
+    """{"failures": consecutive failed searches, "opened_at": time or None}."""
+    try:
+        state = json.loads(breaker_path().read_text(encoding="utf-8"))
+        failures = int(state["failures"])
+        opened_at = state.get("opened_at")
+    except (OSError, ValueError, KeyError, TypeError):
+        return {"failures": 0, "opened_at": None}
+    if not isinstance(opened_at, (int, float)):
+        opened_at = None
+    return {"failures": failures, "opened_at": opened_at}
+
+
+def _save_breaker(state: dict) -> None:
+    path = breaker_path()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def check_circuit() -> None:
+    """Raises SkyllCircuitOpenError while the circuit is open."""
+    state = breaker_state()
+    if state["opened_at"] is None:
+        return
+    cooldown = get_float("skyll_breaker_cooldown", DEFAULT_BREAKER_COOLDOWN)
+    retry_in = state["opened_at"] + cooldown - time.time()
+    if retry_in > 0:
+        raise SkyllCircuitOpenError(state["failures"], retry_in)
+
+
+def _record(success: bool) -> None:
+    """Counts a search that failed, or closes the circuit after a success."""
+    with _breaker_lock:
+        state = breaker_state()
+        if success:
+            if state["failures"] or state["opened_at"] is not None:
+                _save_breaker({"failures": 0, "opened_at": None})
+            return
+        state["failures"] += 1
+        threshold = get_int("skyll_breaker_threshold", DEFAULT_BREAKER_THRESHOLD)
+        if threshold > 0 and state["failures"] >= threshold:
+            state["opened_at"] = time.time()
+        _save_breaker(state)
+
+
+# --- Requests --------------------------------------------------------------
+
+
+class _Attempts:
+    """Retry budget of one search: attempt timeouts and backoff delays."""
+
+    def __init__(self, deadline: float | None = None):
+        if deadline is None:
+            deadline = get_float("skyll_deadline", DEFAULT_DEADLINE)
+        self.ends_at = time.monotonic() + deadline
+        self.retries = max(0, get_int("skyll_retries", DEFAULT_RETRIES))
+        self.timeout = get_float("skyll_timeout", DEFAULT_TIMEOUT)
+        self.hedge_after = get_float("skyll_hedge_after", DEFAULT_HEDGE_AFTER)
+        self.failed = 0
+
+    def next_timeout(self) -> float:
+        return max(0.1, min(self.timeout, self.ends_at - time.monotonic()))
+
+    def retry_delay(self) -> float | None:
+        """Delay before retrying a failed attempt, or None to give up."""
+        self.failed += 1
+        if self.failed > self.retries:
+            return None
+        delay = random.uniform(
+            0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.failed - 1))
+        )
+        if time.monotonic() + delay >= self.ends_at:
+            return None
+        return delay
+
+    def give_up(self, error: Exception) -> SkyllUnavailableError:
+        _record(False)
+        return SkyllUnavailableError(f"{error} (after {self.failed} attempt(s))")
+
+
+def _describe(error: Exception) -> str:
+    # httpx timeouts often have an empty message
+    return str(error) or type(error).__name__
+
+
+def _payload(response) -> dict:
+    """Checks a response's status and returns its JSON payload."""
+    status = response.status_code
+    if status == 429 or status >= 500:
+        raise SkyllUnavailableError(f"Skyll API returned HTTP {status}")
+    if status >= 400:
+        raise SkyllResponseError(f"Skyll API returned HTTP {status}")
+    try:
+        data = response.json()
+    except ValueError as e:
+        raise SkyllResponseError(f"Skyll API sent invalid JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise SkyllResponseError("Skyll API sent an unexpected payload")
+    return data
+
+
+def _send(query: str, limit: int, timeout: float) -> dict:
+    import httpx
+
+    from .net import get_client
+
+    try:
+        response = get_client().get(
+            SKYLL_API_URL, params={"q": query, "limit": limit}, timeout=timeout
+        )
+    except httpx.TransportError as e:
+        raise SkyllUnavailableError(f"Skyll API unreachable: {_describe(e)}") from e
+    return _payload(response)
+
+
+def _hedged(send, hedge_after: float):
+    """Calls send(); if it has not returned after `hedge_after` seconds, calls
+    it a second time in parallel and returns the first successful result.
+
+    Requests run in daemon threads, so a losing request never delays exit.
+    """
+    if hedge_after <= 0:
+        return send()
+
+    import queue
+
+    outcomes = queue.Queue()
+
+    def run() -> None:
+        try:
+            outcomes.put((True, send()))
+        except Exception as e:
+            outcomes.put((False, e))
+
+    def start() -> None:
+        threading.Thread(target=run, name="ulkan-skyll", daemon=True).start()
+
+    start()
+    try:
+        ok, value = outcomes.get(timeout=hedge_after)
+    except queue.Empty:
+        start()
+        error = None
+        for _ in range(2):
+            ok, value = outcomes.get()
+            if ok:
+                return value
+            error = value
+        raise error
+    if ok:
+        return value
+    raise value
+
+
+def search(query: str, limit: int, deadline: float | None = None) -> dict:
+    """Returns the payload of a Skyll search ({"skills": [...], ...}).
+
+    Args:
+        query: Search term.
+        limit: Number of results requested.
+        deadline: Seconds allowed for all attempts (default `skyll_deadline`).
+
+    Raises:
+        SkyllCircuitOpenError: Recent searches failed; nothing was sent.
+        SkyllUnavailableError: Every attempt failed (network, timeout, 5xx).
+        SkyllResponseError: The API rejected the request or sent garbage.
+    """
+    check_circuit()
+    attempts = _Attempts(deadline)
+    while True:
+        try:
+            data = _hedged(
+                lambda: _send(query, limit, attempts.next_timeout()),
+                attempts.hedge_after,
+            )
+        except SkyllResponseError:
+            _record(True)  # the API is up, it just did not like the request
+            raise
+        except SkyllUnavailableError as e:
+            delay = attempts.retry_delay()
+            if delay is None:
+                raise attempts.give_up(e) from e
+            time.sleep(delay)
+            continue
+        _record(True)
+        return data
+
+
+async def _send_async(client, query: str, limit: int, timeout: float) -> dict:
+    import httpx
+
+    try:
+        response = await client.get(
+            SKYLL_API_URL, params={"q": query, "limit": limit}, timeout=timeout
+        )
+    except httpx.TransportError as e:
+        raise SkyllUnavailableError(f"Skyll API unreachable: {_describe(e)}") from e
+    return _payload(response)
+
+
+async def _hedged_async(send, hedge_after: float):
+    """Async version of _hedged; the losing request is cancelled."""
+    import asyncio
+
+    if hedge_after <= 0:
+        return await send()
+
+    first = asyncio.ensure_future(send())
+    done, _ = await asyncio.wait({first}, timeout=hedge_after)
+    if done:
+        return first.result()
+
+    pending = {first, asyncio.ensure_future(send())}
+    error = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def search_async(
+    client, query: str, limit: int, deadline: float | None = None
+) -> dict:
+    """search() through an httpx.AsyncClient (see net.async_client)."""
+    import asyncio
+
+    check_circuit()
+    attempts = _Attempts(deadline)
+    while True:
+        try:
+            data = await _hedged_async(
+                lambda: _send_async(client, query, limit, attempts.next_timeout()),
+                attempts.hedge_after,
+            )
+        except SkyllResponseError:
+            _record(True)
+            raise
+        except SkyllUnavailableError as e:
+            delay = attempts.retry_delay()
+            if delay is None:
+                raise attempts.give_up(e) from e
+            await asyncio.sleep(delay)
+            continue
+        _record(True)
+        return data
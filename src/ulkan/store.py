@@ -0,0 +1,221 @@
+"""
+Content-addressed asset store shared by all projects.
+
+Blueprint files and downloaded registry skills are kept once in
+`<cache dir>/store/sha256/<ab>/<digest>`, keyed by the SHA-256 of their
+content, and materialized into each project's .agent/ from there:
+
+    reflink   copy-on-write clone (Linux btrfs/XFS); no data is written
+    hardlink  the project file *is* the store object (read-only, shared)
+    copy      a regular copy
+    auto      reflink when the filesystem supports it, otherwise copy
+
+Hardlinks save the most space but every linked file shares one inode, so
+store objects are made read-only to keep an in-place edit in one project
+from silently changing the others. Modes fall back to a copy when linking
+is not possible (e.g. the store is on another filesystem).
+
+The mode is chosen per project with `link_mode` (.agent/ulkan.toml, the user
+config or ULKAN_LINK_MODE); `asset_store = false` disables the store. It is
+also turned off for the run, with a warning, when the cache dir cannot be
+written (read-only home, sandboxed CI cache), and files are copied directly.
+"""
+
+import hashlib
+import os
+import shutil
+import stat
+import sys
+from functools import cache
+from pathlib import Path
+
+LINK_MODES = ["auto", "reflink", "hardlink", "copy"]
+DEFAULT_LINK_MODE = "auto"
+
+FICLONE = 0x40049409  # ioctl request of Linux reflinks (see ioctl_ficlone(2))
+CHUNK_SIZE = 1024 * 1024
+READ_ONLY = ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+def store_dir() -> Path:
+    from .settings import get_cache_dir
+
+    return get_cache_dir() / "store" / "sha256"
+
+
+def object_path(digest: str) -> Path:
+    return store_dir() / digest[:2] / digest
+
+
+@cache
+def writable() -> bool:
+    """Whether objects can be added to the store (checked once per run)."""
+    try:
+        probe = _tmp_path()
+        probe.write_bytes(b"")
+        probe.unlink()
+    except OSError as e:
+        from .styles import console
+
+        console.print(
+            f"[warning]Asset store unavailable ({e}), copying files directly.[/warning]"
+        )
+        return False
+    return True
+
+
+def link_mode(root: Path) -> str | None:
+    """The project's link mode, or None if the store is disabled or unusable."""
+    from .settings import get_bool, get_project_setting
+
+    if not get_bool("asset_store", True) or not writable():
+        return None
+    mode = str(get_project_setting(root, "link_mode", DEFAULT_LINK_MODE)).lower()
+    return mode if mode in LINK_MODES else DEFAULT_LINK_MODE
+
+
+def _insert(tmp: Path, digest: str, mode: int) -> Path:
+    """Moves a fully written temp file into the store as a read-only object."""
+    target = object_path(digest)
+    if target.exists():
+        tmp.unlink(missing_ok=True)
+        return target
+    os.chmod(tmp, stat.S_IMODE(mode) & READ_ONLY)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(tmp, target)
+    return target
+
+
+def _tmp_path() -> Path:
+    import threading
+
+    directory = store_dir() / "tmp"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def add_bytes(data: bytes, mode: int = 0o644) -> str:
+    """Stores content (if new) and returns its SHA-256 digest."""
+    digest = hashlib.sha256(data).hexdigest()
+    if not object_path(digest).exists():
+        tmp = _tmp_path()
+        tmp.write_bytes(data)
+        _insert(tmp, digest, mode)
+    return digest
+
+
+def add_file(path: Path, digest: str | None = None) -> str:
+    """Stores a file (if new) and returns its SHA-256 digest.
+
+    Args:
+        path: File to store.
+        digest: Its digest if already known to match the file's current
+            content (e.g. from an up to date blueprint manifest). The file
+            is then not read at all when the object is present; otherwise
+            the digest is recomputed while copying, so a new object always
+            matches its key.
+    """
+    if digest and object_path(digest).exists():
+        return digest
+
+    tmp = _tmp_path()
+    sha = hashlib.sha256()
+    with open(path, "rb") as src, open(tmp, "wb") as dest:
+        while chunk := src.read(CHUNK_SIZE):
+            sha.update(chunk)
+            dest.write(chunk)
+    digest = sha.hexdigest()
+    _insert(tmp, digest, os.stat(path).st_mode)
+    return digest
+
+
+def _reflink(source: Path, dest: Path) -> None:
+    """Clones source into the new file dest (raises OSError if unsupported)."""
+    import fcntl
+
+    with open(source, "rb") as src, open(dest, "xb") as out:
+        try:
+            fcntl.ioctl(out.fileno(), FICLONE, src.fileno())
+        except OSError:
+            out.close()
+            dest.unlink(missing_ok=True)
+            raise
+
+
+def _copy(source: Path, dest: Path) -> None:
+    with open(source, "rb") as src, open(dest, "xb") as out:
+        shutil.copyfileobj(src, out)
+
+
+def materialize(
+    digest: str, dest: Path, mode: str, replace: bool = False
+) -> str | None:
+    """Creates dest from a store object.
+
+    Args:
+        digest: Object to materialize.
+        dest: Destination file.
+        mode: One of LINK_MODES.
+        replace: Overwrite an existing dest (atomically). Otherwise an
+            existing dest is left untouched.
+
+    Returns:
+        How the file was created ("reflink", "hardlink" or "copy"), or None
+        if dest already existed and `replace` is False.
+    """
+    source = object_path(digest)
+    target = dest
+    if replace:
+        target = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+        target.unlink(missing_ok=True)
+
+    try:
+        how = None
+        if mode == "hardlink":
+            try:
+                os.link(source, target)
+                how = "hardlink"
+            except FileExistsError:
+                raise
+            except OSError:
+                pass
+        elif mode in ("auto", "reflink") and sys.platform.startswith("linux"):
+            try:
+                _reflink(source, target)
+                how = "reflink"
+            except FileExistsError:
+                raise
+            except OSError:
+                pass
+        if how is None:
+            _copy(source, target)
+            how = "copy"
+    except FileExistsError:
+        return None
+    except OSError:
+        if replace:
+            target.unlink(missing_ok=True)
+        raise
+
+    if how != "hardlink":
+        # Copies are the project's own files: writable, with the object's exec bits
+        os.chmod(target, stat.S_IMODE(os.stat(source).st_mode) | stat.S_IWUSR)
+    if replace:
+        os.replace(target, dest)
+        # rename() is a no-op when dest already is a link to the same object
+        target.unlink(missing_ok=True)
+    return how
+
+
+def write_file(root: Path, dest: Path, data: bytes) -> None:
+    """Writes (or replaces) a project file through the store, honoring the
+    project's link mode; writes it directly if the store is disabled or
+    fails."""
+    mode = link_mode(root)
+    if mode:
+        try:
+            materialize(add_bytes(data), dest, mode, replace=True)
+            return
+        except OSError:
+            pass
+    dest.write_bytes(data)
@@ -2,121 +2,540 @@
 Syncs AGENTS.md with current skills, rules, workflows, and tools.
 """
 
+import hashlib
+import json
 import os
 import re
+import time
 from pathlib import Path
+from typing import IO, Callable
 
+from . import __version__
+from .document import parse_document, replace_table_rows
+from .frontmatter import read_frontmatter
+from .settings import get_int
 from .styles import console, print_error, print_step, print_success
 
 AGENTS_FILE = "AGENTS.md"
 BASE_DIR = ".agent"
 
+# Parse cache: .agent/.cache/sync.json (the .cache dir ignores itself in git)
+CACHE_DIR = ".cache"
+SYNC_CACHE_FILE = "sync.json"
+# Bump whenever parsing changes so stale rows are never reused
+SYNC_CACHE_VERSION = 4
+RACY_WINDOW_NS = 2_000_000_000
+
+# Hidden marker recording the digest of the last synced tables, always
+# the last line of AGENTS.md (editors may strip the final newline)
+DIGEST_MARKER = "<!-- ulkan:sync-digest {} -->"
+DIGEST_PATTERN = re.compile(r"\n*<!-- ulkan:sync-digest ([0-9a-f]{64}) -->\s*\Z")
+
+# Shell comment lines ignored when extracting a tool description
+SHELL_DIRECTIVES = ("shellcheck", "-*-", "vim:", "vi:")
+LICENSE_PREFIXES = ("Copyright", "SPDX-", "(c)", "Licensed")
+
+# sync_agents_file results
+SYNC_UPDATED = "updated"
+SYNC_UNCHANGED = "unchanged"
+SYNC_OUT_OF_SYNC = "out-of-sync"
+SYNC_MISSING = "missing"
+SYNC_ERROR = "error"
+
+# Directories never searched for project roots by `sync --recursive`
+# (hidden directories are skipped as well)
+SKIP_DIRS = {
+    "node_modules",
+    "vendor",
+    "third_party",
+    "site-packages",
+    "venv",
+    "__pycache__",
+    "dist",
+    "build",
+    "target",
+}
+
+# AGENTS.md table header for each asset category
+TABLE_HEADERS = {
+    "skills": "🧠 Core Skills",
+    "rules": "🛡️ Active Rules",
+    "workflows": "🔄 Standard Workflows",
+    "tools": "🛠️ Standard Tools",
+}
+
+
+def make_cache_dir(cache_dir: Path) -> None:
+    """Creates .agent/.cache/, which ignores itself in git."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("# Created by ulkan sync\n*\n")
+
+
+class SyncCache:
+    """Persistent per-asset parse cache.
+
+    Parsed metadata is keyed by the asset's relative path and validated against its (mtime_ns, size,
+    inode), so unchanged assets are never reopened. Entries not seen during
+    a run are dropped on save, and the whole cache is discarded when
+    SYNC_CACHE_VERSION changes.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / BASE_DIR / CACHE_DIR / SYNC_CACHE_FILE
+        self.entries = self._load()
+        self.seen: dict[str, dict] = {}
+        self.dirty = False
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != SYNC_CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _lookup(self, path: Path) -> tuple[str, list | None, dict | None]:
+        """Returns (rel, stat key, entry) - entry only if the file is unchanged."""
+        rel = path.relative_to(self.root).as_posix()
+        try:
+            st = path.stat()
+        except OSError:
+            return rel, None, None
+        key = [st.st_mtime_ns, st.st_size, st.st_ino]
+        entry = self.seen.get(rel) or self.entries.get(rel)
+        if entry and entry.get("stat") == key:
+            self.seen[rel] = entry
+            return rel, key, entry
+        return rel, key, None
+
+    def _store(self, rel: str, key: list, entry: dict | None, **fields) -> None:
+        # Like git's "racy clean" check: a file modified within the
+        # filesystem's timestamp granularity could change again unnoticed.
+        if time.time_ns() - key[0] > RACY_WINDOW_NS:
+            self.seen[rel] = {**(entry or {"stat": key}), **fields}
+            self.dirty = True
+
+    def get(self, path: Path, parse: Callable[[Path], tuple]) -> tuple:
+        """Returns parse(path), reusing the cached result if the file is unchanged.
+
+        Safe to call from worker threads: each call only sets its own key.
+        """
+        rel, key, entry = self._lookup(path)
+        if key is None:
+            return parse(path)
+        if entry and "meta" in entry:
+            return tuple(entry["meta"])
+
+        meta = parse(path)
+        self._store(rel, key, entry, meta=list(meta))
+        return meta
+
+    def forget(self, path: Path) -> None:
+        """Drops the entry of an asset that no longer exists."""
+        rel = path.relative_to(self.root).as_posix()
+        if self.entries.pop(rel, None) is not None:
+            self.dirty = True
+        self.seen.pop(rel, None)
+
+    def save(self) -> None:
+        """Writes the cache if anything changed (fails silently)."""
+        if not self.dirty and self.seen.keys() == self.entries.keys():
+            return
+        cache_dir = self.path.parent
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            make_cache_dir(cache_dir)
+            tmp.write_text(
+                json.dumps({"version": SYNC_CACHE_VERSION, "entries": self.seen}),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+
+def _field(fields: dict, key: str) -> str | None:
+    value = fields.get(key)
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
 
 def parse_frontmatter(filepath: Path) -> tuple[str, str, str | None]:
     """Parse frontmatter from a markdown file.
 
+    Only the frontmatter block at the top of the file is read (see
+    frontmatter.read_frontmatter), never the document body.
+
     Returns:
         tuple[name, trigger, description]
     """
     try:
-        content = filepath.read_text()
+        fields = read_frontmatter(filepath) or {}
     except Exception:
         return filepath.stem, "Error reading file", None
 
-    name_match = re.search(r"name:\s*(.+)", content)
-    trigger_match = re.search(r'trigger:\s*["\']?([^"\']+)["\']?', content)
-    desc_match = re.search(r"description:\s*>\s*(.+?)(\n\w|$)", content, re.DOTALL)
-    if not desc_match:
-        desc_match = re.search(r"description:\s*(.+)", content)
-
-    name = (
-        name_match.group(1).strip()
-        if name_match
-        else (filepath.parent.name if filepath.name == "SKILL.md" else filepath.stem)
+    name = _field(fields, "name") or (
+        filepath.parent.name if filepath.name == "SKILL.md" else filepath.stem
     )
-    trigger = trigger_match.group(1).strip() if trigger_match else "See file"
+    trigger = _field(fields, "trigger") or "See file"
 
     desc = "No description."
-    if desc_match:
-        desc = desc_match.group(1).strip().replace("\n", " ")
-        if len(desc) > 100:
-            desc = desc[:97] + "..."
+    if _field(fields, "description"):
+        desc = _summary(fields["description"])
 
     return name, trigger, desc
 
 
-def get_skills(root: Path) -> list[str]:
-    skills_dir = root / BASE_DIR / "skills"
-    rows = []
-    if skills_dir.exists():
-        for f in skills_dir.glob("*/SKILL.md"):
-            name, trigger, desc = parse_frontmatter(f)
-            rows.append(f'| `{name}` | "{trigger}" | {desc} |')
-    return sorted(rows)
+def _parse(
+    filepath: Path, parse: Callable[[Path], tuple], cache: SyncCache | None
+) -> tuple:
+    return cache.get(filepath, parse) if cache else parse(filepath)
 
 
-def get_rules(root: Path) -> list[str]:
-    rules_dir = root / BASE_DIR / "rules"
-    rows = []
-    if rules_dir.exists():
-        for f in rules_dir.glob("*.md"):
-            if f.name == "README.md":
-                continue
-            name, trigger, desc = parse_frontmatter(f)
-            rows.append(f'| `{name}` | "{trigger}" | {desc} |')
-    return sorted(rows)
+def _summary(text: str) -> str:
+    """Collapses whitespace and truncates a description for a table cell."""
+    text = " ".join(text.split())
+    if len(text) > 100:
+        text = text[:97] + "..."
+    return text
+
 
+def python_docstring(f: IO[str]) -> str | None:
+    """Returns the module docstring of a Python source file.
 
-def get_workflows(root: Path) -> list[str]:
-    workflows_dir = root / BASE_DIR / "workflows"
-    rows = []
-    if workflows_dir.exists():
-        for f in workflows_dir.glob("*.md"):
-            if f.name == "README.md":
+    Tokenizes lazily and stops at the first significant token, so only the
+    lines up to the docstring are read (comments and license headers before
+    it are skipped; string literals after code are never considered).
+    """
+    import ast
+    import tokenize
+
+    skip = {
+        tokenize.ENCODING,
+        tokenize.COMMENT,
+        tokenize.NL,
+        tokenize.NEWLINE,
+        tokenize.INDENT,
+        tokenize.DEDENT,
+    }
+    try:
+        for token in tokenize.generate_tokens(f.readline):
+            if token.type in skip:
                 continue
-            name, trigger, desc = parse_frontmatter(f)
-            # Ensure workflow name starts with /
-            if not name.startswith("/"):
-                name = f"/{name}"
-            rows.append(f'| `{name}` | "{trigger}" | {desc} |')
-    return sorted(rows)
-
-
-def get_tools(root: Path) -> list[str]:
-    tools_dir = root / BASE_DIR / "tools" / "scripts"
-    rows = []
-    if tools_dir.exists():
-        for f in tools_dir.glob("*"):
-            if f.suffix in [".py", ".sh"]:
-                name = f.name
-                desc = "Script utility."
-                try:
-                    content = f.read_text()[:500]
-                    doc_match = re.search(r'("""|\'\'\')([\s\S]*?)\1', content)
-                    if doc_match:
-                        desc = doc_match.group(2).strip().replace("\n", " ")[:100]
-                except Exception:
-                    pass
-                rows.append(f"| `{name}` | Script | {desc} |")
-    return sorted(rows)
+            if token.type != tokenize.STRING:
+                return None
+            value = ast.literal_eval(token.string)
+            return value if isinstance(value, str) else None
+    except (tokenize.TokenError, SyntaxError, ValueError):
+        return None
+    return None
 
 
-def update_table(content: str, header: str, rows: list[str]) -> str:
-    if not rows:
-        return content
-    # Regex to find the markdown table under a specific header
-    pattern = re.compile(
-        rf"(### {re.escape(header)}[\s\S]*?\| :--- \|\n)([\s\S]*?)(?=\n\n|\n#)",
-        re.MULTILINE,
-    )
+def shell_comment(f: IO[str], max_lines: int = 200) -> str | None:
+    """Returns the leading comment block of a shell script.
+
+    The shebang, editor/linter directives and license paragraphs
+    (Copyright, SPDX) are skipped; the first remaining paragraph is used.
+    """
+    paragraph: list[str] = []
+    for number, line in enumerate(f):
+        if number >= max_lines:
+            break
+        line = line.strip()
+        if number == 0 and line.startswith("#!"):
+            continue
+        if not line.startswith("#"):
+            if paragraph or line:
+                break
+            continue
+
+        text = line.lstrip("#").strip()
+        if text.startswith(SHELL_DIRECTIVES):
+            continue
+        if text:
+            paragraph.append(text)
+        elif paragraph:
+            if not paragraph[0].startswith(LICENSE_PREFIXES):
+                break
+            paragraph = []
+
+    if paragraph and not paragraph[0].startswith(LICENSE_PREFIXES):
+        return " ".join(paragraph)
+    return None
+
+
+def parse_tool(filepath: Path) -> tuple[str, str, str]:
+    """Parse a tool script's description from its module docstring (Python)
+    or leading comment block (shell).
+
+    Returns:
+        tuple[name, type, description]
+    """
+    desc = None
+    try:
+        with filepath.open(encoding="utf-8", errors="replace") as f:
+            if filepath.suffix == ".py":
+                desc = python_docstring(f)
+            else:
+                desc = shell_comment(f)
+    except OSError:
+        pass
+    if desc and desc.strip():
+        return filepath.name, "Script", _summary(desc)
+    return filepath.name, "Script", "Script utility."
+
 
-    new_table = "\n".join(rows)
-    if pattern.search(content):
-        return pattern.sub(rf"\1{new_table}", content)
+def _doc_row(meta: tuple) -> str:
+    name, trigger, desc = meta
+    return f'| `{name}` | "{trigger}" | {desc} |'
+
+
+def _workflow_row(meta: tuple) -> str:
+    name, trigger, desc = meta
+    # Ensure workflow name starts with /
+    if not name.startswith("/"):
+        name = f"/{name}"
+    return f'| `{name}` | "{trigger}" | {desc} |'
+
+
+def _tool_row(meta: tuple) -> str:
+    name, _, desc = meta
+    return f"| `{name}` | Script | {desc} |"
+
+
+# category -> (parser, row formatter)
+CATEGORIES: dict[str, tuple[Callable[[Path], tuple], Callable[[tuple], str]]] = {
+    "skills": (parse_frontmatter, _doc_row),
+    "rules": (parse_frontmatter, _doc_row),
+    "workflows": (parse_frontmatter, _workflow_row),
+    "tools": (parse_tool, _tool_row),
+}
+
+DEFAULT_SYNC_WORKERS = 8
+
+
+def _scandir(path: Path) -> list[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def find_assets(
+    root: Path, categories: list[str] | None = None
+) -> list[tuple[str, Path]]:
+    """Walks .agent/ once and classifies asset files by category.
+
+    skills/<name>/SKILL.md, rules/*.md, workflows/*.md (README.md excluded)
+    and tools/scripts/*.py|*.sh.
+
+    Returns:
+        List of (category, path) tuples.
+    """
+    categories = categories or list(CATEGORIES)
+    found = []
+    for entry in _scandir(root / BASE_DIR):
+        if entry.name not in categories or not entry.is_dir():
+            continue
+        category = entry.name
+        base = Path(entry.path)
+
+        if category == "skills":
+            for skill in _scandir(base):
+                skill_file = base / skill.name / "SKILL.md"
+                if skill.is_dir() and skill_file.is_file():
+                    found.append((category, skill_file))
+        elif category == "tools":
+            for item in _scandir(base / "scripts"):
+                if item.name.endswith((".py", ".sh")) and item.is_file():
+                    found.append((category, base / "scripts" / item.name))
+        else:
+            for item in _scandir(base):
+                if (
+                    item.name.endswith(".md")
+                    and item.name != "README.md"
+                    and item.is_file()
+                ):
+                    found.append((category, base / item.name))
+    return found
+
+
+def parse_assets(
+    found: list[tuple[str, Path]],
+    cache: SyncCache | None = None,
+    workers: int | None = None,
+) -> dict[str, dict[Path, str]]:
+    """Parses (category, path) items in a thread pool of `workers` threads
+    (setting `sync_workers`, default 8).
+
+    Returns:
+        Dict mapping each category to {asset path: table row}.
+    """
+    if workers is None:
+        workers = get_int("sync_workers", DEFAULT_SYNC_WORKERS)
+
+    def parse(item: tuple[str, Path]) -> tuple:
+        category, path = item
+        return _parse(path, CATEGORIES[category][0], cache)
+
+    if workers > 1 and len(found) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(found))) as pool:
+            metas = list(pool.map(parse, found))
     else:
-        # If table not found, we might want to warn or just return content
-        # For now silent return as it might be custom edited
-        return content
+        metas = [parse(item) for item in found]
+
+    rows: dict[str, dict[Path, str]] = {}
+    for (category, path), meta in zip(found, metas):
+        rows.setdefault(category, {})[path] = CATEGORIES[category][1](meta)
+    return rows
+
+
+def scan_assets(
+    root: Path,
+    cache: SyncCache | None = None,
+    workers: int | None = None,
+    categories: list[str] | None = None,
+) -> dict[str, list[str]]:
+    """Scans and parses all assets in a single pass.
+
+    Files are found with one os.scandir walk (find_assets) and parsed
+    concurrently (parse_assets).
+
+    Returns:
+        Dict mapping each category ('skills', 'rules', 'workflows', 'tools')
+        to its sorted table rows.
+    """
+    categories = categories or list(CATEGORIES)
+    rows = parse_assets(find_assets(root, categories), cache, workers)
+    return {
+        category: sorted(rows.get(category, {}).values()) for category in categories
+    }
+
+
+def get_skills(root: Path, cache: SyncCache | None = None) -> list[str]:
+    return scan_assets(root, cache, categories=["skills"])["skills"]
+
+
+def get_rules(root: Path, cache: SyncCache | None = None) -> list[str]:
+    return scan_assets(root, cache, categories=["rules"])["rules"]
+
+
+def get_workflows(root: Path, cache: SyncCache | None = None) -> list[str]:
+    return scan_assets(root, cache, categories=["workflows"])["workflows"]
+
+
+def get_tools(root: Path, cache: SyncCache | None = None) -> list[str]:
+    return scan_assets(root, cache, categories=["tools"])["tools"]
+
+
+def update_tables(content: str, tables: dict[str, list[str]]) -> str:
+    """Replaces the rows of several AGENTS.md tables in a single pass.
+
+    The document is parsed once (see document.py) and each table body is
+    spliced in place; tables that are missing (e.g. custom edited) or have
+    no rows to write are left untouched.
+
+    Args:
+        content: AGENTS.md text
+        tables: Table header (e.g. "🧠 Core Skills") -> rows
+    """
+    return replace_table_rows(parse_document(content), tables)
+
+
+def update_table(content: str, header: str, rows: list[str]) -> str:
+    return update_tables(content, {header: rows})
+
+
+def split_digest(content: str) -> tuple[str, str | None]:
+    """Separates the sync digest marker from the AGENTS.md text.
+
+    Returns:
+        (body without the marker, ending with a single newline; recorded
+        digest or None)
+    """
+    match = DIGEST_PATTERN.search(content)
+    if not match:
+        return content, None
+    return content[: match.start()] + "\n", match.group(1)
+
+
+def compute_digest(body: str, tables: dict[str, list[str]]) -> str:
+    """Digest of what a sync renders into AGENTS.md.
+
+    Covers the Ulkan version, the parse format, the table rows (so edits to
+    an asset's body that do not change its row leave the digest alone) and
+    the AGENTS.md body itself, so hand edits to the tables are detected too.
+    """
+    digest = hashlib.sha256(f"ulkan {__version__}\0{SYNC_CACHE_VERSION}\0".encode())
+    for header, rows in sorted(tables.items()):
+        digest.update(f"{header}\0{len(rows)}\0".encode())
+        for row in rows:
+            digest.update(f"{row}\0".encode())
+    digest.update(hashlib.sha256(body.encode()).digest())
+    return digest.hexdigest()
+
+
+def stamp_digest(body: str, tables: dict[str, list[str]]) -> str:
+    """Returns the AGENTS.md body with an up to date digest marker appended."""
+    body = body.rstrip("\n") + "\n"
+    return f"{body}\n{DIGEST_MARKER.format(compute_digest(body, tables))}\n"
+
+
+def _tables(rows: dict[str, dict[Path, str]]) -> dict[str, list[str]]:
+    """Table header -> sorted rows, for every AGENTS.md table."""
+    return {
+        header: sorted(rows.get(category, {}).values())
+        for category, header in TABLE_HEADERS.items()
+    }
+
+
+def sync_agents_file(root: Path, check: bool = False) -> str:
+    """Syncs (or checks) the AGENTS.md of one root without printing.
+
+    AGENTS.md carries a hidden digest of the tables of the last sync. With
+    check=True, a digest matching the current rows proves the file is
+    current without splicing the document; otherwise the tables are
+    regenerated and compared. Assets are parsed either way, which reads
+    only their frontmatter (or leading docstring) and is cached by stat.
+
+    Returns:
+        One of SYNC_UPDATED, SYNC_UNCHANGED, SYNC_OUT_OF_SYNC or SYNC_MISSING.
+    """
+    agents_file = root / AGENTS_FILE
+    if not agents_file.exists():
+        return SYNC_MISSING
+
+    content = agents_file.read_text()
+    body, recorded = split_digest(content)
+    cache = SyncCache(root)
+    tables = _tables(parse_assets(find_assets(root), cache))
+
+    if check and recorded == compute_digest(body, tables):
+        cache.save()
+        return SYNC_UNCHANGED
+
+    updated = update_tables(body, tables)
+
+    if check:
+        cache.save()
+        return SYNC_OUT_OF_SYNC if updated != body else SYNC_UNCHANGED
+
+    updated = stamp_digest(updated, tables)
+    cache.save()
+
+    if updated == content:
+        return SYNC_UNCHANGED
+    agents_file.write_text(updated)
+    return SYNC_UPDATED
 
 
 def sync_documentation(root: Path, check: bool = False) -> bool:
@@ -129,39 +548,260 @@ def sync_documentation(root: Path, check: bool = False) -> bool:
     Returns:
         True if successful (or if check passed), False otherwise
     """
-    agents_file = root / AGENTS_FILE
-
-    if not agents_file.exists():
+    if not (root / AGENTS_FILE).exists():
         print_error(f"{AGENTS_FILE} not found.")
         return False
 
     print_step("Syncing documentation...")
 
     try:
-        content = agents_file.read_text()
-        original_content = content
-
-        content = update_table(content, "🧠 Core Skills", get_skills(root))
-        content = update_table(content, "🛡️ Active Rules", get_rules(root))
-        content = update_table(content, "🔄 Standard Workflows", get_workflows(root))
-        content = update_table(content, "🛠️ Standard Tools", get_tools(root))
-
-        if check:
-            if content != original_content:
-                print_error("Documentation is out of sync.")
-                return False
-            else:
-                print_success("Documentation is in sync.")
-                return True
+        status = sync_agents_file(root, check=check)
+    except Exception as e:
+        print_error(f"Sync failed: {e}")
+        return False
 
-        if content != original_content:
-            agents_file.write_text(content)
-            print_success(f"{AGENTS_FILE} updated successfully.")
-        else:
-            console.print("[info]No changes needed.[/info]")
+    if status == SYNC_OUT_OF_SYNC:
+        print_error("Documentation is out of sync.")
+        return False
+    if check:
+        print_success("Documentation is in sync.")
+    elif status == SYNC_UPDATED:
+        print_success(f"{AGENTS_FILE} updated successfully.")
+    else:
+        console.print("[info]No changes needed.[/info]")
+    return True
 
-        return True
 
+def find_roots(base: Path) -> list[Path]:
+    """Finds every project root (a directory with AGENTS.md and .agent/)
+    under base, including base itself.
+
+    Hidden directories (.git, .agent, adapter folders such as .claude),
+    vendored trees (SKIP_DIRS) and symlinked directories are not descended
+    into.
+    """
+    roots = []
+    pending = [base]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        names = {entry.name for entry in entries}
+        if AGENTS_FILE in names and BASE_DIR in names:
+            if (directory / BASE_DIR).is_dir():
+                roots.append(directory)
+
+        for entry in entries:
+            if (
+                entry.name.startswith(".")
+                or entry.name in SKIP_DIRS
+                or not entry.is_dir(follow_symlinks=False)
+            ):
+                continue
+            pending.append(directory / entry.name)
+    return sorted(roots)
+
+
+def _sync_root(root: Path, check: bool) -> tuple[Path, str, str | None]:
+    """Process pool worker: returns (root, status, error)."""
+    try:
+        return root, sync_agents_file(root, check=check), None
     except Exception as e:
-        print_error(f"Sync failed: {e}")
+        return root, SYNC_ERROR, str(e)
+
+
+def sync_recursive(base: Path, check: bool = False) -> bool:
+    """Syncs every project root under base in parallel (ulkan sync --recursive).
+
+    Roots are synced in a process pool of `sync_processes` workers (default:
+    CPU count). Prints one line per root and an aggregate summary.
+
+    Returns:
+        True if every root succeeded (and, with check, was in sync)
+    """
+    roots = find_roots(base)
+    if not roots:
+        print_error(f"No {AGENTS_FILE} with a {BASE_DIR}/ folder found under {base}.")
         return False
+
+    print_step(f"Syncing documentation in {len(roots)} project(s)...")
+
+    workers = min(len(roots), get_int("sync_processes", os.cpu_count() or 1))
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_sync_root, roots, [check] * len(roots)))
+    else:
+        results = [_sync_root(root, check) for root in roots]
+
+    counts: dict[str, int] = {}
+    for root, status, error in results:
+        counts[status] = counts.get(status, 0) + 1
+        rel = root.relative_to(base).as_posix()
+        if status == SYNC_ERROR:
+            print_error(f"{rel}: sync failed: {error}")
+        elif status == SYNC_OUT_OF_SYNC:
+            print_error(f"{rel}: out of sync")
+        elif status == SYNC_UPDATED:
+            console.print(f"[success]  ✓ {rel}[/success] [info]updated[/info]")
+        else:
+            console.print(f"[info]  ✓ {rel} up to date[/info]")
+
+    failed = counts.get(SYNC_ERROR, 0) + counts.get(SYNC_OUT_OF_SYNC, 0)
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+    if failed:
+        print_error(f"{failed} of {len(roots)} project(s) failed ({summary}).")
+        return False
+    done = "in sync" if check else "synced"
+    print_success(f"{len(roots)} project(s) {done} ({summary}).")
+    return True
+
+
+def asset_for_path(root: Path, path: Path) -> tuple[str, Path | None] | None:
+    """Maps a changed path under .agent/ to the asset it belongs to.
+
+    Returns:
+        (category, asset file) for a single asset, (category, None) when the
+        whole category must be rescanned, ("*", None) for the whole tree, or
+        None if the path does not affect AGENTS.md.
+    """
+    base = root / BASE_DIR
+    try:
+        parts = path.relative_to(base).parts
+    except ValueError:
+        return None
+    if not parts:
+        return "*", None
+
+    category = parts[0]
+    if category not in CATEGORIES:
+        return None
+    if len(parts) == 1:
+        return category, None
+
+    if category == "skills":
+        return category, base / "skills" / parts[1] / "SKILL.md"
+    if category == "tools":
+        if parts[1] != "scripts":
+            return None
+        if len(parts) == 2:
+            return category, None
+        if len(parts) == 3 and parts[2].endswith((".py", ".sh")):
+            return category, path
+        return None
+    if len(parts) == 2 and parts[1].endswith(".md") and parts[1] != "README.md":
+        return category, path
+    return None
+
+
+def apply_changes(
+    root: Path,
+    rows: dict[str, dict[Path, str]],
+    changed: set[Path],
+    cache: SyncCache | None = None,
+) -> list[str]:
+    """Re-parses only the assets touched by `changed`, updating rows in place.
+
+    Args:
+        root: Project root path
+        rows: Current rows by category and asset path (see parse_assets)
+        changed: Paths reported by the watcher
+        cache: Optional parse cache
+
+    Returns:
+        The categories whose rows were refreshed.
+    """
+    rescan: set[str] = set()
+    touched: dict[str, set[Path]] = {}
+    for path in changed:
+        target = asset_for_path(root, path)
+        if target is None:
+            continue
+        category, asset = target
+        if category == "*":
+            rescan.update(CATEGORIES)
+        elif asset is None:
+            rescan.add(category)
+        else:
+            touched.setdefault(category, set()).add(asset)
+
+    for category in rescan:
+        fresh = parse_assets(find_assets(root, [category]), cache).get(category, {})
+        for gone in rows.get(category, {}).keys() - fresh.keys():
+            if cache:
+                cache.forget(gone)
+        rows[category] = fresh
+
+    for category, assets in touched.items():
+        if category in rescan:
+            continue
+        present = [(category, asset) for asset in sorted(assets) if asset.is_file()]
+        for gone in assets.difference(asset for _, asset in present):
+            rows.setdefault(category, {}).pop(gone, None)
+            if cache:
+                cache.forget(gone)
+        fresh = parse_assets(present, cache).get(category, {})
+        rows.setdefault(category, {}).update(fresh)
+
+    return sorted(rescan | touched.keys())
+
+
+def watch_documentation(root: Path, backend: str | None = None) -> None:
+    """Keeps AGENTS.md in sync until interrupted (ulkan sync --watch).
+
+    Waits for filesystem events under .agent/ (see watcher.py), re-parses
+    only the assets they touch and rewrites only the affected tables.
+    Debounce and backend come from the `watch_debounce` and `watch_backend`
+    ("auto", "inotify" or "poll") settings.
+    """
+    from .settings import get_float, get_setting
+    from .watcher import DEFAULT_DEBOUNCE, iter_changes, open_watcher
+
+    agents_file = root / AGENTS_FILE
+    cache = SyncCache(root)
+    rows = parse_assets(find_assets(root), cache)
+    cache.save()
+
+    watcher = open_watcher(
+        root / BASE_DIR, backend or get_setting("watch_backend", "auto")
+    )
+    print_step(
+        f"Watching {BASE_DIR}/ for changes ({type(watcher).__name__}). "
+        "Press Ctrl+C to stop."
+    )
+    debounce = get_float("watch_debounce", DEFAULT_DEBOUNCE)
+
+    try:
+        for changed in iter_changes(watcher, debounce=debounce):
+            categories = apply_changes(root, rows, changed, cache)
+            if not categories:
+                continue
+
+            try:
+                content = agents_file.read_text()
+            except OSError as e:
+                print_error(f"Cannot read {AGENTS_FILE}: {e}")
+                continue
+
+            body, _ = split_digest(content)
+            updated = update_tables(
+                body,
+                {TABLE_HEADERS[c]: sorted(rows[c].values()) for c in categories},
+            )
+            updated = stamp_digest(updated, _tables(rows))
+            cache.save()
+
+            stamp = time.strftime("%H:%M:%S")
+            if updated != content:
+                agents_file.write_text(updated)
+                headers = ", ".join(TABLE_HEADERS[c] for c in categories)
+                print_success(f"[{stamp}] Updated {headers}")
+            else:
+                console.print(f"[info][{stamp}] No changes needed.[/info]")
+    finally:
+        watcher.close()
@@ -1,28 +1,100 @@
 """Updater module for checking and applying Ulkan updates."""
 
+import json
+import os
 import subprocess
 import sys
+import threading
+import time
 
-import httpx
+from .settings import get_bool, get_cache_dir, get_float, get_setting
 
 PYPI_URL = "https://pypi.org/pypi/ulkan/json"
 
+# Update check state cached on disk:
+# {"checked_at": float, "latest_version": str, "url": str,
+#  "etag": str | None, "last_modified": str | None}
+UPDATE_CACHE_FILE = "update-check.json"
+DEFAULT_UPDATE_CHECK_TTL = 24 * 60 * 60  # seconds
+UPDATE_CHECK_JOIN = 1.0  # seconds a background check may delay exit
+
+
+def get_pypi_url() -> str:
+    """PyPI JSON endpoint (setting `pypi_url`, e.g. a local stand-in server)."""
+    return get_setting("pypi_url", PYPI_URL)
+
 
 def get_latest_version() -> str | None:
-    """Fetches the latest version from PyPI. Returns None if check fails."""
+    """Fetches the latest version from PyPI. Returns None if check fails.
+
+    Sends a conditional request using the ETag / Last-Modified validators of
+    the previous response, so an unchanged release list costs a bodiless
+    304 Not Modified instead of the full (ever growing) JSON document.
+    """
+    import httpx
+
+    from .net import get_client
+
+    url = get_pypi_url()
+    cached = _read_update_cache()
+    cached_version = cached.get("latest_version")
+
+    headers = {}
+    if cached_version and cached.get("url") == url:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        response = httpx.get(PYPI_URL, timeout=3.0)
-        if response.status_code == 200:
+        response = get_client().get(url, headers=headers, timeout=3.0)
+        if response.status_code == 304 and headers:
+            latest = cached_version
+            etag = response.headers.get("etag", cached.get("etag"))
+            last_modified = response.headers.get(
+                "last-modified", cached.get("last_modified")
+            )
+        elif response.status_code == 200:
             data = response.json()
-            return data.get("info", {}).get("version")
-    except (httpx.RequestError, httpx.TimeoutException):
-        pass
-    return None
+            latest = data.get("info", {}).get("version")
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
+        else:
+            return None
+    except (httpx.RequestError, httpx.TimeoutException, ValueError):
+        return None
+
+    if latest:
+        _write_update_cache(
+            {
+                "checked_at": time.time(),
+                "latest_version": latest,
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+        )
+    return latest
+
+
+def is_newer(latest: str | None, current_version: str) -> bool:
+    """Returns True if `latest` is a newer version than `current_version`."""
+    if latest is None:
+        return False
+
+    # Simple version comparison (works for semver)
+    from packaging.version import Version
+
+    try:
+        return Version(latest) > Version(current_version)
+    except Exception:
+        # Fallback to False if we can't compare reliably
+        return False
 
 
 def check_for_update(current_version: str) -> tuple[bool, str | None]:
     """
-    Checks if a newer version is available.
+    Checks if a newer version is available (blocking network request).
 
     Returns:
         (has_update, latest_version) tuple.
@@ -32,17 +104,90 @@ def check_for_update(current_version: str) -> tuple[bool, str | None]:
     if latest is None:
         return False, None
 
-    # Simple version comparison (works for semver)
-    from packaging.version import Version
+    return is_newer(latest, current_version), latest
+
 
+def is_update_check_enabled() -> bool:
+    """Update checks can be disabled with ULKAN_UPDATE_CHECK=0 or
+    `update_check = false` in the user config file."""
+    return get_bool("update_check", True)
+
+
+def _read_update_cache() -> dict:
     try:
-        if Version(latest) > Version(current_version):
-            return True, latest
-    except Exception:
-        # Fallback to False if we can't compare reliably
-        return False, latest
+        data = json.loads((get_cache_dir() / UPDATE_CACHE_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_update_cache(data: dict) -> None:
+    """Atomically writes the update cache (fails silently)."""
+    cache_dir = get_cache_dir()
+    target = cache_dir / UPDATE_CACHE_FILE
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, target)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def mark_update_checked() -> None:
+    """Records the check time, keeping the cached version and validators."""
+    _write_update_cache({**_read_update_cache(), "checked_at": time.time()})
+
+
+def _start_update_check() -> None:
+    """Refreshes the update cache in a daemon thread.
+
+    At exit the thread gets UPDATE_CHECK_JOIN more seconds to store the
+    response; a slower or offline check is abandoned until the TTL expires.
+    """
+    import atexit
 
-    return False, latest
+    from .net import get_client
+
+    # Recorded here, not in the thread, so offline machines retry once per
+    # TTL instead of on every command
+    mark_update_checked()
+    # Create the shared client first: atexit runs handlers in reverse order,
+    # so it is then closed only after the join below
+    get_client()
+    thread = threading.Thread(
+        target=get_latest_version, name="ulkan-update-check", daemon=True
+    )
+    thread.start()
+    atexit.register(thread.join, UPDATE_CHECK_JOIN)
+
+
+def check_for_update_cached(current_version: str) -> tuple[bool, str | None]:
+    """
+    Checks for a newer version using the on-disk cache only.
+
+    Never waits on the network: if the cached result is older than the TTL
+    (setting `update_check_ttl`, in seconds), a daemon thread refreshes it in
+    the background (see _start_update_check) and the next invocation picks
+    up the new value.
+
+    Returns:
+        (has_update, latest_version) tuple, like `check_for_update`.
+    """
+    if not is_update_check_enabled():
+        return False, None
+
+    cached = _read_update_cache()
+    ttl = get_float("update_check_ttl", DEFAULT_UPDATE_CHECK_TTL)
+    checked_at = cached.get("checked_at", 0)
+
+    if not isinstance(checked_at, (int, float)) or time.time() - checked_at > ttl:
+        _start_update_check()
+
+    latest = cached.get("latest_version")
+    if not isinstance(latest, str):
+        return False, None
+    return is_newer(latest, current_version), latest
 
 
 def run_upgrade() -> bool:
@@ -0,0 +1,211 @@
+"""
+Filesystem watching for `ulkan sync --watch`.
+
+Uses inotify on Linux (through ctypes, no extra dependency) and falls back to
+polling file stats elsewhere. Events are debounced so a burst of writes (e.g.
+an agent generating several skills) is delivered as a single batch.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+# Directories under .agent/ whose contents end up in AGENTS.md
+WATCHED_DIRS = ["skills", "rules", "workflows", "tools", "tools/scripts"]
+
+DEFAULT_DEBOUNCE = 0.3  # seconds without events before a batch is delivered
+DEFAULT_MAX_DELAY = 3.0  # deliver a batch at the latest after this many seconds
+DEFAULT_POLL_INTERVAL = 1.0
+
+# inotify constants (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+
+def _watch_targets(agent_dir: Path) -> list[Path]:
+    """Directories to watch: .agent/, the asset dirs and each skill folder."""
+    targets = [agent_dir] + [agent_dir / d for d in WATCHED_DIRS]
+    skills_dir = agent_dir / "skills"
+    if skills_dir.is_dir():
+        targets += sorted(p for p in skills_dir.iterdir() if p.is_dir())
+    return [t for t in targets if t.is_dir()]
+
+
+class InotifyWatcher:
+    """Reports changed paths under .agent/ using Linux inotify."""
+
+    def __init__(self, agent_dir: Path):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.agent_dir = agent_dir
+        self.watches: dict[int, Path] = {}
+        self._refresh_watches()
+
+    def _refresh_watches(self) -> None:
+        """Adds watches for new directories (re-adding a watch is a no-op)."""
+        for target in _watch_targets(self.agent_dir):
+            wd = self._add_watch(self.fd, os.fsencode(target), WATCH_MASK)
+            if wd >= 0:
+                self.watches[wd] = target
+
+    def read(self, timeout: float | None) -> set[Path]:
+        """Waits up to timeout seconds and returns the changed paths."""
+        import select
+        import struct
+
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        refresh = False
+        offset = 0
+        while offset + 16 <= len(data):
+            wd, mask, _, length = struct.unpack_from("iIII", data, offset)
+            name = data[offset + 16 : offset + 16 + length].rstrip(b"\0")
+            offset += 16 + length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped: report the whole tree as changed
+                changed.add(self.agent_dir)
+                refresh = True
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            base = self.watches.get(wd)
+            if base is None:
+                continue
+            changed.add(base / os.fsdecode(name) if name else base)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                refresh = True
+
+        if refresh:
+            self._refresh_watches()
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Reports changed paths by comparing file stats at a fixed interval."""
+
+    def __init__(self, agent_dir: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        self.agent_dir = agent_dir
+        self.interval = interval
+        self.snapshot = self._snapshot()
+
+    def _snapshot(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+        for target in _watch_targets(self.agent_dir):
+            try:
+                with os.scandir(target) as it:
+                    for entry in it:
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        snapshot[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def read(self, timeout: float | None) -> set[Path]:
+        """Waits up to timeout seconds (at most one interval) for changes."""
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        snapshot = self._snapshot()
+        changed = {
+            path
+            for path in snapshot.keys() | self.snapshot.keys()
+            if snapshot.get(path) != self.snapshot.get(path)
+        }
+        self.snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(agent_dir: Path, backend: str = "auto"):
+    """Returns an InotifyWatcher on Linux, or a PollingWatcher.
+
+    Args:
+        agent_dir: The project's .agent directory
+        backend: "auto", "inotify" or "poll"
+    """
+    if backend != "poll" and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(agent_dir)
+        except (OSError, AttributeError):
+            if backend == "inotify":
+                raise
+    return PollingWatcher(agent_dir)
+
+
+def iter_changes(
+    watcher,
+    debounce: float = DEFAULT_DEBOUNCE,
+    max_delay: float = DEFAULT_MAX_DELAY,
+) -> Iterator[set[Path]]:
+    """Yields debounced batches of changed paths, forever.
+
+    A batch is delivered once no event has arrived for `debounce` seconds,
+    or `max_delay` seconds after its first event during a continuous burst.
+    """
+    while True:
+        changed = watcher.read(None)
+        if not changed:
+            continue
+        started = time.monotonic()
+        while True:
+            remaining = max_delay - (time.monotonic() - started)
+            if remaining <= 0:
+                break
+            more = watcher.read(min(debounce, remaining))
+            if not more:
+                break
+            changed |= more
+        yield changed
@@ -0,0 +1,30 @@
+from ulkan.frontmatter import parse_frontmatter_lines
+
+
+def parse(text: str) -> dict | None:
+    return parse_frontmatter_lines(text.splitlines(keepends=True))
+
+
+def test_folded_block():
+    assert parse("---\ndescription: >\n  one\n  two\n\n  three\nname: x\n---\n") == {
+        "description": "one two\nthree",
+        "name": "x",
+    }
+
+
+def test_literal_block():
+    assert parse("---\ndescription: |\n  one\n    two\n---\n") == {
+        "description": "one\n  two"
+    }
+
+
+def test_blank_block_scalar():
+    assert parse("---\ndescription: >\n\nname: x\n---\n") == {
+        "description": "",
+        "name": "x",
+    }
+    assert parse("---\ndescription: |\n\n\n---\n") == {"description": ""}
+
+
+def test_unterminated():
+    assert parse("---\nname: x\n") is None